@@ -0,0 +1,54 @@
+"""Set-up shared by the benchmark scripts.
+
+Importing this module puts the repository root on sys.path. Qt benchmarks
+call isolate_appdata() before importing app modules and qt_app() for the
+application, which runs on the offscreen platform unless QT_QPA_PLATFORM
+names another one.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def parser(doc: str) -> argparse.ArgumentParser:
+    """Argument parser described by the first line of the script's docstring."""
+    return argparse.ArgumentParser(description=doc.splitlines()[0])
+
+
+def int_list(text: str) -> List[int]:
+    """--sizes style option: "100,1000" -> [100, 1000]."""
+    return [int(x) for x in text.split(",") if x.strip()]
+
+
+def float_list(text: str) -> List[float]:
+    return [float(x) for x in text.split(",") if x.strip()]
+
+
+def isolate_appdata() -> str:
+    """Point APPDATA at a fresh directory so the user's settings, thumbnail
+    and metadata caches stay out of the measurement (before core.settings is
+    imported)."""
+    path = tempfile.mkdtemp(prefix="ytc-bench-")
+    os.environ["APPDATA"] = path
+    return path
+
+
+def qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+def show_widget(app, widget, width: int = 900, height: int = 600):
+    widget.resize(width, height)
+    widget.show()
+    app.processEvents()
+    return widget
@@ -0,0 +1,186 @@
+"""Aggregate throughput vs. the global bandwidth cap.
+
+Usage: python benchmarks/bandwidth_bench.py [--cap 20] [--items 4] [--seconds 6]
+       [--binary]
+
+A local HTTP server streams bytes to N concurrent readers that pace
+themselves through core.bandwidth exactly like the Python-API progress hook
+does. One reader is throttled by the server (a slow CDN edge) to show its
+unused share going to the others. Halfway through, the cap is halved live.
+
+--binary runs the readers through DownloadEngine's binary path instead: each
+item is a launcher process whose child does the reading, the layout of the
+onefile yt-dlp.exe, so the cap only holds if the whole tree is suspended.
+"""
+
+import http.client
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from _common import parser
+
+import core.download_engine as download_engine  # noqa: E402
+from core.bandwidth import MB, BandwidthLimiter  # noqa: E402
+from core.download_engine import DownloadEngine  # noqa: E402
+
+CHUNK = 64 * 1024
+SLOW_RATE = 1 * MB
+
+
+# Reads one URL and reports bytes in yt-dlp's structured progress format
+TREE_CHILD = r"""
+import http.client, sys
+conn = http.client.HTTPConnection("127.0.0.1", int(sys.argv[1]))
+conn.request("GET", sys.argv[2])
+resp = conn.getresponse()
+n = 0
+while True:
+    data = resp.read(65536)
+    if not data:
+        break
+    n += len(data)
+    sys.stdout.write("@D|%d|NA|NA|NA|1\n" % n)
+    sys.stdout.flush()
+"""
+# The process the engine spawns only waits for its child, like the bootloader
+LAUNCHER = (
+    "import subprocess, sys; "
+    "sys.exit(subprocess.call([sys.executable] + sys.argv[1:5]))"
+)
+
+
+class _TreeEngine(DownloadEngine):
+    port = 0
+
+    def _build_cli_args(self, url, *args, **kwargs):
+        return [sys.executable, "-c", LAUNCHER, "-c", TREE_CHILD, str(self.port), url]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        slow = self.path.startswith("/slow")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.end_headers()
+        block = b"\0" * CHUNK
+        try:
+            while True:
+                self.wfile.write(block)
+                if slow:
+                    time.sleep(CHUNK / SLOW_RATE)
+        except Exception:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+def _reader(port, path, key, limiter, stop, counts):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.request("GET", path)
+    resp = conn.getresponse()
+    while not stop.is_set():
+        data = resp.read(CHUNK)
+        if not data:
+            break
+        counts[key] += len(data)
+        delay = limiter.throttle(key, len(data))
+        if delay > 0:
+            time.sleep(delay)
+    conn.close()
+
+
+def _phase(snapshot, seconds):
+    before = snapshot()
+    t0 = time.perf_counter()
+    time.sleep(seconds)
+    elapsed = time.perf_counter() - t0
+    after = snapshot()
+    return {k: (after[k] - before[k]) / elapsed for k in after}
+
+
+def _start_threads(port, keys, limiter, stop):
+    counts = {k: 0 for k in keys}
+    for i, key in enumerate(keys):
+        path = "/slow" if i == 0 and len(keys) > 1 else "/fast"
+        limiter.start(key)
+        threading.Thread(
+            target=_reader,
+            args=(port, path, key, limiter, stop, counts),
+            daemon=True,
+        ).start()
+    return lambda: dict(counts)
+
+
+def _start_engine(port, keys, limiter):
+    download_engine.YTDLP_EXE = sys.executable  # any existing file
+    _TreeEngine.port = port
+    items = [
+        {"title": key, "webpage_url": "/slow" if i == 0 and len(keys) > 1 else "/fast"}
+        for i, key in enumerate(keys)
+    ]
+    engine = _TreeEngine(
+        items,
+        tempfile.mkdtemp(prefix="ytc-bw-"),
+        "audio",
+        "mp3",
+        max_concurrent=len(items),
+        limiter=limiter,
+        progress_hz=0,
+    )
+    threading.Thread(target=engine.run, daemon=True).start()
+    # Bytes each item's child reported so far
+    snapshot = lambda: {k: engine._bw_seen.get(i, 0) for i, k in enumerate(keys)}
+    return engine, snapshot
+
+
+def _report(label, cap, rates):
+    total = sum(rates.values())
+    per = "  ".join(f"{k}={v / MB:5.2f}" for k, v in sorted(rates.items()))
+    print(
+        f"{label:<10} cap={cap / MB:5.1f} MB/s  total={total / MB:6.2f} MB/s "
+        f"({(total - cap) / cap * 100:+5.1f}%)  {per}"
+    )
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--cap", type=float, default=20.0, help="MB/s")
+    ap.add_argument("--items", type=int, default=4)
+    ap.add_argument("--seconds", type=float, default=6.0, help="per phase")
+    ap.add_argument("--binary", action="store_true", help="engine binary path")
+    args = ap.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    cap = args.cap * MB
+    limiter = BandwidthLimiter(cap)
+    stop = threading.Event()
+    keys = [f"item{i}" for i in range(max(1, args.items))]
+    engine = None
+    if args.binary:
+        engine, snapshot = _start_engine(port, keys, limiter)
+    else:
+        snapshot = _start_threads(port, keys, limiter, stop)
+
+    time.sleep(1.5)  # let the fair shares settle
+    _report("steady", cap, _phase(snapshot, args.seconds))
+    limiter.set_limit(cap / 2)
+    time.sleep(1.5)
+    _report("halved", cap / 2, _phase(snapshot, args.seconds))
+
+    stop.set()
+    if engine is not None:
+        engine.stop()
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
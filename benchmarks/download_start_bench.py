@@ -0,0 +1,120 @@
+"""Time from Downloader.start() to the first media request, by queue length.
+
+Usage: python benchmarks/download_start_bench.py [--sizes 10,100,300]
+       [--thumb-delay 0.2] [--repeats 3]
+
+A local stub HTTP server serves every item's media file and thumbnail;
+thumbnails answer after --thumb-delay seconds, like a slow CDN. The time to
+first byte is taken when the server sees the first media request, so it
+covers everything the download thread does before fetching media. The yt-dlp
+library path is used (no binary needed); the run is stopped after the first
+media request.
+"""
+
+import http.server
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from _common import int_list, isolate_appdata, parser
+
+isolate_appdata()
+
+import core.download_engine as download_engine  # noqa: E402
+from core.yt_manager import Downloader  # noqa: E402
+
+MEDIA = b"\x00" * (256 * 1024)
+
+
+class _Stub(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    thumb_delay = 0.2
+    first_media = 0.0
+    thumb_hits = 0
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_HEAD(self):
+        self._reply(head=True)
+
+    def do_GET(self):
+        self._reply(head=False)
+
+    def _reply(self, head: bool):
+        srv = self.server
+        if self.path.startswith("/thumb/"):
+            srv.thumb_hits += 1
+            time.sleep(srv.thumb_delay)
+            body, ctype = b"\xff\xd8\xff\xd9", "image/jpeg"
+        else:
+            if not srv.first_media:
+                srv.first_media = time.perf_counter()
+            body, ctype = MEDIA, "audio/mpeg"
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            try:
+                self.wfile.write(body)
+            except OSError:
+                pass
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(srv: _Stub, n: int) -> tuple:
+    base = f"http://127.0.0.1:{srv.server_port}"
+    stamp = f"{time.monotonic_ns()}"  # fresh thumbnail URLs per run
+    items = [
+        {
+            "title": f"Item {i}",
+            "url": f"{base}/media/{stamp}-{i}.mp3",
+            "thumbnail": f"{base}/thumb/{stamp}-{i}.jpg",
+        }
+        for i in range(n)
+    ]
+    srv.first_media = 0.0
+    srv.thumb_hits = 0
+    out = tempfile.mkdtemp(prefix="ytc-bench-out-")
+    dl = Downloader(items, out, "audio", "mp3", max_concurrent=1, pipeline=False)
+    t0 = time.perf_counter()
+    dl.start()
+    while not srv.first_media and time.perf_counter() - t0 < 600:
+        time.sleep(0.001)
+    ttfb = srv.first_media - t0
+    thumbs = srv.thumb_hits
+    dl.stop()
+    dl.wait(10000)
+    return ttfb, thumbs
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--sizes", default="10,100,300")
+    ap.add_argument("--thumb-delay", type=float, default=0.2, help="seconds")
+    ap.add_argument("--repeats", type=int, default=3)
+    args = ap.parse_args()
+
+    # Measure the library path even where a yt-dlp binary is installed
+    download_engine.YTDLP_EXE = os.path.join(tempfile.gettempdir(), "no-yt-dlp.exe")
+    srv = _Stub(("127.0.0.1", 0), _Handler)
+    srv.thumb_delay = args.thumb_delay
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    for n in int_list(args.sizes):
+        runs = [_run(srv, n) for _ in range(max(1, args.repeats))]
+        ttfb = statistics.median(r[0] for r in runs)
+        print(
+            f"n={n:<5} time to first media request={ttfb * 1000:9.1f} ms  "
+            f"thumbnail requests before it={runs[-1][1]}"
+        )
+    srv.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
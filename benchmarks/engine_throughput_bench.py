@@ -0,0 +1,130 @@
+"""Download engine throughput without Qt, in one process and across several.
+
+Usage: python benchmarks/engine_throughput_bench.py [--items 16] [--lines 20000]
+       [-j 8] [--processes 1,2,4]
+
+Each item runs a child process that prints --lines of yt-dlp's structured
+progress lines as fast as it can and exits, so the batch is bound by the
+engine's reader threads (parsing, coalescing, listener calls) rather than the
+network. --processes 1 is a plain DownloadEngine; higher values run the same
+batch through ShardedDownload (spawn start-up included). Reported are wall
+time, items/s, parsed lines/s, the listener events that reached this process
+and this process's CPU time.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from _common import int_list, parser
+
+import core.download_engine as download_engine  # noqa: E402
+from core.download_engine import (  # noqa: E402
+    DownloadEngine,
+    DownloadListener,
+    ShardedDownload,
+)
+
+# Also runs in spawned workers (they re-import this module): any existing file
+# selects the binary path, whose command line _BenchEngine replaces
+download_engine.YTDLP_EXE = sys.executable
+
+EMITTER = r"""
+import sys
+lines = int(sys.argv[1])
+total = lines * 65536
+out = sys.stdout.buffer
+for i in range(1, lines + 1):
+    out.write(b"@D|%d|%d|NA|4194304.0|1\n" % (i * 65536, total))
+out.flush()
+"""
+
+
+class _BenchEngine(DownloadEngine):
+    lines = int(os.environ.get("YTC_BENCH_LINES", "20000"))
+
+    def _build_cli_args(self, *args, **kwargs):
+        return [sys.executable, "-c", EMITTER, str(self.lines)]
+
+
+class _Counter(DownloadListener):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.events = 0
+        self.ok = 0
+        self.failed = 0
+
+    def _count(self):
+        with self._lock:
+            self.events += 1
+
+    def item_progress(self, idx, percent, speed, eta):
+        self._count()
+
+    def item_status(self, idx, text):
+        self._count()
+
+    def item_stage(self, idx, stage):
+        self._count()
+
+    def item_done(self, idx, error):
+        self._count()
+        with self._lock:
+            if error is None:
+                self.ok += 1
+            else:
+                self.failed += 1
+
+
+def _run(items, base, concurrency, processes) -> tuple:
+    counter = _Counter()
+    if processes > 1:
+        engine = ShardedDownload(
+            items,
+            base,
+            "audio",
+            "mp3",
+            processes=processes,
+            max_concurrent=concurrency,
+            listener=counter,
+            engine_class=_BenchEngine,
+        )
+    else:
+        engine = _BenchEngine(
+            items, base, "audio", "mp3", max_concurrent=concurrency, listener=counter
+        )
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    engine.run()
+    wall = time.perf_counter() - t0
+    return wall, time.process_time() - cpu0, counter
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--items", type=int, default=16)
+    ap.add_argument("--lines", type=int, default=20000, help="per item")
+    ap.add_argument("-j", "--concurrency", type=int, default=8, help="total")
+    ap.add_argument("--processes", default="1,2,4", help="values to compare")
+    args = ap.parse_args()
+
+    # Spawned workers read the line count from the environment
+    os.environ["YTC_BENCH_LINES"] = str(args.lines)
+    _BenchEngine.lines = args.lines
+    base = tempfile.mkdtemp(prefix="ytc-bench-")
+    items = [{"title": f"Item {i}", "url": f"bench{i}"} for i in range(args.items)]
+    for n in int_list(args.processes):
+        wall, cpu, c = _run(items, base, args.concurrency, n)
+        lines = c.ok * args.lines
+        print(
+            f"processes={n:<2} {wall:6.2f} s  items/s={c.ok / wall:6.2f}  "
+            f"lines/s={lines / wall:9.0f}  events={c.events:<6} "
+            f"cpu here={cpu:5.2f} s  failed={c.failed}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Repeat-fetch latency of InfoFetcher with and without the metadata cache.
+
+Usage: python benchmarks/metadata_cache_bench.py [URL] [--repeats N]
+
+Needs network access and yt-dlp (binary or Python package). The cache used
+here lives in a temporary directory, so the real user cache is untouched.
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from _common import parser
+
+from PyQt6.QtCore import QCoreApplication  # noqa: E402
+
+import core.metadata_cache as mc  # noqa: E402
+from core.yt_manager import InfoFetcher  # noqa: E402
+
+DEFAULT_URL = "https://www.youtube.com/watch?v=jNQXAC9IVRw"
+
+
+def _fetch_once(url: str, use_cache: bool) -> float:
+    f = InfoFetcher(url, use_cache=use_cache)
+    t0 = time.perf_counter()
+    f.fetch()  # blocking on purpose: we time the fetch, not signal delivery
+    return time.perf_counter() - t0
+
+
+def _report(label: str, samples: list) -> None:
+    ms = [s * 1000 for s in samples]
+    print(
+        f"{label:<14} n={len(ms):<3} median={statistics.median(ms):9.1f} ms  "
+        f"min={min(ms):9.1f} ms  max={max(ms):9.1f} ms"
+    )
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("url", nargs="?", default=DEFAULT_URL)
+    ap.add_argument("--repeats", type=int, default=5)
+    args = ap.parse_args()
+
+    QCoreApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as tmp:
+        mc._default_cache = mc.MetadataCache(os.path.join(tmp, "bench.sqlite3"))
+
+        uncached = [_fetch_once(args.url, False) for _ in range(args.repeats)]
+        _report("no cache", uncached)
+
+        first = _fetch_once(args.url, True)  # cold: populates the cache
+        _report("cache (cold)", [first])
+        warm = [_fetch_once(args.url, True) for _ in range(args.repeats)]
+        _report("cache (warm)", warm)
+
+        mc._default_cache.close()
+    print(
+        f"speed-up on repeat fetch: "
+        f"{statistics.median(uncached) / max(statistics.median(warm), 1e-9):.0f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
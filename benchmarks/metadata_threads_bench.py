@@ -0,0 +1,97 @@
+"""Threads and cancel latency while many metadata fetches are in flight.
+
+Usage: python benchmarks/metadata_threads_bench.py [--batches 4] [--urls 200]
+       [--singles 50] [--latency 0.3] [--run-for 2]
+
+Starts --batches BatchInfoFetchers of --urls URLs each plus --singles
+InfoFetchers at once, like Step 1, Step 3 and the main window do during a
+large paste. Extraction is stubbed (sleeps --latency seconds), so only the
+orchestration is measured. After --run-for seconds everything is cancelled;
+reported are the peak thread count, the time until every worker finished and
+the extractions that still started after the cancel.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from _common import isolate_appdata, parser
+
+isolate_appdata()
+
+from PyQt6.QtCore import QCoreApplication  # noqa: E402
+
+import core.fetch_engine as fetch_engine  # noqa: E402
+from core.extract_worker import extraction_pool  # noqa: E402
+from core.yt_manager import BatchInfoFetcher, InfoFetcher  # noqa: E402
+
+_lock = threading.Lock()
+_started = 0
+
+
+def _stub_extract(latency: float):
+    def extract(self, use_tv_client: bool = True) -> dict:
+        global _started
+        with _lock:
+            _started += 1
+        time.sleep(latency)
+        return {"id": self.url[-11:], "title": self.url}
+
+    return extract
+
+
+def main() -> int:
+    global _started
+    ap = parser(__doc__)
+    ap.add_argument("--batches", type=int, default=4)
+    ap.add_argument("--urls", type=int, default=200)
+    ap.add_argument("--singles", type=int, default=50)
+    ap.add_argument("--latency", type=float, default=0.3, help="seconds")
+    ap.add_argument("--run-for", type=float, default=2.0, help="seconds")
+    args = ap.parse_args()
+
+    app = QCoreApplication(sys.argv[:1])
+    # Library path only: no yt-dlp binary, no warm extraction workers
+    fetch_engine.YTDLP_EXE = os.path.join(tempfile.gettempdir(), "no-yt-dlp.exe")
+    extraction_pool().configure(0)
+    fetch_engine.InfoFetch._extract_with_python_api = _stub_extract(args.latency)
+
+    base = threading.active_count()
+    workers = []
+    for b in range(args.batches):
+        urls = [
+            f"https://www.youtube.com/watch?v=b{b:02d}{i:08d}" for i in range(args.urls)
+        ]
+        workers.append(BatchInfoFetcher(urls, max_concurrent=8, min_interval=0.0))
+    for i in range(args.singles):
+        url = f"https://www.youtube.com/watch?v=s{i:010d}"
+        workers.append(InfoFetcher(url))
+    t0 = time.perf_counter()
+    for w in workers:
+        w.start()
+    peak = 0
+    while time.perf_counter() - t0 < args.run_for:
+        app.processEvents()
+        peak = max(peak, threading.active_count())
+        time.sleep(0.005)
+
+    started_at_cancel = _started
+    t1 = time.perf_counter()
+    for w in workers:
+        (w.cancel if isinstance(w, BatchInfoFetcher) else w.requestInterruption)()
+    for w in workers:
+        w.wait()
+    stop_ms = (time.perf_counter() - t1) * 1000
+    app.processEvents()
+    print(
+        f"workers={len(workers):<4} threads base={base} peak={peak:<4} "
+        f"extractions={started_at_cancel:<5} stop={stop_ms:8.1f} ms  "
+        f"started after cancel={_started - started_at_cancel}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Main-thread CPU spent on progress updates during concurrent binary downloads.
+
+Usage: python benchmarks/progress_stream_bench.py [--items 10] [--rate 2000]
+       [--seconds 5] [--hz 0,10]
+
+Each item runs a child process that prints yt-dlp's structured progress lines
+(core.progress_stream) at --rate lines/s, read by the real
+DownloadEngine._download_with_binary. The Step 4 list is connected as in the app,
+so main-thread CPU covers signal delivery plus widget updates. --hz 0 emits
+one signal per line, as the reader did before coalescing.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+
+from _common import float_list, isolate_appdata, parser, qt_app, show_widget
+
+isolate_appdata()
+
+from core.download_engine import DownloadEngine  # noqa: E402
+from core.settings import AppSettings  # noqa: E402
+from core.yt_manager import Downloader  # noqa: E402
+from features.youtube_converter.step4_downloads import (  # noqa: E402
+    Step4DownloadsWidget,
+)
+
+EMITTER = r"""
+import sys, time
+rate, seconds = float(sys.argv[1]), float(sys.argv[2])
+total = int(rate * seconds) * 65536
+out = sys.stdout.buffer
+t0 = time.perf_counter()
+for i in range(1, int(rate * seconds) + 1):
+    out.write(b"@D|%d|%d|NA|4194304.0|%d\n" % (i * 65536, total, seconds))
+    out.flush()
+    lag = t0 + i / rate - time.perf_counter()
+    if lag > 0:
+        time.sleep(lag)
+"""
+
+
+class _BenchEngine(DownloadEngine):
+    rate = 2000.0
+    seconds = 5.0
+
+    def _build_cli_args(self, *args, **kwargs):
+        return [sys.executable, "-c", EMITTER, str(self.rate), str(self.seconds)]
+
+
+class _BenchDownloader(Downloader):
+    engine_class = _BenchEngine
+
+
+def _run(app, step4, items, args, hz) -> tuple:
+    _BenchEngine.rate = args.rate
+    _BenchEngine.seconds = args.seconds
+    dl = _BenchDownloader(items, tempfile.gettempdir(), "audio", "mp3", progress_hz=hz)
+    signals = [0]
+
+    def _count(*_):
+        signals[0] += 1
+
+    dl.itemProgress.connect(step4._on_item_progress)
+    dl.itemProgress.connect(_count)
+    dl.itemStatus.connect(step4._on_item_status)
+    threads = [
+        threading.Thread(
+            target=dl.engine._download_with_binary,
+            args=(idx, "bench", "audio", "mp3", "best", False, []),
+            daemon=True,
+        )
+        for idx in range(len(items))
+    ]
+    cpu0 = time.thread_time()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    while any(t.is_alive() for t in threads):
+        app.processEvents()
+        time.sleep(0.001)
+    app.processEvents()
+    wall = time.perf_counter() - t0
+    cpu = time.thread_time() - cpu0
+    return cpu, wall, signals[0]
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--items", type=int, default=10)
+    ap.add_argument("--rate", type=float, default=2000.0, help="lines/s per item")
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--hz", default="0,10", help="progress_hz values to compare")
+    args = ap.parse_args()
+
+    app = qt_app()
+    step4 = Step4DownloadsWidget(AppSettings())
+    items = [{"title": f"Item {i}", "url": f"bench{i}"} for i in range(args.items)]
+    step4.configure({"items": items, "kind": "audio", "format": "mp3"}, AppSettings())
+    show_widget(app, step4)
+
+    for hz in float_list(args.hz):
+        cpu, wall, signals = _run(app, step4, items, args, hz)
+        label = "every line" if not hz else f"{hz:g} Hz"
+        print(
+            f"{label:<10} main-thread CPU={cpu:6.2f} s over {wall:5.2f} s "
+            f"({cpu / wall * 100:5.1f}%)  progress signals={signals}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
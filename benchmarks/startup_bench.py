@@ -0,0 +1,136 @@
+"""Time to interactive of the GUI, cold and warm, launched offscreen.
+
+Usage: python benchmarks/startup_bench.py [--runs 5] [--modes cold,warm]
+       [--timeout 60] [--phases]
+
+Each run starts `python main.py --startup-trace FILE` with
+QT_QPA_PLATFORM=offscreen and waits for the Chrome trace core.startup writes
+once the first frame is up; the app is then killed. Time to interactive runs
+from just before the launch to that first frame (the trace's t0_epoch plus
+first_frame_ms), so interpreter start-up is included.
+
+cold: a fresh APPDATA (no settings, logs or caches) and a fresh bytecode
+cache (PYTHONPYCACHEPREFIX) per run, so every module is compiled; the OS
+file cache is not dropped. warm: one APPDATA and bytecode cache for all runs,
+primed by an unmeasured launch.
+
+Reported per mode: median and p95 time to interactive; --phases adds the
+median duration of every traced phase and import group.
+"""
+
+import json
+import os
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import ROOT, parser
+
+
+def _p95(values):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+
+
+def _launch(appdata: str, pycache: str, trace: str, timeout: float) -> dict:
+    # Killed runs may leave temp files (e.g. a started ffmpeg download)
+    tmp = os.path.join(os.path.dirname(trace), "tmp")
+    os.makedirs(tmp, exist_ok=True)
+    env = dict(os.environ)
+    env.update(
+        QT_QPA_PLATFORM="offscreen",
+        APPDATA=appdata,
+        PYTHONPYCACHEPREFIX=pycache,
+        TMPDIR=tmp,
+        TEMP=tmp,
+        TMP=tmp,
+    )
+    # Warm runs need the bytecode written by earlier ones
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    launched = time.time()
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "main.py"), "--startup-trace", trace],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        # Own process group, so warm extraction workers go down with the app
+        start_new_session=os.name != "nt",
+    )
+    try:
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(trace):
+            if proc.poll() is not None:
+                raise RuntimeError(f"app exited with {proc.returncode}")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"no first frame within {timeout:g} s")
+            time.sleep(0.005)
+    finally:
+        if os.name == "nt":
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+        proc.wait()
+    with open(trace, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    os.remove(trace)
+    other = data["otherData"]
+    tti = (other["t0_epoch"] - launched) * 1000 + other["first_frame_ms"]
+    phases = {
+        f"{e['cat']} {e['name']}": e["dur"] / 1000
+        for e in data["traceEvents"]
+        if e.get("ph") == "X" and e["cat"] in ("phase", "import")
+    }
+    return {"tti": tti, "phases": phases}
+
+
+def _run_mode(mode: str, runs: int, timeout: float) -> list:
+    base = tempfile.mkdtemp(prefix=f"ytc-startup-{mode}-")
+    trace = os.path.join(base, "trace.json")
+    results = []
+    try:
+        if mode == "warm":
+            appdata = os.path.join(base, "appdata")
+            pycache = os.path.join(base, "pycache")
+            _launch(appdata, pycache, trace, timeout)  # prime, not measured
+        for i in range(runs):
+            if mode == "cold":
+                appdata = os.path.join(base, f"appdata{i}")
+                pycache = os.path.join(base, f"pycache{i}")
+            results.append(_launch(appdata, pycache, trace, timeout))
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+    return results
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--modes", default="cold,warm")
+    ap.add_argument("--timeout", type=float, default=60.0, help="seconds per run")
+    ap.add_argument("--phases", action="store_true", help="median per phase")
+    args = ap.parse_args()
+
+    for mode in (m.strip() for m in args.modes.split(",") if m.strip()):
+        if mode not in ("cold", "warm"):
+            ap.error(f"unknown mode: {mode}")
+        results = _run_mode(mode, args.runs, args.timeout)
+        tti = [r["tti"] for r in results]
+        print(
+            f"{mode:<5} runs={len(tti):<3} time to interactive "
+            f"median={statistics.median(tti):7.1f} ms  p95={_p95(tti):7.1f} ms"
+        )
+        if args.phases:
+            names = sorted({n for r in results for n in r["phases"]})
+            for name in names:
+                values = [r["phases"][name] for r in results if name in r["phases"]]
+                print(f"      {name:<36} {statistics.median(values):7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
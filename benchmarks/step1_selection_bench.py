@@ -0,0 +1,74 @@
+"""Select-all / deselect-all latency on the Step 1 playlist tab.
+
+Usage: python benchmarks/step1_selection_bench.py [--repeats N] [--sizes 1000,5000]
+
+Playlist entries are synthetic (no network); thumbnail URLs point at a
+non-routable address so only queueing cost is measured.
+"""
+
+import statistics
+import sys
+import time
+
+from _common import int_list, isolate_appdata, parser, qt_app, show_widget
+
+isolate_appdata()
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from core.settings import AppSettings  # noqa: E402
+from features.youtube_converter.step1_link import Step1LinkWidget  # noqa: E402
+
+
+def _entries(n: int) -> list:
+    return [
+        {
+            "_type": "url",
+            "ie_key": "Youtube",
+            "id": f"v{i:010d}",
+            "title": f"Benchmark video {i}",
+            "url": f"https://www.youtube.com/watch?v=v{i:010d}",
+            "thumbnails": [{"url": f"http://10.255.255.1/vi/{i}/mqdefault.jpg"}],
+        }
+        for i in range(n)
+    ]
+
+
+def _timed(app: QApplication, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    app.processEvents()  # include the repaint triggered by the change
+    return (time.perf_counter() - t0) * 1000
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--repeats", type=int, default=3)
+    ap.add_argument("--sizes", default="1000,5000,20000")
+    args = ap.parse_args()
+
+    app = qt_app()
+    w = Step1LinkWidget(AppSettings())
+    show_widget(app, w)
+    w.chk_multi.setChecked(True)
+    app.processEvents()
+
+    for n in int_list(args.sizes):
+        w._on_fetch_ok(w._active_req_id, {"_type": "playlist", "entries": _entries(n)})
+        app.processEvents()
+        sel, desel = [], []
+        for _ in range(args.repeats):
+            sel.append(_timed(app, lambda: w.chk_pl_select_all.setChecked(True)))
+            assert len(w.selected) == n
+            desel.append(_timed(app, lambda: w.chk_pl_select_all.setChecked(False)))
+            assert not w.selected
+            w._thumbs.cancel_pending()
+        print(
+            f"n={n:<6} select-all median={statistics.median(sel):8.1f} ms  "
+            f"deselect-all median={statistics.median(desel):8.1f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
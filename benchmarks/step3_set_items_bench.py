@@ -0,0 +1,62 @@
+"""Latency of Step3QualityWidget.set_items for 10/100/1000 items.
+
+Usage: python benchmarks/step3_set_items_bench.py [--repeats N]
+
+Thumbnail URLs point at a non-routable address, so any network access on the
+GUI thread would show up directly in the timings.
+"""
+
+import statistics
+import sys
+import time
+
+from _common import isolate_appdata, parser, qt_app, show_widget
+
+isolate_appdata()
+
+from core.settings import AppSettings  # noqa: E402
+from features.youtube_converter.step3_quality import Step3QualityWidget  # noqa: E402
+
+
+def _items(n: int) -> list:
+    return [
+        {
+            "id": f"vid{i:08d}",
+            "title": f"Benchmark video {i}",
+            "webpage_url": f"https://www.youtube.com/watch?v=vid{i:08d}",
+            "thumbnail": f"http://10.255.255.1/vi/{i}/mqdefault.jpg",
+            "formats": [
+                {"format_id": "140", "abr": 128, "acodec": "mp4a", "vcodec": "none"},
+                {"format_id": "137", "height": 1080, "vcodec": "avc1"},
+            ],
+        }
+        for i in range(n)
+    ]
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--repeats", type=int, default=3)
+    args = ap.parse_args()
+
+    app = qt_app()
+    w = Step3QualityWidget(AppSettings())
+    show_widget(app, w)
+
+    for n in (10, 100, 1000):
+        items = _items(n)
+        samples = []
+        for _ in range(args.repeats):
+            t0 = time.perf_counter()
+            w.set_items(list(items))
+            samples.append((time.perf_counter() - t0) * 1000)
+            app.processEvents()
+        print(
+            f"set_items n={n:<5} median={statistics.median(samples):8.1f} ms  "
+            f"max={max(samples):8.1f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
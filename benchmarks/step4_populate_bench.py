@@ -0,0 +1,92 @@
+"""Populate time and footprint of the Step 4 download list as the queue grows.
+
+Usage: python benchmarks/step4_populate_bench.py [--sizes 100,1000,5000]
+       [--repeats 3]
+
+Reports the configure() time, the widgets living under the list viewport,
+the thumbnail fetches queued and the resident memory growth (Linux only).
+Thumbnail URLs point at a non-routable address and fetches are cancelled
+after each run, so no network time is measured.
+"""
+
+import gc
+import os
+import statistics
+import sys
+import time
+
+from _common import int_list, isolate_appdata, parser, qt_app, show_widget
+
+isolate_appdata()
+
+from PyQt6.QtWidgets import QWidget  # noqa: E402
+
+from core.settings import AppSettings  # noqa: E402
+from core.thumbnails import thumbnail_service  # noqa: E402
+from features.youtube_converter.step4_downloads import (  # noqa: E402
+    Step4DownloadsWidget,
+)
+
+
+def _items(n: int) -> list:
+    return [
+        {
+            "title": f"Benchmark video {i}",
+            "webpage_url": f"https://www.youtube.com/watch?v=vid{i:08d}",
+            "thumbnail": f"http://10.255.255.1/vi/{i}/mqdefault.jpg",
+        }
+        for i in range(n)
+    ]
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return float("nan")
+
+
+def _run(app, step4, n: int) -> tuple:
+    thumbs = thumbnail_service()
+    step4.reset()
+    thumbs.cancel_pending()
+    app.processEvents()
+    gc.collect()
+    rss0 = _rss_mb()
+    t0 = time.perf_counter()
+    step4.configure(
+        {"items": _items(n), "kind": "audio", "format": "mp3"}, AppSettings()
+    )
+    elapsed = time.perf_counter() - t0
+    app.processEvents()  # deferred visible-row thumbnail requests
+    widgets = len(step4.list.viewport().findChildren(QWidget))
+    queued = len(thumbs._waiters)
+    rss = _rss_mb() - rss0
+    thumbs.cancel_pending()
+    return elapsed, widgets, queued, rss
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--sizes", default="100,1000,5000")
+    ap.add_argument("--repeats", type=int, default=3)
+    args = ap.parse_args()
+
+    app = qt_app()
+    step4 = Step4DownloadsWidget(AppSettings())
+    show_widget(app, step4)
+    for n in int_list(args.sizes):
+        runs = [_run(app, step4, n) for _ in range(max(1, args.repeats))]
+        ms = statistics.median(r[0] for r in runs) * 1000
+        _, widgets, queued, rss = runs[-1]
+        print(
+            f"n={n:<6} populate={ms:8.1f} ms  widgets={widgets:<6} "
+            f"thumb fetches={queued:<6} rss +{rss:6.1f} MB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
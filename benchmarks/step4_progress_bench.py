@@ -0,0 +1,99 @@
+"""Main-thread CPU of the Step 4 list under per-item progress traffic.
+
+Usage: python benchmarks/step4_progress_bench.py [--sizes 100,500,1000]
+       [--hz 10] [--seconds 3]
+
+Worker threads emit Downloader.itemProgress/itemStatus for every item at
+--hz, like a large batch of running downloads. "direct" delivers each signal
+to the list (queued connection, the pre-aggregation wiring); "batched" goes
+through ProgressAggregator as Step 4 does now.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+
+from _common import int_list, isolate_appdata, parser, qt_app, show_widget
+
+isolate_appdata()
+
+from core.settings import AppSettings  # noqa: E402
+from core.yt_manager import Downloader  # noqa: E402
+from features.youtube_converter.step4_downloads import (  # noqa: E402
+    Step4DownloadsWidget,
+)
+
+WORKERS = 8
+
+
+def _traffic(dl, n, hz, seconds, stop):
+    # Each worker owns a slice of the items and ticks them at hz
+    def _run(first):
+        tick = 0
+        t0 = time.perf_counter()
+        while not stop.is_set() and time.perf_counter() - t0 < seconds:
+            tick += 1
+            for idx in range(first, n, WORKERS):
+                pct = (tick * 0.7 + idx) % 100
+                dl.itemProgress.emit(idx, pct, 3.5 * 1024 * 1024, 42)
+                if tick % 10 == 0:
+                    dl.itemStatus.emit(idx, "Downloading...")
+            lag = t0 + tick / hz - time.perf_counter()
+            if lag > 0:
+                time.sleep(lag)
+
+    return [
+        threading.Thread(target=_run, args=(w,), daemon=True) for w in range(WORKERS)
+    ]
+
+
+def _measure(app, step4, n, mode, args) -> float:
+    dl = Downloader(step4.items, tempfile.gettempdir(), "audio", "mp3")
+    if mode == "direct":
+        dl.itemProgress.connect(step4._on_item_progress)
+        dl.itemStatus.connect(step4._on_item_status)
+    else:
+        step4._progress.attach(dl)
+    stop = threading.Event()
+    threads = _traffic(dl, n, args.hz, args.seconds, stop)
+    cpu0 = time.thread_time()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    while any(t.is_alive() for t in threads):
+        app.processEvents()
+        time.sleep(0.002)
+    app.processEvents()
+    step4._progress.flush()
+    step4._progress.detach()
+    wall = time.perf_counter() - t0
+    return (time.thread_time() - cpu0) / wall * 100
+
+
+def main() -> int:
+    ap = parser(__doc__)
+    ap.add_argument("--sizes", default="100,500,1000")
+    ap.add_argument("--hz", type=float, default=10.0, help="updates/s per item")
+    ap.add_argument("--seconds", type=float, default=3.0)
+    args = ap.parse_args()
+
+    app = qt_app()
+    step4 = Step4DownloadsWidget(AppSettings())
+    show_widget(app, step4)
+    for n in int_list(args.sizes):
+        items = [{"title": f"Item {i}", "url": f"bench{i}"} for i in range(n)]
+        step4.configure(
+            {"items": items, "kind": "audio", "format": "mp3"}, AppSettings()
+        )
+        app.processEvents()
+        direct = _measure(app, step4, n, "direct", args)
+        batched = _measure(app, step4, n, "batched", args)
+        print(
+            f"n={n:<5} main-thread CPU  direct={direct:5.1f}%  batched={batched:5.1f}%"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
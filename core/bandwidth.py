@@ -0,0 +1,234 @@
+"""Global download bandwidth budget shared by all running items.
+
+One cap (bytes/s) is divided across the items currently downloading. Items
+that use less than an equal share keep what they use (plus headroom) and the
+rest is split among the others (max-min fairness), so a slow server does not
+waste budget. Each item is paced on its own allocation: callers report the
+bytes they just received and get back how long to hold off.
+
+The Python-API path sleeps in its progress hook (what yt-dlp's own
+``ratelimit`` does); the binary path suspends the yt-dlp process tree for
+that long (core.process_control). Both read the allocation on every chunk, so
+changing the cap or a schedule applies to running downloads immediately.
+Where the tree cannot be suspended (Windows without a job object) the binary
+gets its share() as ``--limit-rate`` and is restarted when the share moves.
+
+Schedules override the manual cap during a time-of-day window:
+
+    {"start": "09:00", "end": "18:00", "limit_mbps": 2, "days": [0, 1, 2, 3, 4]}
+
+``end`` before ``start`` wraps past midnight; ``days`` (Mon=0) is optional;
+``limit_mbps`` 0 means unlimited during the window.
+"""
+
+from __future__ import annotations
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional
+
+MB = 1024 * 1024  # matches the MB/s shown in Step 4
+
+# Defaults
+BURST_SECONDS = 0.5  # credit an idle item may catch up on at once
+REALLOCATE_INTERVAL = 1.0  # seconds between fair-share recomputations
+HEADROOM = 1.25  # growth allowed to an item using less than its share
+MIN_SHARE = 16 * 1024  # never pace an item below this (bytes/s)
+
+
+def _minutes(hhmm: str) -> Optional[int]:
+    try:
+        h, m = str(hhmm).strip().split(":", 1)
+        h, m = int(h), int(m)
+    except Exception:
+        return None
+    if not (0 <= h <= 24 and 0 <= m < 60):
+        return None
+    return min(h * 60 + m, 24 * 60)
+
+
+def schedule_limit(schedules: List[Dict], now: Optional[datetime] = None):
+    """Cap in bytes/s from the first matching schedule; None if none match."""
+    now = now or datetime.now()
+    minute = now.hour * 60 + now.minute
+    for rule in schedules or []:
+        if not isinstance(rule, dict):
+            continue
+        start = _minutes(rule.get("start", ""))
+        end = _minutes(rule.get("end", ""))
+        if start is None or end is None:
+            continue
+        days = rule.get("days")
+        if start <= end:
+            inside = start <= minute < end
+            day = now.weekday()
+        else:
+            # Wraps midnight: the early-morning half belongs to yesterday
+            inside = minute >= start or minute < end
+            day = now.weekday() if minute >= start else (now.weekday() - 1) % 7
+        if not inside or (days and day not in days):
+            continue
+        try:
+            return max(0.0, float(rule.get("limit_mbps") or 0)) * MB
+        except Exception:
+            continue
+    return None
+
+
+class _Flow:
+    __slots__ = ("alloc", "tat", "window_bytes", "rate", "throttled")
+
+    def __init__(self):
+        self.alloc = 0.0
+        self.tat = 0.0  # time the bytes received so far are "paid" up to
+        self.window_bytes = 0
+        self.rate = 0.0  # observed bytes/s over the last window
+        self.throttled = True  # unknown demand: assume it wants a full share
+
+
+class BandwidthLimiter:
+    """Thread-safe; a cap of 0 (and no matching schedule) means unlimited."""
+
+    def __init__(self, limit_bps: float = 0.0, schedules: List[Dict] = ()):
+        self._lock = threading.Lock()
+        self._limit = max(0.0, float(limit_bps or 0))
+        self._schedules: List[Dict] = list(schedules or [])
+        self._flows: Dict[Hashable, _Flow] = {}
+        self._window_start = time.monotonic()
+        self._next_realloc = 0.0
+        self._total_bytes = 0
+
+    # ----- configuration -----
+    def configure(self, limit_bps: float, schedules: List[Dict] = ()):
+        with self._lock:
+            self._limit = max(0.0, float(limit_bps or 0))
+            self._schedules = list(schedules or [])
+            self._next_realloc = 0.0
+
+    def set_limit(self, limit_bps: float):
+        with self._lock:
+            self._limit = max(0.0, float(limit_bps or 0))
+            self._next_realloc = 0.0
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    def effective_limit(self) -> float:
+        """Cap in force right now (schedule or manual), 0 = unlimited."""
+        with self._lock:
+            return self._compute_effective()
+
+    def scheduled(self) -> bool:
+        """True while a schedule overrides the manual cap."""
+        with self._lock:
+            return schedule_limit(self._schedules) is not None
+
+    # ----- flows -----
+    def start(self, key: Hashable):
+        with self._lock:
+            self._flows.setdefault(key, _Flow())
+            self._next_realloc = 0.0
+
+    def finish(self, key: Hashable):
+        with self._lock:
+            if self._flows.pop(key, None) is not None:
+                self._next_realloc = 0.0
+
+    def allocation(self, key: Hashable) -> float:
+        with self._lock:
+            flow = self._flows.get(key)
+            return flow.alloc if flow else 0.0
+
+    def share(self, key: Hashable) -> float:
+        """Bytes/s key may use now, 0 = unlimited.
+
+        Before the first reallocation this is an equal split of the cap.
+        """
+        with self._lock:
+            cap = self._compute_effective()
+            if cap <= 0:
+                return 0.0
+            flow = self._flows.get(key)
+            if flow is not None and flow.alloc > 0:
+                return flow.alloc
+            return max(MIN_SHARE, cap / max(1, len(self._flows)))
+
+    def throttle(self, key: Hashable, nbytes: int) -> float:
+        """Account nbytes just received by key; seconds to wait before more."""
+        now = time.monotonic()
+        with self._lock:
+            self._total_bytes += max(0, int(nbytes))
+            flow = self._flows.get(key)
+            if flow is None:
+                flow = self._flows[key] = _Flow()
+                self._next_realloc = 0.0
+            flow.window_bytes += max(0, int(nbytes))
+            if now >= self._next_realloc:
+                self._reallocate(now)
+            if flow.alloc <= 0:
+                return 0.0
+            flow.tat = max(flow.tat, now - BURST_SECONDS) + nbytes / flow.alloc
+            delay = flow.tat - now
+            if delay > 0:
+                flow.throttled = True
+            return max(0.0, delay)
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes accounted since creation (for measurements)."""
+        return self._total_bytes
+
+    # ----- internals (caller holds the lock) -----
+    def _compute_effective(self) -> float:
+        scheduled = schedule_limit(self._schedules)
+        return self._limit if scheduled is None else scheduled
+
+    def _reallocate(self, now: float):
+        elapsed = now - self._window_start
+        # Forced early (cap or flow set changed): keep measuring the window
+        measured = elapsed >= REALLOCATE_INTERVAL / 2
+        if measured:
+            for flow in self._flows.values():
+                flow.rate = flow.window_bytes / elapsed
+                flow.window_bytes = 0
+            self._window_start = now
+        self._next_realloc = now + REALLOCATE_INTERVAL
+        cap = self._compute_effective()
+        if cap <= 0 or not self._flows:
+            for flow in self._flows.values():
+                flow.alloc = 0.0
+            return
+        # Water-filling: items below the fair level keep their demand
+        remaining = cap
+        pending = list(self._flows.values())
+        while pending:
+            fair = remaining / len(pending)
+            settled = [
+                f for f in pending if not f.throttled and f.rate * HEADROOM < fair
+            ]
+            if not settled:
+                break
+            for f in settled:
+                f.alloc = max(MIN_SHARE, f.rate * HEADROOM)
+                remaining -= f.alloc
+                pending.remove(f)
+        if pending:
+            fair = max(MIN_SHARE, remaining / len(pending))
+            for f in pending:
+                f.alloc = fair
+        if measured:
+            for f in self._flows.values():
+                f.throttled = False
+
+
+_default_limiter: Optional[BandwidthLimiter] = None
+_default_lock = threading.Lock()
+
+
+def bandwidth_limiter() -> BandwidthLimiter:
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = BandwidthLimiter()
+        return _default_limiter
@@ -0,0 +1,372 @@
+"""Headless batch downloads: python -m core.cli [options] [URL ...]
+
+Runs the same pipeline as Step 4 (core.download_engine) without Qt:
+format/quality selection, SponsorBlock, subtitles, concurrency, pipelined
+conversion and the bandwidth limit; --processes splits the batch across
+worker processes (core.download_engine.ShardedDownload). Defaults come from
+the app's saved settings (--ignore-settings uses the built-in defaults).
+
+One JSON object per line goes to stdout:
+
+    {"event": "start", "items": 3, "output": "...", ...}
+    {"event": "status", "index": 0, "status": "Downloading..."}
+    {"event": "progress", "index": 0, "percent": 41.2, "speed": ..., "eta": 12}
+    {"event": "stage", "index": 0, "stage": "converting"}
+    {"event": "file", "index": 0, "path": "..."}
+    {"event": "done", "index": 0, "url": "...", "ok": true, "error": null}
+    {"event": "finished", "ok": 2, "failed": 1, "stopped": false, ...}
+
+Exit codes: 0 all items done, 1 some failed, 2 bad arguments or input,
+3 no yt-dlp available, 130 interrupted (Ctrl+C stops running items; partial
+files are kept and continue on the next run).
+"""
+
+from __future__ import annotations
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import List, Optional, TextIO
+
+from core.bandwidth import MB, bandwidth_limiter
+from core.download_engine import (
+    _VALID_SB_CATEGORIES,
+    DownloadEngine,
+    DownloadListener,
+    ShardedDownload,
+)
+from core.download_journal import DownloadJournal
+from core.paths import FF_DIR, FF_EXE, YTDLP_EXE
+from core.settings import AppSettings, SettingsManager
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_NO_YTDLP = 3
+EXIT_INTERRUPTED = 130
+
+
+class JsonLinesListener(DownloadListener):
+    """Writes engine events as JSON lines; safe to call from any thread."""
+
+    def __init__(self, items: List[dict], out: TextIO, progress: bool = True):
+        self.items = items
+        self.out = out
+        self.progress = progress
+        self.ok = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields):
+        line = json.dumps({"event": event, **fields}, ensure_ascii=False)
+        with self._lock:
+            try:
+                self.out.write(line + "\n")
+                self.out.flush()
+            except (OSError, ValueError):
+                pass  # reader went away; keep downloading
+
+    def item_progress(self, idx, percent, speed, eta):
+        if self.progress:
+            self.emit(
+                "progress",
+                index=idx,
+                percent=round(percent, 1),
+                speed=speed,
+                eta=eta,
+            )
+
+    def item_status(self, idx, text):
+        if self.progress:
+            self.emit("status", index=idx, status=text)
+
+    def item_stage(self, idx, stage):
+        if self.progress:
+            self.emit("stage", index=idx, stage=stage)
+
+    def item_file_ready(self, idx, path):
+        self.emit("file", index=idx, path=path)
+
+    def item_done(self, idx, error):
+        with self._lock:
+            if error is None:
+                self.ok += 1
+            else:
+                self.failed += 1
+        url = self.items[idx].get("url")
+        self.emit("done", index=idx, url=url, ok=error is None, error=error)
+
+
+def read_urls(urls: List[str], files: List[str]) -> List[str]:
+    """URLs from arguments and files ("-" = stdin), in order, de-duplicated.
+
+    Blank lines and lines starting with "#" are skipped.
+    """
+    lines = list(urls)
+    for path in files:
+        if path == "-":
+            lines.extend(sys.stdin.read().splitlines())
+        else:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                lines.extend(f.read().splitlines())
+    seen = set()
+    out = []
+    for line in lines:
+        url = line.strip()
+        if not url or url.startswith("#") or url in seen:
+            continue
+        seen.add(url)
+        out.append(url)
+    return out
+
+
+def _parse_categories(value: str) -> List[str]:
+    cats = [c.strip() for c in value.split(",") if c.strip()]
+    bad = [c for c in cats if c not in _VALID_SB_CATEGORIES]
+    if bad:
+        valid = ", ".join(sorted(_VALID_SB_CATEGORIES))
+        raise argparse.ArgumentTypeError(
+            f"unknown SponsorBlock categories: {', '.join(bad)} (valid: {valid})"
+        )
+    return cats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(
+        prog="python -m core.cli",
+        description="Download URLs without the GUI; progress as JSON lines.",
+    )
+    ap.add_argument("urls", nargs="*", metavar="URL")
+    ap.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="file with one URL per line ('-' reads stdin); repeatable",
+    )
+    ap.add_argument("-o", "--output", help="download folder")
+    ap.add_argument("--kind", choices=("audio", "video"))
+    ap.add_argument("-f", "--format", help="e.g. mp3, m4a, mp4, webm")
+    ap.add_argument("-q", "--quality", default="best", help="e.g. 320k, 1080p")
+    sb = ap.add_mutually_exclusive_group()
+    sb.add_argument(
+        "--sponsorblock",
+        type=_parse_categories,
+        metavar="CATS",
+        help="remove these SponsorBlock categories (comma separated)",
+    )
+    sb.add_argument("--no-sponsorblock", action="store_true")
+    ap.add_argument("--subs", metavar="LANGS", help="download subtitles, e.g. en,de")
+    ap.add_argument("--auto-subs", action="store_true")
+    ap.add_argument("--embed-subs", action="store_true", help="video only")
+    ap.add_argument(
+        "-j", "--concurrency", type=int, help="items at once (0 = by CPU count)"
+    )
+    ap.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        default=1,
+        help="split the batch across N worker processes (no --journal)",
+    )
+    ap.add_argument(
+        "--no-pipeline",
+        action="store_true",
+        help="convert on the download worker instead of a separate pool",
+    )
+    ap.add_argument("--limit", type=float, metavar="MBPS", help="total MB/s (0 = off)")
+    ap.add_argument("--ffmpeg", metavar="DIR", help="folder containing ffmpeg")
+    ap.add_argument(
+        "--journal",
+        metavar="FILE",
+        help="resume file: a rerun with the same URLs skips finished items",
+    )
+    ap.add_argument("--progress-hz", type=float, help="progress lines per item/s")
+    ap.add_argument(
+        "--quiet",
+        action="store_true",
+        help="only file, done and summary lines",
+    )
+    ap.add_argument(
+        "--ignore-settings",
+        action="store_true",
+        help="use built-in defaults instead of the app's saved settings",
+    )
+    return ap
+
+
+def _items(urls: List[str], args, settings: AppSettings) -> List[dict]:
+    d = settings.defaults
+    if args.no_sponsorblock:
+        sb_cats: List[str] = []
+    elif args.sponsorblock is not None:
+        sb_cats = args.sponsorblock
+    else:
+        sb_cats = list(d.sponsorblock_categories) if d.sponsorblock_enabled else []
+    subs = args.subs
+    if subs is None and d.download_subtitles:
+        subs = d.subtitle_languages
+    extra = {
+        "sb_enabled": bool(sb_cats),
+        "sb_categories": sb_cats,
+        "download_subs": subs is not None,
+        "sub_langs": subs or "en",
+        "auto_subs": args.auto_subs or (subs is not None and d.auto_generate_subs),
+        "embed_subs": args.embed_subs or (subs is not None and d.embed_subtitles),
+    }
+    return [{"url": u, "webpage_url": u, **extra} for u in urls]
+
+
+def _ffmpeg_location(arg: Optional[str]) -> Optional[str]:
+    if arg:
+        return arg
+    # Same lookup as Step 4: the bundled copy, else whatever is on PATH
+    return FF_DIR if os.path.exists(FF_EXE) else None
+
+
+def _open_journal(
+    path: str, base: str, kind: str, fmt: str, quality: str, items: List[dict]
+) -> DownloadJournal:
+    journal = DownloadJournal.load(path)
+    if (
+        journal is not None
+        and journal.base_dir == base
+        and (journal.kind, journal.fmt, journal.quality) == (kind, fmt, quality)
+        and journal.matches(items)
+    ):
+        return journal
+    if journal is not None:
+        journal.discard()
+    return DownloadJournal.begin(base, kind, fmt, quality, items, path=path)
+
+
+def run(args, out: TextIO = sys.stdout) -> int:
+    try:
+        urls = read_urls(args.urls, args.input)
+    except OSError as e:
+        print(f"error: cannot read input: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    if not urls:
+        print("error: no URLs given", file=sys.stderr)
+        return EXIT_USAGE
+    if not os.path.exists(YTDLP_EXE) and importlib.util.find_spec("yt_dlp") is None:
+        print(
+            "error: neither the yt-dlp binary nor yt_dlp is available", file=sys.stderr
+        )
+        return EXIT_NO_YTDLP
+
+    if args.processes > 1 and args.journal:
+        print("error: --journal cannot be combined with --processes", file=sys.stderr)
+        return EXIT_USAGE
+    settings = AppSettings() if args.ignore_settings else SettingsManager().load()
+    kind = args.kind or settings.defaults.kind or "audio"
+    if args.format:
+        fmt = args.format
+    else:
+        fmt = (settings.defaults.format or "mp3") if kind == "audio" else "mp4"
+    base = os.path.abspath(args.output or settings.last_download_dir)
+    try:
+        os.makedirs(base, exist_ok=True)
+    except OSError as e:
+        print(f"error: cannot create {base}: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    dl = settings.downloads
+    concurrency = dl.max_concurrent if args.concurrency is None else args.concurrency
+    hz = dl.progress_hz if args.progress_hz is None else args.progress_hz
+    limit = dl.bandwidth_limit_mbps if args.limit is None else args.limit
+    bandwidth_limiter().configure(
+        max(0.0, float(limit or 0)) * MB, dl.bandwidth_schedules
+    )
+
+    items = _items(urls, args, settings)
+    journal = None
+    if args.journal:
+        journal = _open_journal(
+            os.path.abspath(args.journal), base, kind, fmt, args.quality, items
+        )
+    listener = JsonLinesListener(items, out, progress=not args.quiet)
+    options = dict(
+        quality=args.quality,
+        max_concurrent=concurrency,
+        pipeline=dl.pipeline_postprocessing and not args.no_pipeline,
+        progress_hz=hz,
+        listener=listener,
+    )
+    if args.processes > 1:
+        engine = ShardedDownload(
+            items,
+            base,
+            kind,
+            fmt,
+            _ffmpeg_location(args.ffmpeg),
+            processes=args.processes,
+            limit_bps=max(0.0, float(limit or 0)) * MB,
+            schedules=dl.bandwidth_schedules,
+            **options,
+        )
+    else:
+        engine = DownloadEngine(
+            items,
+            base,
+            kind,
+            fmt,
+            _ffmpeg_location(args.ffmpeg),
+            journal=journal,
+            **options,
+        )
+    listener.emit(
+        "start",
+        items=len(items),
+        output=base,
+        kind=kind,
+        format=fmt,
+        quality=args.quality,
+        concurrency=engine.max_concurrent,
+        processes=getattr(engine, "processes", 1),
+        binary=os.path.exists(YTDLP_EXE),
+        ffmpeg=engine.ffmpeg_location or shutil.which("ffmpeg"),
+    )
+
+    t0 = time.monotonic()
+    worker = threading.Thread(target=engine.run, name="cli-engine", daemon=True)
+    worker.start()
+    stopped = False
+    try:
+        while worker.is_alive():
+            worker.join(0.2)
+    except KeyboardInterrupt:
+        stopped = True
+        engine.stop()
+        worker.join()
+    if journal is not None:
+        if not stopped and listener.failed == 0:
+            journal.discard()
+        else:
+            journal.close()
+
+    listener.emit(
+        "finished",
+        ok=listener.ok,
+        failed=listener.failed,
+        stopped=stopped,
+        elapsed=round(time.monotonic() - t0, 3),
+    )
+    if stopped:
+        return EXIT_INTERRUPTED
+    return EXIT_FAILED if listener.failed else EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1407 @@
+"""Qt-free download pipeline shared by the GUI and the command line.
+
+DownloadEngine runs a batch: a bounded pool of download workers, optional
+pipelined conversion, retries, pause/resume, the write-ahead journal and the
+shared bandwidth budget. Events go to a DownloadListener on worker threads;
+core.yt_manager.Downloader forwards them as Qt signals, core.cli prints them
+as JSON lines. ShardedDownload splits a batch across worker processes.
+
+Importing this module does not import PyQt6, yt-dlp or requests; yt-dlp's
+Python API is only loaded when the bundled binary is missing.
+"""
+
+import os
+import queue
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, List, Optional, Set
+
+from core.bandwidth import BandwidthLimiter, bandwidth_limiter
+from core.download_journal import DownloadJournal
+from core.models import DownloadState
+from core.paths import YTDLP_EXE
+from core.process_control import (
+    kill_process,
+    popen_kwargs,
+    resume_process,
+    suspend_process,
+    track_process,
+    tree_control_available,
+)
+from core.progress_stream import (
+    PROGRESS_HZ,
+    PROGRESS_TEMPLATE_ARGS,
+    READ_SIZE,
+    ProgressCoalescer,
+    ProgressEvent,
+    ProgressStreamParser,
+    StageEvent,
+)
+from core.utils_url import _extract_video_id
+
+_VALID_SB_CATEGORIES = {
+    "sponsor",
+    "selfpromo",
+    "interaction",
+    "intro",
+    "outro",
+    "preview",
+    "filler",
+    "music_offtopic",
+    "exclusive_access",
+    "chapter",
+}
+
+
+# What follows "[<id>]" in names yt-dlp leaves behind for an unfinished item:
+# ".mp4.part", ".mp4.part-Frag12.part", ".mp3.ytdl", unmerged ".f140.m4a"
+# streams and ffmpeg ".temp.mp3" outputs
+_PARTIAL_SUFFIX_RE = re.compile(
+    r"^(?P<inter>\.f[\w-]+|\.temp)?\.\w+"
+    r"(?P<part>\.part(?:-Frag\d+)?(?:\.part)?|\.ytdl)?$",
+    re.IGNORECASE,
+)
+
+
+def item_video_id(it: dict) -> str:
+    it = it or {}
+    vid = str(it.get("id") or "").strip()
+    if vid:
+        return vid
+    return _extract_video_id(it.get("webpage_url") or it.get("url") or "") or ""
+
+
+def partial_files_for(base_dir: str, video_ids: List[str]) -> List[str]:
+    """Partial/intermediate files in base_dir that belong to these video IDs.
+
+    Only names built by our output template ("... [<id>].<ext>") are
+    considered, so other downloads sharing the folder are never touched.
+    """
+    tags = {f"[{v}]" for v in video_ids if v}
+    if not tags or not base_dir or not os.path.isdir(base_dir):
+        return []
+    found = []
+    try:
+        for name in os.listdir(base_dir):
+            for tag in tags:
+                if tag not in name:
+                    continue
+                m = _PARTIAL_SUFFIX_RE.match(name.rsplit(tag, 1)[1])
+                if m and (m.group("inter") or m.group("part")):
+                    path = os.path.join(base_dir, name)
+                    if os.path.isfile(path):
+                        found.append(path)
+                break
+    except Exception:
+        pass
+    return found
+
+
+def discard_partial_files(base_dir: str, video_ids: List[str]) -> int:
+    """Delete this batch's partial files; returns how many were removed."""
+    removed = 0
+    for path in partial_files_for(base_dir, video_ids):
+        try:
+            os.remove(path)
+            removed += 1
+        except Exception:
+            pass
+    return removed
+
+
+# _attempt_download error for a Python-API download aborted by pause; the
+# retry loop waits for resume and continues the .part file (no retry used)
+_PAUSED = "Paused"
+
+# --limit-rate fallback (no tree control): restart on a share that moved this
+# much, at most once per interval
+RATE_RESTART_DRIFT = 0.25
+RATE_RESTART_INTERVAL = 5.0  # seconds
+
+
+def default_concurrency() -> int:
+    """Number of items downloaded at once when the user has not picked one."""
+    cpus = os.cpu_count() or 2
+    return max(1, min(8, cpus // 2))
+
+
+def _win_no_window_kwargs():
+    if os.name != "nt":
+        return {}
+    si = subprocess.STARTUPINFO()
+    si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    si.wShowWindow = 0
+    return {"startupinfo": si, "creationflags": subprocess.CREATE_NO_WINDOW}
+
+
+def build_ydl_opts(
+    base_dir: str,
+    kind: str,
+    fmt: str,
+    ffmpeg_location: Optional[str] = None,
+    progress_hook: Optional[Callable] = None,
+    quality: Optional[str] = None,
+    sponsorblock_remove: Optional[List[str]] = None,
+    sponsorblock_api: Optional[str] = None,
+    download_subs: bool = False,
+    sub_langs: str = "en",
+    auto_subs: bool = False,
+    embed_subs: bool = False,
+):
+    from core.http_client import HTTP_HEADERS
+
+    outtmpl = os.path.join(base_dir, "%(title).200s [%(id)s].%(ext)s")
+    postprocessors = []
+    q = (quality or "best").lower()
+
+    def _parse_height(qv: str) -> Optional[int]:
+        try:
+            return int(qv.rstrip("p"))
+        except Exception:
+            return None
+
+    def _parse_abr(qa: str) -> Optional[int]:
+        try:
+            return int(qa.rstrip("k"))
+        except Exception:
+            return None
+
+    if kind == "audio":
+        postprocessors.append(
+            {
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": fmt,
+                "preferredquality": "0",
+            }
+        )
+        if q != "best":
+            abr = _parse_abr(q) or 0
+            format_selector = f"bestaudio[abr>={abr}]/bestaudio/best"
+        else:
+            format_selector = "bestaudio/best"
+        merge_out = None
+    else:
+        height = _parse_height(q) if q != "best" else None
+        if fmt.lower() == "mp4":
+            if height:
+                format_selector = (
+                    f"bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/"
+                    f"best[height<={height}][ext=mp4]/best[ext=mp4]/best"
+                )
+            else:
+                format_selector = (
+                    "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
+                )
+        else:
+            if height:
+                format_selector = (
+                    f"bestvideo[height<={height}]+bestaudio/best[height<={height}]/best"
+                )
+            else:
+                format_selector = "bestvideo+bestaudio/best"
+        merge_out = fmt
+
+    opts = {
+        "outtmpl": outtmpl,
+        "format": format_selector,
+        "noprogress": True,
+        "quiet": True,
+        "nocheckcertificate": True,
+        "merge_output_format": merge_out,
+        "postprocessors": postprocessors,
+        "ffmpeg_location": ffmpeg_location or None,
+        "noplaylist": False,
+        # Resume .part files left by a stopped/interrupted run
+        "continuedl": True,
+        "retries": 10,
+        "fragment_retries": 10,
+        "socket_timeout": 15,
+        "extractor_retries": 2,
+        "skip_unavailable_fragments": True,
+        "cachedir": False,
+        "http_headers": HTTP_HEADERS,
+        "extractor_args": {"youtube": {"player_client": ["tv"]}},
+    }
+    if progress_hook:
+        opts["progress_hooks"] = [progress_hook]
+
+    # Pass SponsorBlock via yt-dlp native options (CLI-equivalent)
+    sb_cats_list: List[str] = []
+    if sponsorblock_remove:
+        try:
+            sb_cats_list = [
+                str(c).strip() for c in sponsorblock_remove if str(c).strip()
+            ]
+        except Exception:
+            sb_cats_list = list(sponsorblock_remove)
+    # sanitize to known categories
+    if sb_cats_list:
+        sb_cats_list = [c for c in sb_cats_list if c in _VALID_SB_CATEGORIES]
+
+    # Allow SponsorBlock for audio and video in Python fallback
+    if sb_cats_list:
+        opts["sponsorblock_remove"] = ",".join(sb_cats_list)
+        if sponsorblock_api:
+            opts["sponsorblock_api"] = sponsorblock_api
+    # Debug: SponsorBlock remove set (disabled in production)
+    # print(f"SponsorBlock remove set to: {opts['sponsorblock_remove']}")
+
+    # Subtitle configuration
+    if download_subs:
+        opts["writesubtitles"] = True
+        opts["writeautomaticsub"] = auto_subs
+        # Parse language codes
+        lang_list = [lang.strip() for lang in sub_langs.split(",") if lang.strip()]
+        if lang_list:
+            opts["subtitleslangs"] = lang_list
+        else:
+            opts["subtitleslangs"] = ["en"]
+
+        # Embed subtitles for video only
+        if kind == "video" and embed_subs:
+            # Add subtitle embedding post-processor
+            postprocessors.append(
+                {"key": "FFmpegEmbedSubtitle", "already_have_subtitle": False}
+            )
+            opts["postprocessors"] = postprocessors
+
+    return opts
+
+
+class DownloadListener:
+    """Receives engine events on worker threads; the defaults ignore them."""
+
+    def item_progress(
+        self, idx: int, percent: float, speed: Optional[float], eta: Optional[int]
+    ) -> None:
+        # speed/eta are None while yt-dlp is still estimating
+        pass
+
+    def item_status(self, idx: int, text: str) -> None:
+        pass
+
+    # "downloading" | "converting"
+    def item_stage(self, idx: int, stage: str) -> None:
+        pass
+
+    def item_file_ready(self, idx: int, path: str) -> None:
+        pass
+
+    # Final outcome of one item; error is None on success
+    def item_done(self, idx: int, error: Optional[str]) -> None:
+        pass
+
+    def retry_limit_reached(self, message: str) -> None:
+        pass
+
+    # Not called when the batch was stopped
+    def finished_all(self) -> None:
+        pass
+
+
+class DownloadEngine:
+    """One batch of downloads; run() blocks until every item is done or the
+    batch was stopped. pause/resume/stop may be called from any thread."""
+
+    def __init__(
+        self,
+        items: List[dict],
+        base_dir: str,
+        kind: str,
+        fmt: str,
+        ffmpeg_location: Optional[str] = None,
+        quality: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+        pipeline: bool = False,
+        max_postprocess: Optional[int] = None,
+        journal: Optional[DownloadJournal] = None,
+        limiter: Optional[BandwidthLimiter] = None,
+        progress_hz: Optional[float] = None,
+        listener: Optional[DownloadListener] = None,
+    ):
+        self.listener = listener or DownloadListener()
+        self.items = items
+        self.base_dir = base_dir
+        self.kind = kind
+        self.fmt = fmt
+        self.ffmpeg_location = ffmpeg_location
+        self.quality = quality or "best"
+        self._pause_evt = Event()
+        self._pause_evt.set()
+        self._stop = False
+        self._dl_filename: Dict[int, str] = {}
+        self.max_retries = 3
+        # 0/None means "pick for me" based on the machine
+        self.max_concurrent = int(max_concurrent or 0) or default_concurrency()
+        self._state_lock = Lock()
+        self._finished_items: Set[int] = set()
+        # Pipelined mode: the download pool only fetches streams; ffmpeg work
+        # (extract audio, SponsorBlock cutting, subtitle embedding) runs on a
+        # separate pool sized to the CPU so the network never waits on it
+        self.pipeline = bool(pipeline)
+        self.max_postprocess = int(max_postprocess or 0) or (os.cpu_count() or 2)
+        self._post_pool: Optional[ThreadPoolExecutor] = None
+        self._work_dir: Optional[str] = None
+        # Write-ahead queue journal (resume after crash/restart); optional
+        self.journal = journal
+        self._output_files: Dict[int, str] = {}
+        # Running yt-dlp binaries per item (suspended while paused)
+        self._procs: Dict[int, subprocess.Popen] = {}
+        self._paused_items: Set[int] = set()
+        # Shared bandwidth budget; bytes seen per item turn into pacing delays
+        self.limiter = limiter or bandwidth_limiter()
+        self._bw_seen: Dict[int, float] = {}
+        # Progress signals per item are capped to a UI frame rate
+        hz = PROGRESS_HZ if progress_hz is None else progress_hz
+        self._progress = ProgressCoalescer(hz)
+
+    def _unfinished_indices(self) -> List[int]:
+        with self._state_lock:
+            done = set(self._finished_items)
+        return [idx for idx in range(len(self.items)) if idx not in done]
+
+    def _is_item_paused(self, idx: int) -> bool:
+        return not self._pause_evt.is_set() or idx in self._paused_items
+
+    def _set_suspended(self, idx: int, suspended: bool):
+        with self._state_lock:
+            proc = self._procs.get(idx)
+        if proc is not None:
+            if suspended:
+                self._suspend_or_kill(proc)
+            else:
+                resume_process(proc)
+
+    @staticmethod
+    def _suspend_or_kill(proc: subprocess.Popen):
+        # Without control over the whole tree (no Windows job) a suspended
+        # bootloader would leave the download running: end it instead, the
+        # retry loop waits for resume and yt-dlp continues the .part file
+        if not suspend_process(proc) and proc.poll() is None:
+            kill_process(proc)
+
+    def pause(self):
+        self._pause_evt.clear()
+        for idx in self._unfinished_indices():
+            self._set_suspended(idx, True)
+            self.listener.item_status(idx, "Paused")
+
+    def resume(self):
+        self._pause_evt.set()
+        for idx in self._unfinished_indices():
+            if idx in self._paused_items:
+                continue  # paused individually; stays paused
+            self._set_suspended(idx, False)
+            self.listener.item_status(idx, "Resuming...")
+
+    def is_paused(self) -> bool:
+        return not self._pause_evt.is_set()
+
+    def pause_item(self, idx: int):
+        with self._state_lock:
+            if idx in self._finished_items:
+                return
+            self._paused_items.add(idx)
+        self._set_suspended(idx, True)
+        self.listener.item_status(idx, "Paused")
+
+    def resume_item(self, idx: int):
+        with self._state_lock:
+            self._paused_items.discard(idx)
+        if self._pause_evt.is_set():
+            self._set_suspended(idx, False)
+            self.listener.item_status(idx, "Resuming...")
+
+    def is_item_paused(self, idx: int) -> bool:
+        return idx in self._paused_items
+
+    def stop(self):
+        # Partial files are kept so the next run continues at the byte offset;
+        # discard_partial_files() removes them on explicit request
+        self._stop = True
+        with self._state_lock:
+            procs = list(self._procs.values())
+        for proc in procs:
+            kill_process(proc)  # also reaches suspended processes
+
+    def _emit_progress(self, idx: int, ev: ProgressEvent):
+        ev = self._progress.offer(idx, ev)
+        if ev is not None:
+            self.listener.item_progress(idx, ev.percent, ev.speed, ev.eta)
+
+    def _flush_progress(self, idx: int):
+        ev = self._progress.flush(idx)
+        if ev is not None:
+            self.listener.item_progress(idx, ev.percent, ev.speed, ev.eta)
+
+    def _bw_key(self, idx: int) -> tuple:
+        return (id(self), idx)
+
+    def _bandwidth_delay(self, idx: int, downloaded: float) -> float:
+        """Seconds item idx must wait to stay within its bandwidth share."""
+        last = self._bw_seen.get(idx, 0.0)
+        # Counter restarts for each stream (video, then audio)
+        delta = downloaded - last if downloaded >= last else downloaded
+        self._bw_seen[idx] = downloaded
+        if delta <= 0:
+            return 0.0
+        return self.limiter.throttle(self._bw_key(idx), int(delta))
+
+    def _sleep_throttled(self, idx: int, delay: float):
+        end = time.monotonic() + delay
+        while not self._stop and not self._is_item_paused(idx):
+            left = end - time.monotonic()
+            if left <= 0:
+                return
+            time.sleep(min(0.05, left))
+
+    def _fallback_rate(self, idx: int) -> float:
+        # Without tree control (Windows, no job object) suspending only holds
+        # the onefile bootloader: yt-dlp paces itself on its share instead
+        if tree_control_available():
+            return 0.0
+        return self.limiter.share(self._bw_key(idx))
+
+    def _fallback_rate_moved(self, idx: int, rate: float, started: float) -> bool:
+        """True when the share passed as --limit-rate is stale enough to
+        restart the binary on the new one (it continues the .part file)."""
+        if time.monotonic() - started < RATE_RESTART_INTERVAL:
+            return False
+        share = self.limiter.share(self._bw_key(idx))
+        if share <= 0:
+            return True  # cap lifted
+        return abs(share - rate) > rate * RATE_RESTART_DRIFT
+
+    def _hold_process(self, idx: int, proc: subprocess.Popen, delay: float):
+        # Pace the binary on its share: keep it stopped until its bytes are
+        # paid for (the kernel stops acking, so the sender slows down too)
+        if delay <= 0.01 or not suspend_process(proc):
+            return
+        self._sleep_throttled(idx, delay)
+        with self._state_lock:
+            if not self._stop and not self._is_item_paused(idx):
+                resume_process(proc)
+
+    def _hook_builder(self, idx: int, stage: str = "full"):
+        converting = [stage == "post"]
+
+        from yt_dlp.utils import DownloadError
+
+        def hook(d):
+            if self._stop:
+                raise DownloadError("Stopped by user")
+            status = d.get("status")
+            if status == "downloading" and self._is_item_paused(idx):
+                # Blocking here would stall the socket until the server drops
+                # it; abort instead and continue the .part file on resume
+                raise DownloadError(_PAUSED)
+            try:
+                fn = d.get("filename") or (d.get("info_dict") or {}).get("_filename")
+                if fn:
+                    self._dl_filename[idx] = fn
+            except Exception:
+                pass
+            if status == "downloading":
+                total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
+                downloaded = d.get("downloaded_bytes") or 0
+                ev = ProgressEvent(downloaded, total, d.get("speed"), d.get("eta"))
+                self._emit_progress(idx, ev)
+                if self.journal is not None:
+                    self.journal.progress(idx, downloaded, total)
+                # Same pacing yt-dlp's own ratelimit does, on the shared budget
+                delay = self._bandwidth_delay(idx, downloaded)
+                if delay > 0:
+                    self._sleep_throttled(idx, delay)
+            elif status == "finished":
+                if stage != "download":
+                    self.listener.item_status(idx, "Processing...")
+            elif status == "postprocessing":
+                if stage != "download" and not converting[0]:
+                    converting[0] = True
+                    self.listener.item_stage(idx, "converting")
+                # Be explicit about which PP is running
+                pp = (d.get("postprocessor") or "").lower()
+                if "sponsorblock" in pp:
+                    self.listener.item_status(idx, "Removing segments…")
+                elif "extractaudio" in pp or "ffmpegextractaudio" in pp:
+                    self.listener.item_status(idx, "Converting audio…")
+                elif "merge" in pp or "remux" in pp:
+                    self.listener.item_status(idx, "Merging…")
+                else:
+                    self.listener.item_status(idx, "Processing…")
+
+        return hook
+
+    # Find the final output file after yt-dlp finishes (accounts for postprocessors)
+    def _resolve_output_file(self, idx: int, kind: str, fmt: str) -> str | None:
+        try:
+            p = self._dl_filename.get(idx)
+            if p and os.path.exists(p):
+                return p
+            # URL-only items (command line) carry no "id" yet
+            vid = item_video_id(self.items[idx])
+            if not vid:
+                return p
+            import glob
+
+            candidates = glob.glob(os.path.join(self.base_dir, f"*[{vid}].*"))
+            if not candidates:
+                # small delay in case filesystem is slow to update
+                time.sleep(0.05)
+                candidates = glob.glob(os.path.join(self.base_dir, f"*[{vid}].*"))
+            if not candidates:
+                return p
+            # Prefer target format when possible
+            if kind == "audio" and fmt:
+                pref = [c for c in candidates if c.lower().endswith(f".{fmt.lower()}")]
+                if pref:
+                    return max(pref, key=lambda fp: os.path.getmtime(fp))
+            if kind == "video" and fmt:
+                pref = [c for c in candidates if c.lower().endswith(f".{fmt.lower()}")]
+                if pref:
+                    return max(pref, key=lambda fp: os.path.getmtime(fp))
+            return max(candidates, key=lambda fp: os.path.getmtime(fp))
+        except Exception:
+            return self._dl_filename.get(idx)
+
+    def _existing_output_file(self, idx: int, kind: str, fmt: str) -> str | None:
+        try:
+            vid = item_video_id(self.items[idx])
+            if not vid:
+                return None
+            import glob
+
+            candidates = glob.glob(os.path.join(self.base_dir, f"*[{vid}].*"))
+            if not candidates:
+                return None
+            valid = [
+                c
+                for c in candidates
+                if not c.lower().endswith((".part", ".ytdl", ".temp", ".tmp"))
+            ]
+            if not valid:
+                return None
+            if kind == "audio" and fmt:
+                pref = [c for c in valid if c.lower().endswith(f".{fmt.lower()}")]
+                if pref:
+                    return max(pref, key=lambda fp: os.path.getmtime(fp))
+            if kind == "video" and fmt:
+                pref = [c for c in valid if c.lower().endswith(f".{fmt.lower()}")]
+                if pref:
+                    return max(pref, key=lambda fp: os.path.getmtime(fp))
+            return max(valid, key=lambda fp: os.path.getmtime(fp))
+        except Exception:
+            return None
+
+    # Build CLI args for yt-dlp binary to mirror Python options
+    def _build_cli_args(
+        self,
+        url: str,
+        kind: str,
+        fmt: str,
+        quality: str,
+        base_dir: str,
+        ffmpeg_location: Optional[str],
+        sb_enabled: bool,
+        sb_cats: List[str],
+        download_subs: bool = False,
+        sub_langs: str = "en",
+        auto_subs: bool = False,
+        embed_subs: bool = False,
+        stage: str = "full",
+        info_json: Optional[str] = None,
+    ) -> List[str]:
+        # stage: "full" = single pass, "download" = fetch streams and write the
+        # info JSON only, "post" = replay that info JSON to run the ffmpeg steps
+        outtmpl = os.path.join(base_dir, "%(title).200s [%(id)s].%(ext)s")
+        args = [
+            YTDLP_EXE,
+            "--ignore-config",
+            "--no-warnings",
+            "--newline",
+            "--no-cache-dir",
+            # Resume .part files left by a stopped/interrupted run
+            "--continue",
+            "-o",
+            outtmpl,
+        ]
+        if stage == "download" and info_json:
+            # yt-dlp appends ".info.json" itself; escape % for the template
+            base = info_json[: -len(".info.json")].replace("%", "%%")
+            args += ["--write-info-json", "-o", f"infojson:{base}"]
+
+        # Format selection based on kind/quality
+        q = (quality or "best").lower()
+        if kind == "audio":
+            # Prefer higher ABR if specified
+            if q != "best":
+                try:
+                    abr = int(q.rstrip("k"))
+                except Exception:
+                    abr = 0
+                fsel = f"bestaudio[abr>={abr}]/bestaudio/best"
+            else:
+                fsel = "bestaudio/best"
+            args += ["-f", fsel]
+            if stage != "download":
+                args += ["-x", "--audio-format", fmt]
+        else:
+            # video
+            def _video_selector(height: Optional[int], ext: Optional[str]) -> str:
+                if ext == "mp4":
+                    if height:
+                        return (
+                            f"bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/"
+                            f"best[height<={height}][ext=mp4]/best[ext=mp4]/best"
+                        )
+                    return "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
+                else:
+                    if height:
+                        return (
+                            f"bestvideo[height<={height}]+bestaudio/"
+                            f"best[height<={height}]/best"
+                        )
+                    return "bestvideo+bestaudio/best"
+
+            height = (
+                None
+                if q == "best"
+                else (
+                    int(q.rstrip("p")) if q.endswith("p") and q[:-1].isdigit() else None
+                )
+            )
+            fsel = _video_selector(height, fmt.lower())
+            # Merging is a stream copy, so it stays with the download stage
+            args += ["-f", fsel, "--merge-output-format", fmt]
+
+        # SponsorBlock for both audio and video; also mark chapters to ensure cutting works
+        if sb_enabled and stage != "download":
+            cats = [c for c in (sb_cats or []) if c in _VALID_SB_CATEGORIES]
+            args += ["--sponsorblock-mark", "all"]
+            if cats:
+                args += ["--sponsorblock-remove", ",".join(cats)]
+
+        # FFmpeg location (if provided)
+        if ffmpeg_location:
+            args += ["--ffmpeg-location", ffmpeg_location]
+
+        # Subtitle configuration
+        if download_subs:
+            args.append("--write-subs")
+            if auto_subs:
+                args.append("--write-auto-subs")
+            # Language codes
+            lang_list = [lang.strip() for lang in sub_langs.split(",") if lang.strip()]
+            if lang_list:
+                args += ["--sub-langs", ",".join(lang_list)]
+            else:
+                args += ["--sub-langs", "en"]
+
+            # Embed subtitles for video only
+            if kind == "video" and embed_subs and stage != "download":
+                args.append("--embed-subs")
+
+        # Structured progress/stage lines (core.progress_stream)
+        args += PROGRESS_TEMPLATE_ARGS
+
+        if stage == "post" and info_json:
+            args += ["--load-info-json", info_json]
+        else:
+            args.append(url)
+        return args
+
+    # Download using the yt-dlp binary (preferred for SponsorBlock correctness)
+    def _download_with_binary(
+        self,
+        idx: int,
+        url: str,
+        kind: str,
+        fmt: str,
+        qual: str,
+        sb_enabled: bool,
+        sb_cats: List[str],
+        download_subs: bool = False,
+        sub_langs: str = "en",
+        auto_subs: bool = False,
+        embed_subs: bool = False,
+        stage: str = "full",
+        info_json: Optional[str] = None,
+    ) -> tuple[bool, Optional[str]]:
+        proc = None
+        try:
+            args = self._build_cli_args(
+                url,
+                kind,
+                fmt,
+                qual,
+                self.base_dir,
+                self.ffmpeg_location,
+                sb_enabled,
+                sb_cats,
+                download_subs,
+                sub_langs,
+                auto_subs,
+                embed_subs,
+                stage=stage,
+                info_json=info_json,
+            )
+            rate = self._fallback_rate(idx)
+            if rate > 0:
+                args += ["--limit-rate", str(int(rate))]
+            kwargs = popen_kwargs(_win_no_window_kwargs())
+            # Disable third-party plugins for stability
+            env = os.environ.copy()
+            env["YTDLP_NO_PLUGINS"] = "1"
+            proc = subprocess.Popen(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,  # raw pipe: each read returns what is available
+                env=env,
+                **kwargs,
+            )
+            track_process(proc)
+            started = time.monotonic()
+            restarting = False
+            with self._state_lock:
+                self._procs[idx] = proc
+            if self._is_item_paused(idx):
+                # Paused before the process started: hold it right away
+                self._suspend_or_kill(proc)
+            elif stage == "post":
+                self.listener.item_status(idx, "Converting…")
+            else:
+                self.listener.item_status(idx, "Downloading...")
+            converting = stage == "post"
+            error_text = None
+            parser = ProgressStreamParser()
+            while True:
+                chunk = proc.stdout.read(READ_SIZE) if proc.stdout else b""
+                if self._stop:
+                    kill_process(proc)
+                    self.listener.item_status(idx, "Stopped")
+                    return False, "Stopped"
+                events = parser.feed(chunk) if chunk else parser.close()
+                # A suspended process writes nothing; lines buffered before the
+                # pause must not overwrite the "Paused" status
+                paused = self._is_item_paused(idx)
+                for ev in events:
+                    if isinstance(ev, ProgressEvent):
+                        if self.journal is not None:
+                            self.journal.progress(idx, ev.downloaded, ev.total)
+                        delay = self._bandwidth_delay(idx, ev.downloaded)
+                        if rate <= 0:
+                            self._hold_process(idx, proc, delay)
+                        elif not restarting and self._fallback_rate_moved(
+                            idx, rate, started
+                        ):
+                            restarting = True
+                            kill_process(proc)
+                        if not paused:
+                            self._emit_progress(idx, ev)
+                    elif isinstance(ev, StageEvent):
+                        label = ev.label
+                        if not label or paused:
+                            continue
+                        self._flush_progress(idx)
+                        if not converting and stage != "download":
+                            converting = True
+                            self.listener.item_stage(idx, "converting")
+                        self.listener.item_status(idx, label)
+                    else:
+                        error_text = ev.message
+                if not chunk:
+                    break
+
+            code = proc.wait()
+            if self._stop:
+                self.listener.item_status(idx, "Stopped")
+                return False, "Stopped"
+            if code != 0 and (restarting or self._is_item_paused(idx)):
+                # Ended by _suspend_or_kill or for a new --limit-rate: the
+                # caller runs it again without using up a retry
+                return False, _PAUSED
+            if code != 0:
+                err = error_text or f"yt-dlp failed (code {code})"
+                self.listener.item_status(idx, f"Error: {err}")
+                return False, err
+
+            if not self._stop:
+                self.listener.item_progress(idx, 100.0, 0.0, 0)
+                if stage == "download":
+                    self.listener.item_status(idx, "Waiting to convert…")
+                else:
+                    self.listener.item_status(idx, "Done")
+            return True, None
+        except Exception as e:
+            self.listener.item_status(idx, f"Error: {e}")
+            return False, str(e)
+        finally:
+            with self._state_lock:
+                if self._procs.get(idx) is proc:
+                    del self._procs[idx]
+
+    def _attempt_download(
+        self,
+        idx: int,
+        url: str,
+        kind: str,
+        fmt: str,
+        qual: str,
+        sb_enabled: bool,
+        sb_cats: List[str],
+        download_subs: bool = False,
+        sub_langs: str = "en",
+        auto_subs: bool = False,
+        embed_subs: bool = False,
+        stage: str = "full",
+        info_json: Optional[str] = None,
+    ) -> tuple[bool, Optional[str]]:
+        last_error: Optional[str] = None
+        binary_exists = os.path.exists(YTDLP_EXE)
+
+        if binary_exists:
+            ok, err = self._download_with_binary(
+                idx,
+                url,
+                kind,
+                fmt,
+                qual,
+                sb_enabled,
+                sb_cats,
+                download_subs,
+                sub_langs,
+                auto_subs,
+                embed_subs,
+                stage=stage,
+                info_json=info_json,
+            )
+            if ok:
+                if stage != "download":
+                    self._announce_output(idx, kind, fmt)
+                return True, None
+            last_error = err
+            if self._stop:
+                return False, err or "Stopped"
+            if err == _PAUSED:
+                return False, _PAUSED
+
+        opts = build_ydl_opts(
+            self.base_dir,
+            kind,
+            fmt,
+            self.ffmpeg_location,
+            self._hook_builder(idx, stage),
+            qual,
+            sponsorblock_remove=(
+                sb_cats if sb_enabled and sb_cats and stage != "download" else None
+            ),
+            sponsorblock_api=("https://sponsor.ajay.app" if sb_enabled else None),
+            download_subs=download_subs,
+            sub_langs=sub_langs,
+            auto_subs=auto_subs,
+            embed_subs=embed_subs and stage != "download",
+        )
+        if stage == "download":
+            # Raw streams only (merging is handled by merge_output_format)
+            opts["postprocessors"] = []
+            if info_json:
+                opts["writeinfojson"] = True
+                opts["outtmpl"] = {
+                    "default": opts["outtmpl"],
+                    "infojson": info_json[: -len(".info.json")].replace("%", "%%"),
+                }
+        try:
+            import yt_dlp
+
+            with yt_dlp.YoutubeDL(opts) as ydl:
+                if stage == "post" and info_json:
+                    self.listener.item_status(idx, "Converting…")
+                    ydl.download_with_info_file(info_json)
+                else:
+                    ydl.download([url])
+            if not self._stop:
+                self.listener.item_progress(idx, 100.0, 0.0, 0)
+                if stage == "download":
+                    self.listener.item_status(idx, "Waiting to convert…")
+                else:
+                    self.listener.item_status(idx, "Done")
+                    self._announce_output(idx, kind, fmt)
+            return True, None
+        except Exception as e:
+            err = str(e) or last_error or "Unknown error"
+            if self._stop:
+                self.listener.item_status(idx, "Stopped")
+                return False, "Stopped"
+            if self._is_item_paused(idx):
+                return False, _PAUSED
+            self.listener.item_status(idx, f"Error: {err}")
+            return False, err
+
+    def _announce_output(self, idx: int, kind: str, fmt: str):
+        try:
+            fp = self._resolve_output_file(idx, kind, fmt)
+            if fp:
+                self._output_files[idx] = fp
+                self.listener.item_file_ready(idx, fp)
+        except Exception:
+            pass
+
+    def _journal_mark(self, idx: int, state: DownloadState, **fields):
+        if self.journal is not None:
+            self.journal.mark(idx, state, **fields)
+
+    def _wait_if_paused(self, idx: Optional[int] = None) -> bool:
+        """Block while paused (globally or idx); False if stopped meanwhile."""
+        while True:
+            if self._stop:
+                return False
+            if not self._pause_evt.wait(0.2):
+                continue
+            if idx is None or idx not in self._paused_items:
+                return not self._stop
+            time.sleep(0.2)
+
+    def _mark_finished(self, idx: int):
+        with self._state_lock:
+            self._finished_items.add(idx)
+
+    def _report_failure(self, idx: int, it: dict, err_text: str):
+        self.listener.item_status(idx, f"Failed: {err_text}")
+        self.listener.item_done(idx, err_text)
+        try:
+            title = (it or {}).get("title") or "This download"
+            self.listener.retry_limit_reached(
+                f"{title} failed after {self.max_retries} retries.\nError: {err_text}"
+            )
+        except Exception:
+            pass
+
+    def _info_json_path(self, idx: int) -> str:
+        with self._state_lock:
+            if not self._work_dir:
+                if self.journal is not None:
+                    # Kept across restarts so a converted-later item can resume
+                    self._work_dir = self.journal.work_dir
+                    os.makedirs(self._work_dir, exist_ok=True)
+                else:
+                    self._work_dir = tempfile.mkdtemp(prefix="ytconverter-")
+            return os.path.join(self._work_dir, f"item{idx}.info.json")
+
+    # One queue entry: resolve per-item options, then run the retry loop
+    def _process_item(self, idx: int, it: dict):
+        handed_off = False
+        try:
+            if not self._wait_if_paused(idx):
+                return
+            url = it.get("webpage_url") or it.get("url")
+            if not url:
+                self.listener.item_status(idx, "Invalid URL")
+                self.listener.item_done(idx, "Invalid URL")
+                return
+            kind = (it.get("desired_kind") or self.kind or "audio").strip()
+            fmt = (
+                it.get("desired_format")
+                or self.fmt
+                or ("mp3" if kind == "audio" else "mp4")
+            ).strip()
+            qual = (it.get("desired_quality") or self.quality or "best").strip()
+
+            # SponsorBlock settings
+            sb_enabled = bool(it.get("sb_enabled"))
+            sb_cats = [
+                c for c in (it.get("sb_categories") or []) if c in _VALID_SB_CATEGORIES
+            ]
+
+            # Subtitle settings
+            download_subs = bool(it.get("download_subs", False))
+            sub_langs = str(it.get("sub_langs", "en"))
+            auto_subs = bool(it.get("auto_subs", False))
+            embed_subs = bool(it.get("embed_subs", False))
+
+            job = (
+                url,
+                kind,
+                fmt,
+                qual,
+                sb_enabled,
+                sb_cats,
+                download_subs,
+                sub_langs,
+                auto_subs,
+                embed_subs,
+            )
+            stage = "download" if self.pipeline else "full"
+            info_json = self._info_json_path(idx) if self.pipeline else None
+
+            resumed = self.journal.state(idx) if self.journal is not None else None
+            if (
+                resumed is not None
+                and resumed.state
+                in (DownloadState.DOWNLOADED, DownloadState.CONVERTING)
+                and self.pipeline
+                and self._post_pool is not None
+                and info_json
+                and os.path.exists(info_json)
+            ):
+                # Streams were fetched before the restart; only convert
+                self.listener.item_status(idx, "Waiting to convert…")
+                self._post_pool.submit(self._postprocess_item, idx, it, job, info_json)
+                handed_off = True
+                return
+            if resumed is not None and resumed.downloaded_bytes > 0:
+                # yt-dlp continues the .part file from this offset
+                self.listener.item_status(
+                    idx,
+                    f"Resuming at {resumed.downloaded_bytes / 1024 / 1024:.1f} MB…",
+                )
+            self._journal_mark(idx, DownloadState.DOWNLOADING)
+            self.limiter.start(self._bw_key(idx))
+
+            last_error: Optional[str] = None
+            success = False
+            attempt = 0
+            resuming = False
+            while attempt <= self.max_retries:
+                if self._stop:
+                    break
+                if resuming:
+                    self.listener.item_status(idx, "Resuming...")
+                elif attempt == 0:
+                    self.listener.item_status(idx, "Starting...")
+                else:
+                    self.listener.item_status(
+                        idx, f"Retrying ({attempt}/{self.max_retries})…"
+                    )
+                    time.sleep(0.35)
+                    if not self._wait_if_paused(idx):
+                        break
+                self.listener.item_stage(idx, "downloading")
+                success, err = self._attempt_download(
+                    idx, *job, stage=stage, info_json=info_json
+                )
+                if success:
+                    break
+                # Paused mid-download (Python API, or a binary that could not
+                # be suspended): wait, then continue the .part file without
+                # using up a retry
+                resuming = err == _PAUSED
+                if resuming:
+                    if not self._wait_if_paused(idx):
+                        break
+                    continue
+                last_error = err
+                attempt += 1
+
+            if self._stop:
+                return
+            if success:
+                if self.pipeline and self._post_pool is not None:
+                    self._journal_mark(
+                        idx, DownloadState.DOWNLOADED, info_json=info_json
+                    )
+                    self._post_pool.submit(
+                        self._postprocess_item, idx, it, job, info_json
+                    )
+                    handed_off = True
+                else:
+                    self._journal_mark(
+                        idx,
+                        DownloadState.COMPLETED,
+                        output_path=self._output_files.get(idx),
+                    )
+                    self.listener.item_done(idx, None)
+                return
+
+            self._journal_mark(idx, DownloadState.FAILED, error=last_error)
+            self._report_failure(idx, it, last_error or "Download failed")
+        finally:
+            self.limiter.finish(self._bw_key(idx))
+            if not handed_off:
+                self._mark_finished(idx)
+
+    # Second pipeline stage: replay the saved info JSON so yt-dlp finds the
+    # already downloaded streams and only runs the postprocessors
+    def _postprocess_item(self, idx: int, it: dict, job: tuple, info_json: str):
+        try:
+            if not self._wait_if_paused(idx):
+                return
+            self.listener.item_stage(idx, "converting")
+            self._journal_mark(idx, DownloadState.CONVERTING)
+            ok, err = self._attempt_download(
+                idx, *job, stage="post", info_json=info_json
+            )
+            while not ok and err == _PAUSED and self._wait_if_paused(idx):
+                ok, err = self._attempt_download(
+                    idx, *job, stage="post", info_json=info_json
+                )
+            if not ok and not self._stop:
+                # Fall back to a regular run; downloaded streams are reused
+                self.listener.item_status(idx, "Retrying conversion…")
+                ok, err = self._attempt_download(idx, *job)
+            if self._stop:
+                return  # keep the info JSON: conversion resumes next run
+            if ok:
+                self._journal_mark(
+                    idx,
+                    DownloadState.COMPLETED,
+                    output_path=self._output_files.get(idx),
+                )
+                self.listener.item_done(idx, None)
+            else:
+                self._journal_mark(idx, DownloadState.FAILED, error=err)
+                self._report_failure(idx, it, err or "Conversion failed")
+            try:
+                os.remove(info_json)
+            except Exception:
+                pass
+        finally:
+            self._mark_finished(idx)
+
+    # Items the journal already has as completed are reported, not re-run
+    def _restore_completed(self) -> List[int]:
+        if self.journal is None:
+            return []
+        done = []
+        for idx in range(len(self.items)):
+            if not self.journal.is_completed(idx):
+                continue
+            done.append(idx)
+            self._mark_finished(idx)
+            self.listener.item_progress(idx, 100.0, 0.0, 0)
+            self.listener.item_status(idx, "Done")
+            path = self.journal.state(idx).output_path
+            if path and os.path.exists(path):
+                self._output_files[idx] = path
+                self.listener.item_file_ready(idx, path)
+            self.listener.item_done(idx, None)
+        return done
+
+    def run(self):
+        skip = set(self._restore_completed())
+        if self.pipeline:
+            self._post_pool = ThreadPoolExecutor(
+                max_workers=max(1, self.max_postprocess),
+                thread_name_prefix="yt-postprocess",
+            )
+        try:
+            # Bounded worker pool: items start in queue order, at most N at once
+            workers = max(1, min(self.max_concurrent, len(self.items)))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="yt-download"
+            ) as pool:
+                futures = [
+                    pool.submit(self._process_item, idx, it)
+                    for idx, it in enumerate(self.items)
+                    if idx not in skip
+                ]
+                for fut in futures:
+                    try:
+                        fut.result()
+                    except Exception:
+                        pass
+        finally:
+            # All downloads are in; let queued conversions drain
+            if self._post_pool is not None:
+                self._post_pool.shutdown(wait=True)
+                self._post_pool = None
+            # A journaled batch keeps its work dir until the journal is discarded
+            if self._work_dir and self.journal is None:
+                shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+        if not self._stop:
+            self.listener.finished_all()
+
+
+# ----- one batch across worker processes -----
+# Set in each worker by the pool initializer (spawned workers share nothing)
+_shard_events = None
+_shard_stop = None
+
+
+def _init_shard_worker(events, stop):
+    global _shard_events, _shard_stop
+    _shard_events = events
+    _shard_stop = stop
+
+
+class _QueueListener(DownloadListener):
+    """Forwards a shard's events to the parent with batch-wide indices."""
+
+    def __init__(self, shard: int, indices: List[int]):
+        self.shard = shard
+        self.indices = indices
+
+    def _put(self, method: str, *args):
+        _shard_events.put((self.shard, method, args))
+
+    def item_progress(self, idx, percent, speed, eta):
+        self._put("item_progress", self.indices[idx], percent, speed, eta)
+
+    def item_status(self, idx, text):
+        self._put("item_status", self.indices[idx], text)
+
+    def item_stage(self, idx, stage):
+        self._put("item_stage", self.indices[idx], stage)
+
+    def item_file_ready(self, idx, path):
+        self._put("item_file_ready", self.indices[idx], path)
+
+    def item_done(self, idx, error):
+        self._put("item_done", self.indices[idx], error)
+
+    def retry_limit_reached(self, message):
+        self._put("retry_limit_reached", message)
+
+
+def _run_shard(
+    shard: int,
+    engine_class: type,
+    items: List[dict],
+    indices: List[int],
+    args: tuple,
+    kwargs: dict,
+    limit_bps: float,
+    schedules: List[Dict],
+):
+    limiter = BandwidthLimiter(limit_bps, schedules)
+    listener = _QueueListener(shard, indices)
+    engine = engine_class(items, *args, limiter=limiter, listener=listener, **kwargs)
+    done = Event()
+
+    def watch_stop():
+        while not done.wait(0.1):
+            if _shard_stop.is_set():
+                engine.stop()
+                return
+
+    watcher = Thread(target=watch_stop, name="shard-stop", daemon=True)
+    watcher.start()
+    try:
+        engine.run()
+    finally:
+        done.set()
+        # Last message of the shard: everything before it has been queued
+        _shard_events.put((shard, None, ()))
+
+
+class ShardedDownload:
+    """Runs one batch as several DownloadEngines in worker processes.
+
+    Items are dealt round-robin to ``processes`` spawned workers, so CPU-bound
+    work (progress parsing, Python-API downloads, pipelined ffmpeg jobs) uses
+    more than one interpreter. Events reach ``listener`` on a relay thread in
+    this process, with the batch's own indices. ``max_concurrent`` and the
+    bandwidth budget are totals split across the workers. Pause and the
+    journal are per process and therefore not offered here; stop() reaches
+    every worker.
+    """
+
+    def __init__(
+        self,
+        items: List[dict],
+        base_dir: str,
+        kind: str,
+        fmt: str,
+        ffmpeg_location: Optional[str] = None,
+        processes: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+        limit_bps: float = 0.0,
+        schedules: List[Dict] = (),
+        listener: Optional[DownloadListener] = None,
+        engine_class: type = DownloadEngine,
+        **engine_kwargs,
+    ):
+        self.items = items
+        self.listener = listener or DownloadListener()
+        self.engine_class = engine_class
+        self.ffmpeg_location = ffmpeg_location
+        self.processes = max(1, min(int(processes or 0) or 2, len(items) or 1))
+        total = int(max_concurrent or 0) or default_concurrency()
+        self.max_concurrent = max(total, self.processes)
+        self._args = (base_dir, kind, fmt, ffmpeg_location)
+        self._kwargs = dict(engine_kwargs)
+        self._kwargs["max_concurrent"] = -(-self.max_concurrent // self.processes)
+        # Each worker paces its own items on an equal slice of the budget
+        n = self.processes
+        self._limit_bps = max(0.0, float(limit_bps or 0)) / n
+        self._schedules = [
+            {**s, "limit_mbps": float(s.get("limit_mbps") or 0) / n}
+            for s in schedules or ()
+        ]
+        import multiprocessing
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._stop_evt = self._ctx.Event()
+        self._stopped = False
+
+    def stop(self):
+        self._stopped = True
+        self._stop_evt.set()
+
+    def shards(self) -> List[List[int]]:
+        return [
+            list(range(k, len(self.items), self.processes))
+            for k in range(self.processes)
+        ]
+
+    def _dispatch(self, method: str, args: tuple):
+        try:
+            getattr(self.listener, method)(*args)
+        except Exception:
+            pass  # a listener error must not stall the relay
+
+    def run(self):
+        """Blocks until every worker finished; same contract as
+        DownloadEngine.run()."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        events = self._ctx.Queue()
+        shards = [s for s in self.shards() if s]
+        reported: Set[int] = set()
+        ended: Set[int] = set()
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=self._ctx,
+            initializer=_init_shard_worker,
+            initargs=(events, self._stop_evt),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _run_shard,
+                    k,
+                    self.engine_class,
+                    [self.items[i] for i in indices],
+                    indices,
+                    self._args,
+                    self._kwargs,
+                    self._limit_bps,
+                    self._schedules,
+                ): k
+                for k, indices in enumerate(shards)
+            }
+            while len(ended) < len(shards):
+                try:
+                    shard, method, args = events.get(timeout=0.2)
+                except queue.Empty:
+                    # A worker that died never sends its end marker
+                    for fut, k in futures.items():
+                        if fut.done() and fut.exception() is not None:
+                            ended.add(k)
+                    continue
+                if method is None:
+                    ended.add(shard)
+                    continue
+                if method == "item_done":
+                    reported.add(args[0])
+                self._dispatch(method, args)
+        lost = [i for s in shards for i in s if i not in reported]
+        if not self._stopped:
+            for idx in lost:
+                self._dispatch("item_done", (idx, "worker process exited"))
+            self._dispatch("finished_all", ())
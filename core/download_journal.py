@@ -0,0 +1,314 @@
+"""Write-ahead journal of the Step 4 download queue.
+
+Every queue change is appended to a JSON-lines file under the settings dir
+before the app acts on it, so a crash or an app closed mid-batch can be
+resumed on the next launch:
+
+    {"op": "batch", "batch_id": "...", "base_dir": ..., "kind": ...,
+     "fmt": ..., "quality": ..., "items": [...]}
+    {"op": "item", "idx": 3, "state": "COMPLETED", "output_path": "..."}
+    {"op": "progress", "idx": 4, "downloaded_bytes": 1048576, "total_bytes": ...}
+
+Replaying the file rebuilds one core.models.DownloadItem per queue entry.
+A torn last line (crash mid-write) is ignored. State changes are fsynced;
+byte progress is throttled and only flushed, because yt-dlp resumes from the
+.part file on disk and the journal offset is informational.
+"""
+
+from __future__ import annotations
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+from core.models import DownloadItem, DownloadState
+from core.settings import SETTINGS_DIR
+
+JOURNAL_DIR = os.path.join(SETTINGS_DIR, "queue")
+JOURNAL_PATH = os.path.join(JOURNAL_DIR, "downloads.jsonl")
+
+# Defaults
+PROGRESS_INTERVAL = 2.0  # seconds between progress records per item
+COMPACT_AFTER = 5000  # records appended before the file is rewritten
+
+# Item keys needed to re-run a download (info dicts can carry MBs of formats)
+_ITEM_KEYS = (
+    "id",
+    "title",
+    "webpage_url",
+    "url",
+    "thumbnail",
+    "duration",
+    "desired_kind",
+    "desired_format",
+    "desired_quality",
+    "sb_enabled",
+    "sb_categories",
+    "download_subs",
+    "sub_langs",
+    "auto_subs",
+    "embed_subs",
+)
+
+_FINAL_STATES = (DownloadState.COMPLETED.value,)
+
+
+def _slim_item(it: Dict) -> Dict:
+    it = it or {}
+    slim = {k: it[k] for k in _ITEM_KEYS if k in it}
+    if "thumbnail" not in slim:
+        thumbs = it.get("thumbnails") or []
+        if thumbs and isinstance(thumbs[-1], dict) and thumbs[-1].get("url"):
+            slim["thumbnail"] = thumbs[-1]["url"]
+    return slim
+
+
+def _item_state(it: Dict, fmt: str) -> DownloadItem:
+    url = (it or {}).get("webpage_url") or (it or {}).get("url") or ""
+    return DownloadItem(
+        source_url=url,
+        normalized_url=url,
+        target_format=(it or {}).get("desired_format") or fmt,
+    )
+
+
+class DownloadJournal:
+    """Queue state for one batch; every method is thread-safe."""
+
+    def __init__(self, path: str = JOURNAL_PATH):
+        self.path = path
+        self.batch_id = ""
+        self.base_dir = ""
+        self.kind = "audio"
+        self.fmt = "mp3"
+        self.quality = "best"
+        self.items: List[Dict] = []
+        self.states: List[DownloadItem] = []
+        self._lock = threading.Lock()
+        self._fh = None
+        self._records = 0
+        self._last_progress: Dict[int, float] = {}
+
+    # ----- lifecycle -----
+    @classmethod
+    def begin(
+        cls,
+        base_dir: str,
+        kind: str,
+        fmt: str,
+        quality: str,
+        items: List[Dict],
+        path: str = JOURNAL_PATH,
+    ) -> "DownloadJournal":
+        """Start a new batch, replacing any previous journal."""
+        j = cls(path)
+        j.batch_id = uuid.uuid4().hex
+        j.base_dir = base_dir
+        j.kind = kind
+        j.fmt = fmt
+        j.quality = quality
+        j.items = [_slim_item(it) for it in items]
+        j.states = [_item_state(it, fmt) for it in j.items]
+        with j._lock:
+            j._rewrite()
+        return j
+
+    @classmethod
+    def load(cls, path: str = JOURNAL_PATH) -> Optional["DownloadJournal"]:
+        """Replay the journal; None if missing, unreadable or fully done."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except Exception:
+            return None
+        j = cls(path)
+        for line in lines:
+            try:
+                rec = json.loads(line)
+            except Exception:
+                continue  # torn write from a crash
+            j._apply(rec)
+        if not j.batch_id or not j.items:
+            return None
+        if j.pending_count() == 0:
+            j.discard()
+            return None
+        return j
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                try:
+                    self._fh.close()
+                except Exception:
+                    pass
+                self._fh = None
+
+    def discard(self) -> None:
+        """Forget the batch: journal file and the batch work dir."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except Exception:
+            pass
+        if self.batch_id:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    @property
+    def work_dir(self) -> str:
+        """Per-batch scratch dir that survives restarts (pipeline info JSON)."""
+        return os.path.join(os.path.dirname(self.path), self.batch_id)
+
+    # ----- queries -----
+    def state(self, idx: int) -> Optional[DownloadItem]:
+        with self._lock:
+            if 0 <= idx < len(self.states):
+                return self.states[idx]
+        return None
+
+    def is_completed(self, idx: int) -> bool:
+        st = self.state(idx)
+        return st is not None and st.state in _FINAL_STATES
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(1 for st in self.states if st.state not in _FINAL_STATES)
+
+    def matches(self, items: List[Dict]) -> bool:
+        """True if this journal describes the same queue (same order)."""
+
+        def _urls(seq):
+            return [
+                (it or {}).get("webpage_url") or (it or {}).get("url") for it in seq
+            ]
+
+        return _urls(items) == _urls(self.items)
+
+    # ----- updates -----
+    def mark(self, idx: int, state: DownloadState, **fields) -> None:
+        """Record a state transition (durable before returning)."""
+        with self._lock:
+            if not 0 <= idx < len(self.states):
+                return
+            st = self.states[idx]
+            st.state = str(state)
+            if state == DownloadState.COMPLETED:
+                # An error left by an earlier failed attempt no longer applies
+                fields.setdefault("error", None)
+            for k, v in fields.items():
+                if hasattr(st, k):
+                    setattr(st, k, v)
+            if state == DownloadState.COMPLETED:
+                st.progress = 100.0
+            rec = {"op": "item", "idx": idx, "state": st.state}
+            rec.update({k: v for k, v in fields.items() if hasattr(st, k)})
+            self._append(rec, sync=True)
+
+    def progress(self, idx: int, downloaded: float, total: float) -> None:
+        """Record the byte offset of a running download (throttled)."""
+        now = time.monotonic()
+        with self._lock:
+            if not 0 <= idx < len(self.states):
+                return
+            if now - self._last_progress.get(idx, 0.0) < PROGRESS_INTERVAL:
+                return
+            self._last_progress[idx] = now
+            st = self.states[idx]
+            st.downloaded_bytes = int(downloaded or 0)
+            st.total_bytes = int(total or 0)
+            if st.total_bytes:
+                st.progress = st.downloaded_bytes * 100.0 / st.total_bytes
+            self._append(
+                {
+                    "op": "progress",
+                    "idx": idx,
+                    "downloaded_bytes": st.downloaded_bytes,
+                    "total_bytes": st.total_bytes,
+                },
+                sync=False,
+            )
+
+    # ----- internals (caller holds the lock) -----
+    def _apply(self, rec: Dict) -> None:
+        op = rec.get("op")
+        if op == "batch":
+            self.batch_id = rec.get("batch_id") or ""
+            self.base_dir = rec.get("base_dir") or ""
+            self.kind = rec.get("kind") or "audio"
+            self.fmt = rec.get("fmt") or "mp3"
+            self.quality = rec.get("quality") or "best"
+            self.items = list(rec.get("items") or [])
+            self.states = [_item_state(it, self.fmt) for it in self.items]
+            for idx, snap in (rec.get("states") or {}).items():
+                self._apply({"op": "item", "idx": int(idx), **snap})
+            return
+        idx = rec.get("idx")
+        if not isinstance(idx, int) or not 0 <= idx < len(self.states):
+            return
+        st = self.states[idx]
+        for k, v in rec.items():
+            if k not in ("op", "idx") and hasattr(st, k):
+                setattr(st, k, v)
+        if op == "progress" and st.total_bytes:
+            st.progress = st.downloaded_bytes * 100.0 / st.total_bytes
+
+    def _header(self) -> Dict:
+        # Snapshot of non-default item states keeps compaction lossless
+        default = asdict(DownloadItem("", "", ""))
+        states = {}
+        for idx, st in enumerate(self.states):
+            d = asdict(st)
+            changed = {
+                k: v
+                for k, v in d.items()
+                if k not in ("source_url", "normalized_url", "target_format")
+                and v != default[k]
+            }
+            if changed:
+                states[str(idx)] = changed
+        return {
+            "op": "batch",
+            "batch_id": self.batch_id,
+            "base_dir": self.base_dir,
+            "kind": self.kind,
+            "fmt": self.fmt,
+            "quality": self.quality,
+            "items": self.items,
+            "states": states,
+            "ts": time.time(),
+        }
+
+    def _rewrite(self) -> None:
+        # Atomic snapshot: readers see the old or the new file, never half
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self._header(), default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._records = 0
+
+    def _append(self, rec: Dict, sync: bool) -> None:
+        try:
+            if self._records >= COMPACT_AFTER:
+                self._rewrite()
+            if self._fh is None:
+                self._fh = open(self.path, "a", encoding="utf-8")
+            self._fh.write(json.dumps(rec, default=str) + "\n")
+            self._fh.flush()
+            if sync:
+                os.fsync(self._fh.fileno())
+            self._records += 1
+        except Exception:
+            pass
@@ -0,0 +1,464 @@
+"""Long-lived yt-dlp extraction workers.
+
+Starting yt-dlp (process start-up, extractor imports, YouTube player set-up)
+dominates single-video fetch latency. This module keeps a small pool of warm
+Python processes that each hold a YoutubeDL instance and answer extraction
+requests over a JSON-lines pipe:
+
+    request:  {"id": 1, "op": "extract", "url": "...", "flat": false}
+    response: {"id": 1, "ok": true, "info": {...}}
+              {"id": 1, "ok": false, "error": "..."}
+
+The same file is the worker entry point (``python -m core.extract_worker``;
+frozen builds re-launch the app executable with ``--extract-worker``).
+
+The updater keeps yt-dlp's zipimport build of the binary's release next to
+it (core.paths.YTDLP_MODULE); workers import ``yt_dlp`` from there, so they
+run the same code as the auto-updated binary rather than the copy bundled
+with the app. Without it (or if it fails to import) they use the bundled
+module; once a worker reports a version older than the binary's, the pool
+retires itself and fetches go to the binary instead.
+"""
+
+from __future__ import annotations
+import atexit
+import json
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+from typing import List, Optional
+
+from core.paths import YTDLP_MODULE
+
+WORKER_FLAG = "--extract-worker"
+# Path of the yt-dlp zipapp a worker imports yt_dlp from (set by the pool)
+MODULE_ENV = "YTC_YTDLP_MODULE"
+
+# Defaults
+POOL_SIZE = 2
+MAX_REQUESTS_PER_WORKER = 50  # recycle to keep memory/extractor state bounded
+READY_TIMEOUT = 30.0
+ACQUIRE_TIMEOUT = 0.05  # wait for a free worker before using the binary
+PING_AFTER_IDLE = 120.0
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def version_key(version: str) -> tuple:
+    """ "2025.01.15" / "2025.01.15.232" (nightly) as comparable numbers."""
+    return tuple(int(n) for n in re.findall(r"\d+", version or ""))
+
+
+def _binary_version() -> str:
+    # Cached per binary file (core.probe_cache); "" without a binary
+    from core.update_engine import current_binary_version
+
+    return current_binary_version()
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+def _ydl_opts(flat: bool, use_tv_client: bool) -> dict:
+    # Mirrors InfoFetch._extract_with_python_api
+    from core.fetch_engine import EXTRACTOR_ARGS
+    from core.http_client import HTTP_HEADERS
+
+    opts = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "noprogress": True,
+        "noplaylist": False,
+        "extract_flat": flat,
+        "socket_timeout": 15,
+        "extractor_retries": 1 if flat else 2,
+        "cachedir": False,
+        "http_headers": HTTP_HEADERS,
+    }
+    if use_tv_client:
+        opts["extractor_args"] = EXTRACTOR_ARGS
+    return opts
+
+
+def _import_yt_dlp():
+    """yt_dlp from the updater's zipapp when there is one, else the bundled
+    module (a zipapp that does not import is dropped again)."""
+    module = os.environ.get(MODULE_ENV) or ""
+    if os.path.isfile(module):
+        # Ahead of every other entry, including the frozen app's own modules
+        sys.path.insert(0, module)
+        try:
+            import yt_dlp
+
+            return yt_dlp
+        except Exception:
+            sys.path.remove(module)
+            for name in [n for n in sys.modules if n.split(".")[0] == "yt_dlp"]:
+                del sys.modules[name]
+    import yt_dlp
+
+    return yt_dlp
+
+
+def serve() -> int:
+    """Worker loop: one JSON request per stdin line, one response per line."""
+    out = sys.stdout
+    # Anything yt-dlp prints must not corrupt the protocol stream
+    sys.stdout = sys.stderr
+    try:
+        yt_dlp = _import_yt_dlp()
+    except Exception as e:
+        out.write(json.dumps({"ready": False, "error": str(e)}) + "\n")
+        out.flush()
+        return 1
+
+    ydls = {}
+
+    def _ydl(flat: bool, tv: bool):
+        key = (flat, tv)
+        if key not in ydls:
+            ydls[key] = yt_dlp.YoutubeDL(_ydl_opts(flat, tv))
+        return ydls[key]
+
+    out.write(json.dumps({"ready": True, "version": yt_dlp.version.__version__}))
+    out.write("\n")
+    out.flush()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except Exception:
+            continue
+        rid = req.get("id")
+        op = req.get("op")
+        if op == "ping":
+            resp = {"id": rid, "ok": True}
+        elif op == "extract":
+            flat = bool(req.get("flat"))
+            try:
+                try:
+                    ydl = _ydl(flat, True)
+                    info = ydl.extract_info(req["url"], download=False)
+                except Exception:
+                    ydl = _ydl(flat, False)
+                    info = ydl.extract_info(req["url"], download=False)
+                resp = {"id": rid, "ok": True, "info": ydl.sanitize_info(info)}
+            except Exception as e:
+                resp = {"id": rid, "ok": False, "error": str(e)}
+        elif op == "exit":
+            break
+        else:
+            resp = {"id": rid, "ok": False, "error": f"Unknown op: {op}"}
+        try:
+            out.write(json.dumps(resp, default=str) + "\n")
+            out.flush()
+        except Exception:
+            break
+    for ydl in ydls.values():
+        try:
+            ydl.close()
+        except Exception:
+            pass
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# App side
+# ---------------------------------------------------------------------------
+
+
+def _worker_command() -> List[str]:
+    if getattr(sys, "frozen", False):
+        return [sys.executable, WORKER_FLAG]
+    return [sys.executable, "-m", "core.extract_worker"]
+
+
+class _Worker:
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.served = 0
+        self.last_used = time.time()
+        self._next_id = 0
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        env = os.environ.copy()
+        env["YTDLP_NO_PLUGINS"] = "1"
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (_ROOT_DIR, env.get("PYTHONPATH")) if p
+        )
+        env["PYTHONIOENCODING"] = "utf-8"
+        env[MODULE_ENV] = YTDLP_MODULE
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+        self.proc = subprocess.Popen(
+            _worker_command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            cwd=_ROOT_DIR,
+            env=env,
+            **kwargs,
+        )
+        self._reader = threading.Thread(
+            target=self._read_loop, name="extract-worker-reader", daemon=True
+        )
+        self._reader.start()
+        self.ready = False
+        self.version = ""
+
+    def _read_loop(self):
+        try:
+            for line in self.proc.stdout:
+                self._lines.put(line)
+        except Exception:
+            pass
+        self._lines.put(None)  # EOF marker
+
+    def _read(self, timeout: float) -> dict:
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError("Extraction worker timed out")
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError("Extraction worker timed out")
+            if line is None:
+                raise RuntimeError("Extraction worker exited")
+            try:
+                return json.loads(line)
+            except Exception:
+                continue  # stray output; keep waiting for a protocol line
+
+    def wait_ready(self, timeout: float = READY_TIMEOUT) -> bool:
+        if not self.ready:
+            msg = self._read(timeout)
+            self.ready = bool(msg.get("ready"))
+            self.version = str(msg.get("version") or "")
+        return self.ready
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def call(self, payload: dict, timeout: float) -> dict:
+        self._next_id += 1
+        rid = self._next_id
+        payload = dict(payload, id=rid)
+        self.proc.stdin.write(json.dumps(payload) + "\n")
+        self.proc.stdin.flush()
+        while True:
+            resp = self._read(timeout)
+            if resp.get("id") == rid:
+                self.last_used = time.time()
+                return resp
+
+    def healthy(self) -> bool:
+        if not self.alive():
+            return False
+        if time.time() - self.last_used < PING_AFTER_IDLE:
+            return True
+        try:
+            return bool(self.call({"op": "ping"}, timeout=5).get("ok"))
+        except Exception:
+            return False
+
+    def close(self):
+        try:
+            if self.alive():
+                self.proc.stdin.write(json.dumps({"op": "exit"}) + "\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=2)
+        except Exception:
+            pass
+        try:
+            if self.alive():
+                self.proc.kill()
+        except Exception:
+            pass
+
+
+class ExtractionPool:
+    """Bounded pool of warm extraction processes (thread-safe)."""
+
+    def __init__(
+        self, size: int = POOL_SIZE, max_requests: int = MAX_REQUESTS_PER_WORKER
+    ):
+        self.size = max(0, int(size))
+        self.max_requests = max(1, int(max_requests))
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self._spawned = 0
+        self._generation = 0
+        self._slots = threading.Semaphore(self.size or 1)
+        self._closed = False
+        # Module older than the binary (checked once per generation)
+        self.outdated = False
+        self._checked_generation = -1
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and not self._closed and not self.outdated
+
+    def _check_version(self, w: _Worker) -> bool:
+        """False (and the pool retired) when w's yt_dlp is older than the
+        binary the one-shot path would run."""
+        with self._lock:
+            if self._checked_generation == w.generation:
+                return not self.outdated
+            self._checked_generation = w.generation
+        try:
+            binary = _binary_version()
+        except Exception:
+            binary = ""
+        if binary and version_key(w.version) < version_key(binary):
+            with self._lock:
+                self.outdated = True
+                idle, self._idle = self._idle, []
+            for other in idle:
+                self._discard(other)
+            return False
+        return True
+
+    def configure(self, size: int):
+        """Resize the pool (0 disables it); existing workers are recycled."""
+        with self._lock:
+            self.size = max(0, int(size))
+            self._slots = threading.Semaphore(self.size or 1)
+        self.restart()
+
+    def _spawn(self) -> _Worker:
+        with self._lock:
+            gen = self._generation
+            self._spawned += 1
+        try:
+            return _Worker(gen)
+        except Exception:
+            with self._lock:
+                self._spawned -= 1
+            raise
+
+    def _acquire(self) -> _Worker:
+        while True:
+            with self._lock:
+                w = self._idle.pop() if self._idle else None
+            if w is None:
+                return self._spawn()
+            if w.generation == self._generation and w.healthy():
+                return w
+            self._discard(w)
+
+    def _release(self, w: _Worker):
+        stale = (
+            self._closed
+            or w.generation != self._generation
+            or w.served >= self.max_requests
+            or not w.alive()
+        )
+        if stale:
+            self._discard(w)
+            return
+        with self._lock:
+            self._idle.append(w)
+
+    def _discard(self, w: _Worker):
+        with self._lock:
+            self._spawned = max(0, self._spawned - 1)
+        threading.Thread(target=w.close, daemon=True).start()
+
+    def warm_up(self):
+        """Start workers in the background so the first fetch is already warm."""
+        if not self.enabled:
+            return
+
+        def _warm():
+            while True:
+                with self._lock:
+                    if self._closed or self._spawned >= self.size:
+                        return
+                try:
+                    w = self._spawn()
+                    w.wait_ready()
+                except Exception:
+                    return
+                if not self._check_version(w):
+                    self._discard(w)
+                    return
+                self._release(w)
+
+        threading.Thread(target=_warm, name="extract-warmup", daemon=True).start()
+
+    def extract(self, url: str, flat: bool = False, timeout: float = 60) -> dict:
+        if not self.enabled:
+            raise RuntimeError("Extraction pool disabled")
+        slots = self._slots
+        # All workers busy: the caller falls back to the one-shot binary
+        # instead of holding its executor thread here
+        if not slots.acquire(timeout=ACQUIRE_TIMEOUT):
+            raise RuntimeError("No extraction worker free")
+        try:
+            w = self._acquire()
+            try:
+                w.wait_ready()
+                if not self._check_version(w):
+                    raise RuntimeError("yt_dlp module older than the binary")
+                resp = w.call({"op": "extract", "url": url, "flat": flat}, timeout)
+                w.served += 1
+            except Exception:
+                # Timed out or died mid-request: never reuse it
+                self._discard(w)
+                raise
+            self._release(w)
+        finally:
+            slots.release()
+        if not resp.get("ok"):
+            raise RuntimeError(resp.get("error") or "Extraction failed")
+        return resp.get("info") or {}
+
+    def restart(self):
+        """Drop all workers (e.g. after a yt-dlp update); new ones start lazily
+        and compare their module with the (new) binary again."""
+        with self._lock:
+            self._generation += 1
+            self.outdated = False
+            idle, self._idle = self._idle, []
+        for w in idle:
+            self._discard(w)
+        self.warm_up()
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for w in idle:
+            w.close()
+
+
+_default_pool: Optional[ExtractionPool] = None
+_default_lock = threading.Lock()
+
+
+def extraction_pool() -> ExtractionPool:
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = ExtractionPool()
+            atexit.register(_default_pool.shutdown)
+        return _default_pool
+
+
+if __name__ == "__main__":
+    sys.exit(serve())
@@ -0,0 +1,277 @@
+"""Qt-free metadata fetching (yt-dlp -J and its fallbacks).
+
+InfoFetch resolves one URL: metadata cache, warm extraction worker, the
+yt-dlp binary, then yt-dlp's Python API. BatchInfoFetch resolves many with
+bounded concurrency and request spacing, reporting each result to a
+BatchFetchListener. Both are coroutines on core.runtime; cancelling them
+kills running yt-dlp processes. core.yt_manager wraps them in Qt workers.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from core.download_engine import _win_no_window_kwargs
+from core.extract_worker import extraction_pool
+from core.metadata_cache import metadata_cache
+from core.paths import YTDLP_EXE
+from core.runtime import runtime
+from core.utils_url import _extract_video_id
+
+EXTRACTOR_ARGS = {
+    "youtube": {"player_client": ["tv"], "skip": ["dash", "hls"]},
+    "youtubetab": {"skip": ["webpage"]},
+}
+
+
+class InfoFetch:
+    """Metadata for one URL; fetch_async() raises on failure.
+
+    include_formats=False is for callers that only show title, thumbnail and
+    duration: a cached entry then serves them for the long static TTL even
+    after its format list expired (the result may lack "formats").
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout_sec: int = 60,
+        use_cache: bool = True,
+        include_formats: bool = True,
+    ):
+        self.url = url
+        self.timeout_sec = timeout_sec
+        self.use_cache = use_cache
+        self.include_formats = include_formats
+
+    def _is_search(self) -> bool:
+        return isinstance(self.url, str) and self.url.startswith("ytsearch")
+
+    def _is_playlist(self) -> bool:
+        try:
+            u = str(self.url)
+            return ("list=" in u) or ("playlist?" in u)
+        except Exception:
+            return False
+
+    # Single videos only; searches and flat playlists are never cached
+    def _cache_key(self) -> Optional[str]:
+        if not self.use_cache or self._is_search() or self._is_playlist():
+            return None
+        try:
+            return _extract_video_id(str(self.url))
+        except Exception:
+            return None
+
+    def _store(self, info: dict, cache_key: Optional[str]) -> dict:
+        if cache_key:
+            metadata_cache().put(info)
+        return info
+
+    async def _extract_with_binary(self) -> dict:
+        is_search = self._is_search()
+        is_playlist = self._is_playlist()
+        args = [
+            YTDLP_EXE,
+            "-J",
+            "--ignore-config",
+            "--no-warnings",
+            "--no-progress",
+            "--skip-download",
+            "--no-write-comments",
+            "--no-write-playlist-metafiles",
+            "--no-cache-dir",
+            "--extractor-retries",
+            "1",
+            "--extractor-args",
+            "youtube:player_client=tv",
+            "--extractor-args",
+            "youtube:skip=dash,hls",
+            "--extractor-args",
+            "youtubetab:skip=webpage",
+        ]
+        if is_search or is_playlist:
+            args.append("--flat-playlist")
+        args.append(self.url)
+
+        env = os.environ.copy()
+        env["YTDLP_NO_PLUGINS"] = "1"
+        kwargs = _win_no_window_kwargs()
+        # Killed on timeout or when the fetch is cancelled
+        code, out, err = await runtime().run_process(
+            args, timeout=self.timeout_sec, env=env, **kwargs
+        )
+        if code != 0:
+            stderr = err.decode("utf-8", "replace").strip()
+            raise RuntimeError(stderr or "yt-dlp binary failed")
+        if not out:
+            raise RuntimeError("Empty response from yt-dlp")
+        return json.loads(out)
+
+    def _extract_with_python_api(self, use_tv_client: bool = True) -> dict:
+        import yt_dlp
+        from core.http_client import HTTP_HEADERS
+
+        is_search = self._is_search()
+        is_playlist = self._is_playlist()
+        ydl_opts = {
+            "quiet": True,
+            "skip_download": True,
+            "noprogress": True,
+            "noplaylist": False,
+            "extract_flat": True if (is_search or is_playlist) else False,
+            "socket_timeout": 15,
+            "extractor_retries": 1 if (is_search or is_playlist) else 2,
+            "cachedir": False,
+            "http_headers": HTTP_HEADERS,
+        }
+        if use_tv_client:
+            ydl_opts["extractor_args"] = EXTRACTOR_ARGS
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(self.url, download=False)
+
+    async def fetch_async(
+        self, before_extract: Optional[Callable[[], Awaitable]] = None
+    ) -> dict:
+        """Cache, warm worker, binary, in-process; raises on failure.
+
+        before_extract is awaited only when the cache misses, right before
+        the extraction (BatchInfoFetch spaces requests with it).
+        """
+        rt = runtime()
+        cache_key = self._cache_key()
+        if cache_key:
+            cached = await rt.run_blocking(
+                metadata_cache().get, cache_key, self.include_formats
+            )
+            if cached:
+                return cached
+        if before_extract is not None:
+            await before_extract()
+        async with rt.limit("metadata"):
+            # Warm worker first; on any failure fall through to the one-shot paths
+            try:
+                pool = extraction_pool()
+                if pool.enabled:
+                    # Bound here: run_blocking would take timeout= for itself
+                    extract = functools.partial(
+                        pool.extract,
+                        self.url,
+                        flat=self._is_search() or self._is_playlist(),
+                        timeout=self.timeout_sec,
+                    )
+                    info = await rt.run_blocking(extract)
+                    return await rt.run_blocking(self._store, info, cache_key)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
+            try:
+                if os.path.exists(YTDLP_EXE):
+                    info = await self._extract_with_binary()
+                else:
+                    info = await rt.run_blocking(
+                        self._extract_with_python_api,
+                        use_tv_client=True,
+                        timeout=self.timeout_sec,
+                    )
+            except asyncio.CancelledError:
+                raise
+            except TimeoutError:
+                raise TimeoutError("Timed out while fetching info")
+            except Exception:
+                info = await rt.run_blocking(
+                    self._extract_with_python_api,
+                    use_tv_client=False,
+                    timeout=self.timeout_sec,
+                )
+            return await rt.run_blocking(self._store, info, cache_key)
+
+    def fetch(self) -> dict:
+        """Blocking fetch from a non-runtime thread; raises on failure."""
+        return runtime().run(self.fetch_async())
+
+
+class BatchFetchListener:
+    """Receives batch results on the runtime thread; the defaults ignore them."""
+
+    def item_ok(self, url: str, info: dict) -> None:
+        pass
+
+    def item_failed(self, url: str, error: str) -> None:
+        pass
+
+    def progress(self, done: int, total: int) -> None:
+        pass
+
+
+class BatchInfoFetch:
+    """Resolve full metadata for many URLs with bounded concurrency.
+
+    Results stream back per URL as they finish; extractions that miss the
+    metadata cache are spaced by min_interval (backing off when YouTube
+    starts throttling).
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        max_concurrent: int = 4,
+        min_interval: float = 0.25,
+        timeout_sec: int = 60,
+        listener: Optional[BatchFetchListener] = None,
+        include_formats: bool = True,
+    ):
+        # Preserve order, drop duplicates
+        self.urls = list(dict.fromkeys(u for u in urls if u))
+        self.max_concurrent = max(1, int(max_concurrent or 1))
+        self.min_interval = max(0.0, float(min_interval))
+        self.timeout_sec = timeout_sec
+        self.include_formats = include_formats
+        self.listener = listener or BatchFetchListener()
+        self._next_start = 0.0
+        self._done = 0
+
+    async def _wait_turn(self):
+        # Runs on the single runtime loop; no lock needed
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def _backoff(self):
+        self.min_interval = min(5.0, max(0.5, self.min_interval * 2))
+        self._next_start = time.monotonic() + self.min_interval
+
+    async def _fetch_one(self, url: str, slots: asyncio.Semaphore):
+        async with slots:
+            try:
+                fetcher = InfoFetch(
+                    url,
+                    timeout_sec=self.timeout_sec,
+                    include_formats=self.include_formats,
+                )
+                # Cache hits never wait; spacing applies to real extractions
+                payload = await fetcher.fetch_async(before_extract=self._wait_turn)
+                ok = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                ok, payload = False, str(e) or "Failed to fetch info"
+                if "429" in payload or "too many requests" in payload.lower():
+                    self._backoff()
+        if ok:
+            self.listener.item_ok(url, payload)
+        else:
+            self.listener.item_failed(url, payload)
+        self._done += 1
+        self.listener.progress(self._done, len(self.urls))
+
+    async def run(self):
+        # Cancelling the batch cancels every pending and in-flight fetch
+        slots = asyncio.Semaphore(self.max_concurrent)
+        await asyncio.gather(*(self._fetch_one(u, slots) for u in self.urls))
@@ -0,0 +1,99 @@
+"""Shared HTTP layer for the app (updater, ffmpeg installer, thumbnails).
+
+One urllib3 connection pool set is shared process-wide, so bursts against
+the same host (e.g. i.ytimg.com thumbnails) reuse a handful of keep-alive
+connections instead of opening a new TCP+TLS connection per request.
+Timeouts and retry/backoff policy live here instead of at every call site.
+
+Sessions are per thread (requests.Session is not guaranteed thread-safe),
+but they all mount the same adapter and therefore the same pools.
+
+requests is imported on the first request, not with this module, so the
+headers and timeouts can be read without paying for it at startup.
+"""
+
+from __future__ import annotations
+import threading
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+# Centralized HTTP headers with client identifier
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.5",
+    "X-Client-App": "YoutubeConverter",
+}
+
+# Defaults (seconds): (connect, read)
+DEFAULT_TIMEOUT = (5, 20)
+DOWNLOAD_TIMEOUT = (10, 60)
+# Hosts kept pooled / connections kept per host
+POOL_HOSTS = 10
+POOL_PER_HOST = 6
+
+_adapter: Optional[HTTPAdapter] = None
+_adapter_lock = threading.Lock()
+_local = threading.local()
+
+
+def _retry_policy() -> Retry:
+    from urllib3.util.retry import Retry
+
+    return Retry(
+        total=3,
+        connect=3,
+        read=2,
+        status=3,
+        backoff_factor=0.5,  # 0.5s, 1s, 2s
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _shared_adapter() -> HTTPAdapter:
+    global _adapter
+    from requests.adapters import HTTPAdapter
+
+    with _adapter_lock:
+        if _adapter is None:
+            _adapter = HTTPAdapter(
+                pool_connections=POOL_HOSTS,
+                pool_maxsize=POOL_PER_HOST,
+                max_retries=_retry_policy(),
+                # Wait for a free connection rather than opening extra ones
+                pool_block=True,
+            )
+        return _adapter
+
+
+def session() -> requests.Session:
+    """Session for the calling thread, backed by the shared connection pools."""
+    s = getattr(_local, "session", None)
+    if s is None:
+        import requests
+
+        s = requests.Session()
+        s.headers.update(HTTP_HEADERS)
+        adapter = _shared_adapter()
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        _local.session = s
+    return s
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """requests.get equivalent using the shared pools and default timeout."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return session().get(url, **kwargs)
+
+
+def stream(url: str, **kwargs) -> requests.Response:
+    """Streaming GET for large downloads (use as a context manager)."""
+    kwargs.setdefault("timeout", DOWNLOAD_TIMEOUT)
+    return session().get(url, stream=True, **kwargs)
@@ -0,0 +1,72 @@
+"""Low-priority GUI-thread jobs, run one at a time once the window is up.
+
+MainWindow queues start-up work the first frame does not need (dependency
+checks, warm extraction workers, update checks) and calls start() right
+after show(). Each job runs from a 0 ms timer, i.e. only when the event loop
+has nothing else pending, and jobs are spaced by gap_ms so input and paints
+get through in between. Lower priority values run first, ties in the order
+added. Jobs are traced in core.startup as "idle" spans (the trace file is
+rewritten when the queue drains); an exception is logged and the queue moves
+on.
+"""
+
+import heapq
+from typing import Callable, List, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from core import startup
+
+GAP_MS = 50
+
+
+class IdleTaskScheduler(QObject):
+    # Queue drained (also after tasks added later have run)
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None, gap_ms: int = GAP_MS):
+        super().__init__(parent)
+        self.gap_ms = max(0, int(gap_ms))
+        self._queue: List[Tuple[int, int, str, Callable[[], None]]] = []
+        self._seq = 0
+        self._started = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_next)
+
+    def add(self, name: str, fn: Callable[[], None], priority: int = 0):
+        heapq.heappush(self._queue, (priority, self._seq, name, fn))
+        self._seq += 1
+        if self._started and not self._timer.isActive():
+            self._timer.start(0)
+
+    def start(self):
+        if self._started:
+            return
+        self._started = True
+        if self._queue:
+            # Next loop turn: whatever show() posted is handled first
+            self._timer.start(0)
+
+    def pending(self) -> List[str]:
+        return [name for _p, _s, name, _fn in sorted(self._queue)]
+
+    def _run_next(self):
+        if not self._queue:
+            return
+        _priority, _seq, name, fn = heapq.heappop(self._queue)
+        try:
+            with startup.timed("idle", name):
+                fn()
+        except Exception as e:
+            try:
+                from core.logging import logger
+
+                logger.exception(f"Idle task {name} failed: {e}")
+            except Exception:
+                pass
+        if self._queue:
+            self._timer.start(self.gap_ms)
+        else:
+            startup.update_trace()
+            self.finished.emit()
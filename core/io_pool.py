@@ -0,0 +1,159 @@
+"""Shared worker pool for small blocking I/O jobs.
+
+One set of long-lived daemon threads serves every caller (thumbnail fetches,
+prefetches) instead of a thread per job:
+
+- Priorities: VISIBLE jobs run before PREFETCH jobs, FIFO within a priority
+- Dedup: submitting a key that is queued or running attaches to that job
+- Cancellation: a submission may carry a CancelToken; a queued job whose
+  submitters all cancelled is dropped unrun, cancelled submitters get no
+  callback
+
+Callbacks run on the worker thread; Qt callers hand results to the GUI
+thread with a signal.
+"""
+
+from __future__ import annotations
+import heapq
+import itertools
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+# Priorities (lower runs first)
+VISIBLE = 0
+PREFETCH = 1
+
+# Defaults
+POOL_WORKERS = 4
+
+
+class CancelToken:
+    """Shared by the jobs of one caller; cancel() withdraws all of them."""
+
+    __slots__ = ("_cancelled",)
+
+    def __init__(self):
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+
+class _Job:
+    __slots__ = ("key", "fn", "priority", "seq", "waiters", "started")
+
+    def __init__(self, key: Hashable, fn: Callable[[], object]):
+        self.key = key
+        self.fn = fn
+        self.priority = PREFETCH
+        self.seq = 0
+        self.waiters: List[Tuple[Optional[Callable], Optional[CancelToken]]] = []
+        self.started = False
+
+    def abandoned(self) -> bool:
+        return all(t is not None and t.cancelled for _, t in self.waiters)
+
+
+class IOPool:
+    def __init__(self, workers: int = POOL_WORKERS, name: str = "io-pool"):
+        self._cv = threading.Condition()
+        self._heap: List[Tuple[int, int, _Job]] = []
+        self._jobs: Dict[Hashable, _Job] = {}
+        self._seq = itertools.count()
+        for i in range(max(1, workers)):
+            threading.Thread(
+                target=self._worker, name=f"{name}-{i}", daemon=True
+            ).start()
+
+    def submit(
+        self,
+        key: Hashable,
+        fn: Callable[[], object],
+        callback: Optional[Callable[[object], None]] = None,
+        priority: int = PREFETCH,
+        token: Optional[CancelToken] = None,
+    ) -> bool:
+        """Run fn() once per key; callback(result) gets None if fn raised.
+
+        Returns False when the call attached to a queued or running job.
+        """
+        with self._cv:
+            job = self._jobs.get(key)
+            if job is not None:
+                job.waiters.append((callback, token))
+                if not job.started and priority < job.priority:
+                    self._push(job, priority)
+                return False
+            job = _Job(key, fn)
+            job.waiters.append((callback, token))
+            self._jobs[key] = job
+            self._push(job, priority)
+            self._cv.notify()
+            return True
+
+    def prioritize(self, key: Hashable, priority: int = VISIBLE) -> None:
+        """Raise a queued job's priority (no-op if started or unknown)."""
+        with self._cv:
+            job = self._jobs.get(key)
+            if job is not None and not job.started and priority < job.priority:
+                self._push(job, priority)
+
+    def pending(self) -> int:
+        """Jobs queued or running."""
+        with self._cv:
+            return len(self._jobs)
+
+    def _push(self, job: _Job, priority: int) -> None:
+        # Re-pushing leaves the old heap entry behind; its seq no longer matches
+        job.priority = priority
+        job.seq = next(self._seq)
+        heapq.heappush(self._heap, (priority, job.seq, job))
+
+    def _next_job(self) -> _Job:
+        with self._cv:
+            while True:
+                while not self._heap:
+                    self._cv.wait()
+                _, seq, job = heapq.heappop(self._heap)
+                if seq != job.seq or job.started:
+                    continue
+                if job.abandoned():
+                    self._jobs.pop(job.key, None)
+                    continue
+                job.started = True
+                return job
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            try:
+                result = job.fn()
+            except Exception:
+                result = None
+            with self._cv:
+                self._jobs.pop(job.key, None)
+                waiters = list(job.waiters)
+            for callback, token in waiters:
+                if callback is None or (token is not None and token.cancelled):
+                    continue
+                try:
+                    callback(result)
+                except Exception:
+                    pass
+
+
+_pool: Optional[IOPool] = None
+_pool_lock = threading.Lock()
+
+
+def io_pool() -> IOPool:
+    """Process-wide pool, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = IOPool()
+        return _pool
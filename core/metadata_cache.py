@@ -0,0 +1,217 @@
+"""Persistent metadata cache for yt-dlp info dicts.
+
+Entries are keyed by YouTube video ID and split into two field classes with
+their own TTLs: stream/format data (expires quickly) and static metadata such
+as title, thumbnails and chapters (lives long). Size is capped with LRU
+eviction on last access.
+
+get() requires fresh formats by default. Callers that only show labels pass
+include_formats=False (InfoFetch/BatchInfoFetch include_formats; Step 1's
+selection batch, adding a link from the main window) and are served from the
+static tier after the formats expired.
+"""
+
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import Optional
+
+from core.settings import SETTINGS_DIR
+
+CACHE_PATH = os.path.join(SETTINGS_DIR, "metadata_cache.sqlite3")
+
+# Defaults (seconds)
+FORMATS_TTL = 30 * 60  # signed stream URLs expire after a few hours
+STATIC_TTL = 7 * 24 * 3600
+MAX_ENTRIES = 2000
+
+# Fields that depend on signed stream URLs / format selection
+_VOLATILE_KEYS = (
+    "formats",
+    "requested_formats",
+    "requested_downloads",
+    "requested_subtitles",
+    "url",
+    "manifest_url",
+    "fragments",
+    "fragment_base_url",
+    "http_headers",
+    "format",
+    "format_id",
+    "format_note",
+    "protocol",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    video_id TEXT PRIMARY KEY,
+    static_json TEXT NOT NULL,
+    static_ts REAL NOT NULL,
+    formats_json TEXT,
+    formats_ts REAL,
+    last_access REAL NOT NULL
+)
+"""
+
+
+def _cacheable(info: dict) -> bool:
+    if not isinstance(info, dict) or not info.get("id"):
+        return False
+    if info.get("_type") not in (None, "video"):
+        return False
+    # Live/upcoming streams change formats constantly
+    if info.get("is_live") or info.get("live_status") in ("is_live", "is_upcoming"):
+        return False
+    return True
+
+
+class MetadataCache:
+    def __init__(
+        self,
+        path: str = CACHE_PATH,
+        max_entries: int = MAX_ENTRIES,
+        formats_ttl: float = FORMATS_TTL,
+        static_ttl: float = STATIC_TTL,
+    ):
+        self.path = path
+        self.max_entries = max(1, int(max_entries))
+        self.formats_ttl = formats_ttl
+        self.static_ttl = static_ttl
+        self._lock = Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            except Exception:
+                pass
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, video_id: str, include_formats: bool = True) -> Optional[dict]:
+        """Cached info for video_id, or None when missing/expired.
+
+        With include_formats=False only the long-lived fields are required.
+        """
+        if not video_id:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                db = self._db()
+                row = db.execute(
+                    "SELECT static_json, static_ts, formats_json, formats_ts "
+                    "FROM entries WHERE video_id = ?",
+                    (video_id,),
+                ).fetchone()
+                if not row:
+                    return None
+                static_json, static_ts, formats_json, formats_ts = row
+                if now - static_ts > self.static_ttl:
+                    db.execute("DELETE FROM entries WHERE video_id = ?", (video_id,))
+                    db.commit()
+                    return None
+                formats_fresh = bool(
+                    formats_json and formats_ts and now - formats_ts <= self.formats_ttl
+                )
+                if include_formats and not formats_fresh:
+                    return None
+                db.execute(
+                    "UPDATE entries SET last_access = ? WHERE video_id = ?",
+                    (now, video_id),
+                )
+                db.commit()
+            info = json.loads(static_json)
+            if formats_fresh:
+                info.update(json.loads(formats_json))
+            return info
+        except Exception:
+            return None
+
+    def put(self, info: dict) -> None:
+        if not _cacheable(info):
+            return
+        volatile = {k: info[k] for k in _VOLATILE_KEYS if k in info}
+        static = {k: v for k, v in info.items() if k not in _VOLATILE_KEYS}
+        now = time.time()
+        try:
+            static_json = json.dumps(static, default=str)
+            formats_json = json.dumps(volatile, default=str) if volatile else None
+            with self._lock:
+                db = self._db()
+                db.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(video_id, static_json, static_ts, formats_json, formats_ts, "
+                    "last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        str(info["id"]),
+                        static_json,
+                        now,
+                        formats_json,
+                        now if formats_json else None,
+                        now,
+                    ),
+                )
+                self._evict(db)
+                db.commit()
+        except Exception:
+            pass
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        (count,) = db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        extra = count - self.max_entries
+        if extra > 0:
+            db.execute(
+                "DELETE FROM entries WHERE video_id IN ("
+                "SELECT video_id FROM entries ORDER BY last_access ASC LIMIT ?)",
+                (extra,),
+            )
+
+    def invalidate(self, video_id: str) -> None:
+        try:
+            with self._lock:
+                db = self._db()
+                db.execute("DELETE FROM entries WHERE video_id = ?", (video_id,))
+                db.commit()
+        except Exception:
+            pass
+
+    def clear(self) -> None:
+        try:
+            with self._lock:
+                db = self._db()
+                db.execute("DELETE FROM entries")
+                db.commit()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
+
+
+_default_cache: Optional[MetadataCache] = None
+_default_lock = Lock()
+
+
+def metadata_cache() -> MetadataCache:
+    """Process-wide cache instance stored under the settings dir."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = MetadataCache()
+        return _default_cache
@@ -54,12 +54,30 @@ class NotificationSpec:
     sticky: bool = False
 
 
+class DownloadState(str, Enum):
+    CREATED = "CREATED"
+    DOWNLOADING = "DOWNLOADING"
+    DOWNLOADED = "DOWNLOADED"  # pipelined: streams fetched, conversion pending
+    CONVERTING = "CONVERTING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+    def __str__(self) -> str:
+        # Return the raw value for friendlier serialization and tests
+        return str(self.value)
+
+
 @dataclass
 class DownloadItem:
     source_url: str
     normalized_url: str
     target_format: str
     output_path: Optional[str] = None
-    state: str = "CREATED"  # consider enum later
+    state: str = DownloadState.CREATED.value
     progress: float = 0.0
     error: Optional[str] = None
+    # Resume point of the partial download (bytes already on disk)
+    downloaded_bytes: int = 0
+    total_bytes: int = 0
+    # Pipelined downloads: info JSON handed from download to convert stage
+    info_json: Optional[str] = None
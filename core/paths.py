@@ -0,0 +1,24 @@
+"""Install locations of the bundled tools (no Qt, no heavy imports).
+
+core.update and core.ffmpeg_manager re-export these for existing imports;
+headless code reads them from here so it never pulls in PyQt6.
+"""
+
+import os
+import sys
+
+if getattr(sys, "frozen", False):
+    ROOT_DIR = os.path.dirname(sys.executable)
+else:
+    ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+YTDLP_DIR = os.path.join(ROOT_DIR, "yt-dlp-bin")
+YTDLP_EXE = os.path.join(YTDLP_DIR, "yt-dlp.exe")
+# zipimport build of the same release; warm extraction workers import yt_dlp
+# from it so they run the updated code, not the copy frozen into the app
+YTDLP_MODULE = os.path.join(YTDLP_DIR, "yt-dlp.pyz")
+
+# Install into a dedicated subfolder under the app root
+FF_DIR = os.path.join(ROOT_DIR, "ffmpeg")
+FF_EXE = os.path.join(FF_DIR, "ffmpeg.exe")
+FP_EXE = os.path.join(FF_DIR, "ffprobe.exe")
@@ -0,0 +1,123 @@
+"""Cached results of probing the bundled tools (e.g. `yt-dlp --version`).
+
+A result belongs to one exact file. Entries are keyed by probe and path and
+checked against the file's size and mtime; when those changed, the file's
+SHA-256 decides (a copy or touch with the same bytes keeps the result)
+before the tool is run again. Failed probes are not stored.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+from threading import Lock
+from typing import Callable, Dict, Optional
+
+from core.settings import SETTINGS_DIR
+
+CACHE_PATH = os.path.join(SETTINGS_DIR, "probe_cache.json")
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ProbeCache:
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self._lock = Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=1)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # next start probes again
+
+    @staticmethod
+    def _key(probe: str, exe: str) -> str:
+        return f"{probe}:{os.path.normcase(os.path.abspath(exe))}"
+
+    def get(self, probe: str, exe: str) -> Optional[str]:
+        """The stored result while exe is still the file it was probed on."""
+        try:
+            st = os.stat(exe)
+        except OSError:
+            return None
+        key = self._key(probe, exe)
+        with self._lock:
+            entry = self._load().get(key)
+            if not isinstance(entry, dict):
+                return None
+            stamp = (entry.get("size"), entry.get("mtime_ns"))
+            if stamp == (st.st_size, st.st_mtime_ns):
+                return entry.get("value")
+            if entry.get("size") != st.st_size:
+                return None
+        # Same size, new mtime: hash outside the lock (large binaries)
+        try:
+            digest = file_sha256(exe)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._load().get(key)
+            if not isinstance(entry, dict) or entry.get("sha256") != digest:
+                return None
+            entry["mtime_ns"] = st.st_mtime_ns
+            self._save()
+            return entry.get("value")
+
+    def put(self, probe: str, exe: str, value: str):
+        try:
+            st = os.stat(exe)
+            digest = file_sha256(exe)
+        except OSError:
+            return
+        with self._lock:
+            self._load()[self._key(probe, exe)] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "sha256": digest,
+                "value": value,
+            }
+            self._save()
+
+    def cached(self, probe: str, exe: str, run: Callable[[], str]) -> str:
+        """Stored result for exe, else run() (stored when not empty)."""
+        value = self.get(probe, exe)
+        if value is not None:
+            return value
+        value = run()
+        if value:
+            self.put(probe, exe, value)
+        return value
+
+
+_cache: Optional[ProbeCache] = None
+_cache_lock = Lock()
+
+
+def probe_cache() -> ProbeCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ProbeCache()
+        return _cache
@@ -0,0 +1,289 @@
+"""Suspend/resume child processes (yt-dlp binary and the ffmpeg it spawns).
+
+A suspended process is not scheduled at all, so it stops reading from its
+sockets and its bandwidth and CPU drop to zero; resuming continues exactly
+where it was. POSIX uses SIGSTOP/SIGCONT on the child's process group.
+
+On Windows the whole tree matters too: yt-dlp.exe is a PyInstaller onefile
+build, so the spawned pid is only the bootloader and the download runs in a
+child it starts (plus ffmpeg). The child is created suspended, put in its own
+Job Object (which every process it starts joins) and only then let run;
+suspend/resume walk the job's process list and stop kills the job. When the
+job cannot be set up, holds_tree() is False and callers fall back to killing
+the process and continuing the .part file later.
+"""
+
+from __future__ import annotations
+import os
+import signal
+import subprocess
+import weakref
+from typing import Dict, List, Optional
+
+CREATE_SUSPENDED = 0x00000004
+
+
+def popen_kwargs(base: Optional[Dict] = None) -> Dict:
+    """Popen kwargs so the child (and its children) can be signalled.
+
+    base (e.g. hidden-window kwargs) is merged; call track_process() on the
+    started process, which on Windows also lets it run.
+    """
+    kwargs = dict(base or {})
+    if os.name == "nt":
+        flags = kwargs.get("creationflags", 0)
+        kwargs["creationflags"] = flags | CREATE_SUSPENDED
+        return kwargs
+    # Own process group: SIGSTOP/SIGKILL also reach ffmpeg spawned by yt-dlp
+    kwargs["start_new_session"] = True
+    return kwargs
+
+
+# ----- Windows: one Job Object per tracked process -----
+
+PROCESS_TERMINATE = 0x0001
+PROCESS_SET_QUOTA = 0x0100
+PROCESS_SUSPEND_RESUME = 0x0800
+JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x00002000
+JobObjectBasicProcessIdList = 3
+JobObjectExtendedLimitInformation = 9
+MAX_JOB_PIDS = 256
+
+
+def _nt_call(pid: int, fn_name: str) -> bool:
+    import ctypes
+
+    k32 = ctypes.windll.kernel32
+    handle = k32.OpenProcess(PROCESS_SUSPEND_RESUME, False, pid)
+    if not handle:
+        return False
+    try:
+        return getattr(ctypes.windll.ntdll, fn_name)(handle) == 0
+    finally:
+        k32.CloseHandle(handle)
+
+
+class _Job:
+    """A Job Object holding one child tree; closing it kills what is left."""
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class IO_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                (n, ctypes.c_ulonglong) for n in ("r", "w", "o", "rb", "wb", "ob")
+            ]
+
+        class BASIC_LIMIT(ctypes.Structure):
+            _fields_ = [
+                ("PerProcessUserTimeLimit", ctypes.c_int64),
+                ("PerJobUserTimeLimit", ctypes.c_int64),
+                ("LimitFlags", wintypes.DWORD),
+                ("MinimumWorkingSetSize", ctypes.c_size_t),
+                ("MaximumWorkingSetSize", ctypes.c_size_t),
+                ("ActiveProcessLimit", wintypes.DWORD),
+                ("Affinity", ctypes.c_size_t),
+                ("PriorityClass", wintypes.DWORD),
+                ("SchedulingClass", wintypes.DWORD),
+            ]
+
+        class EXTENDED_LIMIT(ctypes.Structure):
+            _fields_ = [
+                ("BasicLimitInformation", BASIC_LIMIT),
+                ("IoInfo", IO_COUNTERS),
+                ("ProcessMemoryLimit", ctypes.c_size_t),
+                ("JobMemoryLimit", ctypes.c_size_t),
+                ("PeakProcessMemoryUsed", ctypes.c_size_t),
+                ("PeakJobMemoryUsed", ctypes.c_size_t),
+            ]
+
+        self._k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._k32.CreateJobObjectW.restype = wintypes.HANDLE
+        self._k32.OpenProcess.restype = wintypes.HANDLE
+        self.handle = self._k32.CreateJobObjectW(None, None)
+        if not self.handle:
+            raise OSError(ctypes.get_last_error(), "CreateJobObject failed")
+        info = EXTENDED_LIMIT()
+        info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+        self._k32.SetInformationJobObject(
+            wintypes.HANDLE(self.handle),
+            JobObjectExtendedLimitInformation,
+            ctypes.byref(info),
+            ctypes.sizeof(info),
+        )
+
+    def assign(self, pid: int) -> bool:
+        from ctypes import wintypes
+
+        access = PROCESS_SET_QUOTA | PROCESS_TERMINATE
+        proc = self._k32.OpenProcess(access, False, pid)
+        if not proc:
+            return False
+        try:
+            return bool(
+                self._k32.AssignProcessToJobObject(
+                    wintypes.HANDLE(self.handle), wintypes.HANDLE(proc)
+                )
+            )
+        finally:
+            self._k32.CloseHandle(wintypes.HANDLE(proc))
+
+    def pids(self) -> List[int]:
+        import ctypes
+        from ctypes import wintypes
+
+        class PID_LIST(ctypes.Structure):
+            _fields_ = [
+                ("NumberOfAssignedProcesses", wintypes.DWORD),
+                ("NumberOfProcessIdsInList", wintypes.DWORD),
+                ("ProcessIdList", ctypes.c_size_t * MAX_JOB_PIDS),
+            ]
+
+        info = PID_LIST()
+        ok = self._k32.QueryInformationJobObject(
+            wintypes.HANDLE(self.handle),
+            JobObjectBasicProcessIdList,
+            ctypes.byref(info),
+            ctypes.sizeof(info),
+            None,
+        )
+        if not ok:
+            return []
+        return [int(p) for p in info.ProcessIdList[: info.NumberOfProcessIdsInList]]
+
+    def call_all(self, fn_name: str) -> bool:
+        # A process started between listing and suspending is caught by the
+        # second pass; resume needs one pass only
+        done = set()
+        for _ in range(2 if fn_name == "NtSuspendProcess" else 1):
+            for pid in self.pids():
+                if pid not in done and _nt_call(pid, fn_name):
+                    done.add(pid)
+        return bool(done)
+
+    def terminate(self) -> bool:
+        from ctypes import wintypes
+
+        return bool(self._k32.TerminateJobObject(wintypes.HANDLE(self.handle), 1))
+
+    def close(self):
+        if self.handle:
+            from ctypes import wintypes
+
+            self._k32.CloseHandle(wintypes.HANDLE(self.handle))
+            self.handle = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# Popen -> its job; dropped (and the job closed) with the Popen object
+_jobs: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_job_failed = False
+
+
+def track_process(proc: subprocess.Popen) -> bool:
+    """Put a child started with popen_kwargs() under tree control.
+
+    On Windows the child is placed in a new Job Object and resumed (it was
+    created suspended); returns holds_tree(proc).
+    """
+    global _job_failed
+    if os.name != "nt":
+        return True
+    try:
+        job = _Job()
+        if job.assign(proc.pid):
+            _jobs[proc] = job
+        else:
+            job.close()
+    except Exception:
+        pass
+    if proc not in _jobs:
+        _job_failed = True
+    # Created suspended: let it run whether or not it is in a job
+    try:
+        resumed = _nt_call(proc.pid, "NtResumeProcess")
+    except Exception:
+        resumed = False
+    if not resumed:
+        proc.kill()  # would never start; surfaces as a failed attempt
+    return holds_tree(proc)
+
+
+def tree_control_available() -> bool:
+    """False once a Windows child could not be put in a job (see holds_tree)."""
+    return os.name != "nt" or not _job_failed
+
+
+def holds_tree(proc: subprocess.Popen) -> bool:
+    """True when suspend/resume/kill reach every process the child started."""
+    return os.name != "nt" or proc in _jobs
+
+
+def _signal_group(proc: subprocess.Popen, sig) -> bool:
+    try:
+        pgid = os.getpgid(proc.pid)
+        # Never signal our own group (child started without popen_kwargs())
+        if pgid != os.getpgrp():
+            os.killpg(pgid, sig)
+            return True
+    except Exception:
+        pass
+    try:
+        os.kill(proc.pid, sig)
+        return True
+    except Exception:
+        return False
+
+
+def _nt_tree_call(proc: subprocess.Popen, fn_name: str) -> bool:
+    job = _jobs.get(proc)
+    try:
+        if job is not None:
+            return job.call_all(fn_name)
+        return _nt_call(proc.pid, fn_name)
+    except Exception:
+        return False
+
+
+def suspend_process(proc: subprocess.Popen) -> bool:
+    """Suspend the child; on Windows only True when the whole tree is held."""
+    if proc is None or proc.poll() is not None:
+        return False
+    if os.name == "nt":
+        # The bootloader alone would not stop the download
+        return holds_tree(proc) and _nt_tree_call(proc, "NtSuspendProcess")
+    return _signal_group(proc, signal.SIGSTOP)
+
+
+def resume_process(proc: subprocess.Popen) -> bool:
+    if proc is None or proc.poll() is not None:
+        return False
+    if os.name == "nt":
+        return _nt_tree_call(proc, "NtResumeProcess")
+    return _signal_group(proc, signal.SIGCONT)
+
+
+def kill_process(proc: subprocess.Popen) -> None:
+    """Kill the child and its tree; works on suspended processes too."""
+    if proc is None or proc.poll() is not None:
+        return
+    if os.name != "nt":
+        if _signal_group(proc, signal.SIGKILL):
+            return
+    else:
+        job = _jobs.get(proc)
+        try:
+            if job is not None and job.terminate():
+                return
+        except Exception:
+            pass
+    try:
+        proc.kill()
+    except Exception:
+        pass
@@ -0,0 +1,104 @@
+"""Frame-batched delivery of Downloader progress to the UI.
+
+Downloader signals are connected with DirectConnection, so each progress,
+status or stage change only updates a per-item snapshot under a lock on the
+worker thread; nothing is posted to the GUI event queue per event. A timer
+on the GUI thread drains the snapshot once per frame and emits a single
+``batchReady`` with the values that changed since the last frame, in arrival
+order per item, so status text set after a progress update still wins.
+"""
+
+from __future__ import annotations
+import itertools
+import threading
+from typing import Dict, List, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+# Defaults
+FRAME_MS = 33  # ~30 UI updates per second at most
+
+# Snapshot fields
+STAGE = "stage"
+PROGRESS = "progress"  # (percent, speed, eta)
+STATUS = "status"
+
+
+class ProgressAggregator(QObject):
+    # {idx: [(field, value), ...]} with only changed values, oldest first
+    batchReady = pyqtSignal(object)
+
+    def __init__(self, interval_ms: int = FRAME_MS, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._pending: Dict[int, Dict[str, Tuple[int, object]]] = {}
+        self._applied: Dict[Tuple[int, str], object] = {}
+        self._source = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(interval_ms)))
+        self._timer.timeout.connect(self.flush)
+
+    def attach(self, downloader):
+        """Take over downloader's per-item signals (call on the GUI thread)."""
+        self.detach()
+        self.reset()
+        self._source = downloader
+        direct = Qt.ConnectionType.DirectConnection
+        downloader.itemProgress.connect(self._on_progress, direct)
+        downloader.itemStatus.connect(self._on_status, direct)
+        downloader.itemStage.connect(self._on_stage, direct)
+        self._timer.start()
+
+    def detach(self):
+        src, self._source = self._source, None
+        self._timer.stop()
+        if src is None:
+            return
+        for sig, slot in (
+            (src.itemProgress, self._on_progress),
+            (src.itemStatus, self._on_status),
+            (src.itemStage, self._on_stage),
+        ):
+            try:
+                sig.disconnect(slot)
+            except Exception:
+                pass
+
+    def reset(self):
+        """Drop pending and remembered values (e.g. after the list is rebuilt)."""
+        with self._lock:
+            self._pending.clear()
+            self._applied.clear()
+
+    def flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            batch: Dict[int, List[Tuple[str, object]]] = {}
+            for idx, fields in pending.items():
+                changes = []
+                for field, (_, value) in sorted(fields.items(), key=lambda f: f[1][0]):
+                    if self._applied.get((idx, field), self) == value:
+                        continue
+                    self._applied[(idx, field)] = value
+                    changes.append((field, value))
+                if changes:
+                    batch[idx] = changes
+        if batch:
+            self.batchReady.emit(batch)
+
+    # ----- worker-thread intake -----
+    def _record(self, idx: int, field: str, value):
+        with self._lock:
+            self._pending.setdefault(idx, {})[field] = (next(self._seq), value)
+
+    def _on_progress(self, idx: int, percent: float, speed, eta):
+        self._record(idx, PROGRESS, (percent, speed, eta))
+
+    def _on_status(self, idx: int, text: str):
+        self._record(idx, STATUS, text)
+
+    def _on_stage(self, idx: int, stage: str):
+        self._record(idx, STAGE, stage)
@@ -0,0 +1,171 @@
+"""Structured progress stream for the yt-dlp binary.
+
+yt-dlp prints one line per download chunk and one per postprocessor step
+using fixed templates, so the reader never has to guess from free text:
+
+    @D|<downloaded>|<total>|<total_estimate>|<speed>|<eta>
+    @P|<status>|<postprocessor>
+
+The parser works on raw stdout bytes: lines are split in a bytearray and
+numbers are parsed straight from bytes, so ordinary progress lines are never
+decoded or lowercased. Everything else is dropped except ``ERROR:`` lines,
+which become the item's error text.
+
+ProgressCoalescer limits progress events to a UI frame rate per item (the
+latest event wins); stage and error events are never coalesced.
+"""
+
+from __future__ import annotations
+import time
+from typing import Dict, Hashable, List, NamedTuple, Optional, Union
+
+# Defaults
+PROGRESS_HZ = 10.0  # progress updates per second per item sent to the UI
+READ_SIZE = 64 * 1024
+
+_DL = b"@D|"
+_PP = b"@P|"
+_ERROR = b"ERROR:"
+
+PROGRESS_TEMPLATE_ARGS = [
+    "--progress-template",
+    "download:@D|%(progress.downloaded_bytes)s|%(progress.total_bytes)s"
+    "|%(progress.total_bytes_estimate)s|%(progress.speed)s|%(progress.eta)s",
+    "--progress-template",
+    "postprocess:@P|%(progress.status)s|%(progress.postprocessor)s",
+]
+
+# Postprocessor key -> status text shown while it runs
+_PP_LABELS = {
+    "SponsorBlock": "Removing segments…",
+    "ModifyChapters": "Removing segments…",
+    "ExtractAudio": "Converting audio…",
+    "Merger": "Merging…",
+    "VideoRemuxer": "Merging…",
+    "EmbedSubtitle": "Embedding subtitles…",
+}
+# Bookkeeping steps that run for every item and are not worth a status
+_PP_SILENT = frozenset({"MoveFilesAfterDownload"})
+
+
+class ProgressEvent(NamedTuple):
+    downloaded: float
+    total: float  # 0 while neither the size nor an estimate is known
+    speed: Optional[float]  # None while yt-dlp is still measuring
+    eta: Optional[int]  # None while yt-dlp is still estimating
+
+    @property
+    def percent(self) -> float:
+        return self.downloaded / self.total * 100.0 if self.total > 0 else 0.0
+
+
+class StageEvent(NamedTuple):
+    status: str  # "started" | "processing" | "finished"
+    postprocessor: str
+
+    @property
+    def label(self) -> str:
+        """Status text for a starting step ("" when it is not shown)."""
+        if self.status != "started" or self.postprocessor in _PP_SILENT:
+            return ""
+        return _PP_LABELS.get(self.postprocessor, "Processing…")
+
+
+class ErrorEvent(NamedTuple):
+    message: str
+
+
+Event = Union[ProgressEvent, StageEvent, ErrorEvent]
+
+
+def _num(raw: bytes) -> Optional[float]:
+    try:
+        return float(raw)  # float() takes ASCII bytes directly
+    except ValueError:
+        return None  # "NA" / "None" before yt-dlp knows the value
+
+
+def parse_line(line: bytes) -> Optional[Event]:
+    if line.startswith(_DL):
+        parts = line.split(b"|")
+        if len(parts) != 6:
+            return None
+        downloaded = _num(parts[1])
+        total = _num(parts[2])
+        if total is None:
+            total = _num(parts[3])
+        eta = _num(parts[5])
+        return ProgressEvent(
+            downloaded if downloaded is not None else 0.0,
+            total if total is not None else 0.0,
+            _num(parts[4]),
+            int(eta) if eta is not None else None,
+        )
+    if line.startswith(_PP):
+        parts = line.split(b"|")
+        if len(parts) != 3:
+            return None
+        return StageEvent(parts[1].decode("ascii", "replace"), parts[2].decode())
+    if line.startswith(_ERROR):
+        return ErrorEvent(line[len(_ERROR) :].decode("utf-8", "replace").strip())
+    return None
+
+
+class ProgressStreamParser:
+    """Incremental parser: feed stdout chunks, get the complete events."""
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def feed(self, data: bytes) -> List[Event]:
+        buf = self._buf
+        buf += data
+        events = []
+        start = 0
+        while True:
+            end = buf.find(b"\n", start)
+            if end < 0:
+                break
+            if buf.startswith((_DL, _PP, _ERROR), start):
+                ev = parse_line(bytes(buf[start:end]).rstrip(b"\r"))
+                if ev is not None:
+                    events.append(ev)
+            start = end + 1
+        del buf[:start]
+        return events
+
+    def close(self) -> List[Event]:
+        """Parse a trailing line that had no newline."""
+        if not self._buf:
+            return []
+        events = self.feed(b"\n")
+        self._buf.clear()
+        return events
+
+
+class ProgressCoalescer:
+    """Per-key progress rate limit; a key must only be used by one thread."""
+
+    def __init__(self, hz: float = PROGRESS_HZ):
+        self.interval = 1.0 / hz if hz and hz > 0 else 0.0
+        self._last: Dict[Hashable, float] = {}
+        self._pending: Dict[Hashable, ProgressEvent] = {}
+
+    def offer(self, key: Hashable, ev: ProgressEvent) -> Optional[ProgressEvent]:
+        """The event to emit now, or None if it was held back."""
+        if not self.interval:
+            return ev
+        now = time.monotonic()
+        if now - self._last.get(key, 0.0) < self.interval:
+            self._pending[key] = ev
+            return None
+        self._last[key] = now
+        self._pending.pop(key, None)
+        return ev
+
+    def flush(self, key: Hashable) -> Optional[ProgressEvent]:
+        """Latest held-back event for key (e.g. before a stage change)."""
+        ev = self._pending.pop(key, None)
+        if ev is not None:
+            self._last[key] = time.monotonic()
+        return ev
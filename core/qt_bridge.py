@@ -0,0 +1,91 @@
+"""Qt side of core.runtime: workers whose body is a coroutine.
+
+RuntimeWorker keeps the QThread surface the widgets already use (start,
+isRunning, wait, finished, requestInterruption) but owns no thread; main()
+runs on the shared runtime loop. Signals emitted from main() are queued to
+the receivers' (GUI) thread by Qt. Cancelling cancels the coroutine, which
+kills child processes and stops cooperative blocking work.
+"""
+
+from __future__ import annotations
+import abc
+import asyncio
+import concurrent.futures
+from typing import Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from core.logging import logger
+from core.runtime import runtime
+
+
+class _QObjectABCMeta(type(QObject), abc.ABCMeta):
+    pass
+
+
+class RuntimeWorker(QObject, metaclass=_QObjectABCMeta):
+    """Subclasses implement main(); one without it cannot be constructed
+    (TypeError on the caller's thread, not a silent failure on the loop)."""
+
+    # After main() returned, failed or was cancelled (like QThread.finished)
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._future: Optional[concurrent.futures.Future] = None
+
+    @abc.abstractmethod
+    async def main(self) -> None:
+        """The worker's body; runs on the runtime loop."""
+
+    async def _main(self):
+        try:
+            await self.main()
+        except asyncio.CancelledError:
+            pass
+        except RuntimeError:
+            # Emitting on a worker whose C++ side was deleted while running;
+            # anything else is a real error from main()
+            if not sip.isdeleted(self):
+                logger.exception("%s.main() failed", type(self).__name__)
+                raise
+        except Exception:
+            logger.exception("%s.main() failed", type(self).__name__)
+            raise
+        finally:
+            try:
+                self.finished.emit()
+            except RuntimeError:
+                pass
+
+    def start(self):
+        if self.isRunning():
+            return
+        self._future = runtime().submit(self._main())
+
+    def isRunning(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def isFinished(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def wait(self, msecs: Optional[int] = None) -> bool:
+        if self._future is None:
+            return True
+        try:
+            self._future.result(None if msecs is None else msecs / 1000)
+        except concurrent.futures.TimeoutError:
+            return False
+        except BaseException:
+            pass
+        return True
+
+    def cancel(self):
+        """Cancel the running coroutine (no signals but finished follow)."""
+        if self._future is not None:
+            self._future.cancel()
+
+    # QThread-compatible names used by existing callers
+    requestInterruption = cancel
+    terminate = cancel
@@ -0,0 +1,154 @@
+"""Background asyncio runtime for network and subprocess work.
+
+One event loop runs in a daemon thread. Work is written as coroutines and
+scheduled with submit(); cancelling the returned future from any thread
+cancels the coroutine, and with it everything it awaits:
+
+- run_process(): subprocess without a waiting thread; killed on cancel or
+  timeout
+- run_blocking(): blocking call (yt-dlp's Python API, file downloads) on a
+  small shared executor, so large batches queue instead of spawning
+  threads. With cancellable=True the call receives a threading.Event that is
+  set on cancel and should be checked between chunks.
+- limit(): named semaphores shared by every caller ("process", "metadata")
+
+Qt-free; core.qt_bridge delivers results to the GUI thread.
+"""
+
+from __future__ import annotations
+import asyncio
+import concurrent.futures
+import functools
+import subprocess
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+# Defaults
+BLOCKING_WORKERS = 8
+LIMITS = {
+    "process": 8,  # concurrent child processes started through run_process
+    "metadata": 8,  # concurrent metadata extractions across all callers
+}
+
+
+class Cancelled(Exception):
+    """Raised by cooperative blocking work once its cancel event is set."""
+
+
+class Runtime:
+    def __init__(self, blocking_workers: int = BLOCKING_WORKERS):
+        self._loop = asyncio.new_event_loop()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, blocking_workers), thread_name_prefix="ytc-blocking"
+        )
+        self._loop.set_default_executor(self._executor)
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(ready,), name="ytc-runtime", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+
+    def _run(self, ready: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(ready.set)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def in_loop(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """Schedule coro on the loop; cancel() on the result cancels it."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Blocking helper for non-loop threads: submit and wait."""
+        if self.in_loop():
+            raise RuntimeError("Runtime.run() called from the runtime thread")
+        fut = self.submit(coro)
+        try:
+            return fut.result(timeout)
+        except concurrent.futures.TimeoutError:
+            fut.cancel()
+            raise TimeoutError("Timed out") from None
+
+    def limit(self, name: str) -> asyncio.Semaphore:
+        """Named semaphore shared by all callers (use on the loop only)."""
+        sem = self._limits.get(name)
+        if sem is None:
+            sem = self._limits[name] = asyncio.Semaphore(LIMITS.get(name, 4))
+        return sem
+
+    async def run_blocking(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        timeout: Optional[float] = None,
+        cancellable: bool = False,
+        **kwargs,
+    ) -> Any:
+        """Run fn on the shared executor; cancellable passes cancel=Event."""
+        event = threading.Event() if cancellable else None
+        if event is not None:
+            kwargs["cancel"] = event
+        call = functools.partial(fn, *args, **kwargs)
+        fut = self._loop.run_in_executor(None, call)
+        try:
+            return await asyncio.wait_for(asyncio.shield(fut), timeout)
+        except BaseException:
+            # Cancelled or timed out: tell cooperative work to stop
+            if event is not None:
+                event.set()
+            raise
+
+    async def run_process(
+        self,
+        args: Sequence[str],
+        timeout: Optional[float] = None,
+        limit: Optional[str] = "process",
+        **kwargs,
+    ) -> Tuple[int, bytes, bytes]:
+        """(returncode, stdout, stderr); the child is killed on cancel/timeout."""
+        sem = self.limit(limit) if limit else None
+        if sem is not None:
+            await sem.acquire()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **kwargs,
+            )
+            try:
+                out, err = await asyncio.wait_for(proc.communicate(), timeout)
+            except BaseException:
+                if proc.returncode is None:
+                    try:
+                        proc.kill()
+                    except ProcessLookupError:
+                        pass
+                    await asyncio.shield(proc.wait())
+                raise
+            return proc.returncode, out, err
+        finally:
+            if sem is not None:
+                sem.release()
+
+
+_runtime: Optional[Runtime] = None
+_runtime_lock = threading.Lock()
+
+
+def runtime() -> Runtime:
+    """Process-wide runtime, started on first use."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = Runtime()
+        return _runtime
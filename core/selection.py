@@ -0,0 +1,109 @@
+"""Ordered multi-select state keyed by canonical video ID.
+
+Step 1 compares entries from search results, playlists and pasted links,
+which reference the same video through different URL spellings. Keys are the
+YouTube video ID when one can be derived, else the URL, so membership tests,
+upserts and removals are O(1) while iteration keeps insertion order.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from core.utils_url import _extract_video_id
+
+
+def entry_url(info: Optional[Dict]) -> str:
+    if not isinstance(info, dict):
+        return ""
+    return info.get("webpage_url") or info.get("url") or ""
+
+
+def selection_key(info: Optional[Dict]) -> str:
+    """Canonical key for an entry dict ("" when it has no usable URL/ID)."""
+    url = entry_url(info)
+    if not url:
+        return ""
+    return _extract_video_id(url) or url
+
+
+class SelectionIndex:
+    """Insertion-ordered selection; iterating yields the entry dicts."""
+
+    def __init__(self, entries: Iterable[Dict] = ()):
+        self._items: "OrderedDict[str, Dict]" = OrderedDict()
+        self.extend(entries)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(list(self._items.values()))
+
+    def __contains__(self, info: Dict) -> bool:
+        key = selection_key(info)
+        return bool(key) and key in self._items
+
+    def keys(self) -> List[str]:
+        return list(self._items.keys())
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._items.get(key)
+
+    def upsert(self, info: Dict) -> tuple[str, bool]:
+        """Add info or merge it into the existing entry; returns (key, added)."""
+        key = selection_key(info)
+        if not key:
+            return "", False
+        old = self._items.get(key)
+        if old is None:
+            self._items[key] = info
+            return key, True
+        self._items[key] = {**old, **info}
+        return key, False
+
+    def merge(self, key: str, info: Dict) -> bool:
+        """Merge info into the entry stored under key; False if not selected."""
+        old = self._items.get(key)
+        if old is None:
+            return False
+        self._items[key] = {**old, **info}
+        return True
+
+    def extend(self, entries: Iterable[Dict]) -> List[str]:
+        """Add entries not yet selected (existing ones are left untouched)."""
+        added = []
+        items = self._items
+        for info in entries:
+            key = selection_key(info)
+            if key and key not in items:
+                items[key] = info
+                added.append(key)
+        return added
+
+    def remove(self, info_or_key) -> Optional[str]:
+        if isinstance(info_or_key, str):
+            key = info_or_key
+        else:
+            key = selection_key(info_or_key)
+        if key and self._items.pop(key, None) is not None:
+            return key
+        return None
+
+    def remove_many(self, entries: Iterable[Dict]) -> List[str]:
+        removed = []
+        items = self._items
+        for info in entries:
+            key = selection_key(info)
+            if key and items.pop(key, None) is not None:
+                removed.append(key)
+        return removed
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def to_list(self) -> List[Dict]:
+        return list(self._items.values())
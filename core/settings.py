@@ -110,6 +110,10 @@ class DefaultsSettings:
 class YtDlpSettings:
     auto_update: bool = True
     branch: str = "stable"
+    # Warm extraction processes kept running (0 = spawn yt-dlp per fetch)
+    extraction_workers: int = 2
+    # Metadata requests in flight when resolving a multi-selection
+    metadata_concurrency: int = 4
 
 
 @dataclass
@@ -121,6 +125,21 @@ class AppUpdateSettings:
     )
 
 
+@dataclass
+class DownloadSettings:
+    # Items downloaded at once (0 = pick based on CPU count)
+    max_concurrent: int = 0
+    # Convert finished downloads on a separate pool while the next item downloads
+    pipeline_postprocessing: bool = True
+    # Total download speed in MB/s shared by running items (0 = unlimited)
+    bandwidth_limit_mbps: float = 0.0
+    # Time-of-day caps overriding the one above, first match wins, e.g.
+    # {"start": "09:00", "end": "18:00", "limit_mbps": 2, "days": [0, 1, 2, 3, 4]}
+    bandwidth_schedules: List[dict] = field(default_factory=list)
+    # Progress updates per second per item sent to the list (0 = every chunk)
+    progress_hz: float = 10.0
+
+
 @dataclass
 class EZModeSettings:
     sanitize_radio_links: bool = True
@@ -140,6 +159,7 @@ class AppSettings:
     app: AppUpdateSettings = field(default_factory=AppUpdateSettings)
     # EZ Mode
     ez: EZModeSettings = field(default_factory=EZModeSettings)
+    downloads: DownloadSettings = field(default_factory=DownloadSettings)
     # Unified update configs (distinct) – preferred going forward
     app_update: AppUpdateConfig = field(default_factory=AppUpdateConfig)
     ytdlp_update: YTDLPUpdateConfig = field(default_factory=YTDLPUpdateConfig)
@@ -179,6 +199,7 @@ class SettingsManager:
             ytdlp = YtDlpSettings(**data.get("ytdlp", {}))
             app = AppUpdateSettings(**data.get("app", {}))
             ez = EZModeSettings(**(data.get("ez", {}) or {}))
+            downloads = DownloadSettings(**(data.get("downloads", {}) or {}))
 
             # Migration: create distinct update configs if not present
             if "app_update" in data:
@@ -258,6 +279,7 @@ class SettingsManager:
                 ytdlp=ytdlp,
                 app=app,
                 ez=ez,
+                downloads=downloads,
                 app_update=(
                     AppUpdateConfig(
                         schedule=app_update_cfg.schedule,
@@ -0,0 +1,183 @@
+"""Startup tracing: imports, phases, page construction and the first frame.
+
+main.py wraps its imports, main() and the MainWindow start-up phases
+(settings load, stylesheet, pages) in timed(); finish() runs once the first
+frame is up and logs a one-line summary to app.log. Dependency and update
+checks run after it as "idle" spans (core.idle_tasks). With --startup-report
+(or YTC_STARTUP_REPORT=1) the full table is logged as well, plus idle jobs and
+pages that are only built on first use:
+
+    Startup: first frame at 412.3 ms (import 231.0 ms, page 97.4 ms)
+      import  PyQt6                          at     1.2 ms     38.2 ms
+      phase   MainWindow                     at   240.5 ms    120.9 ms
+      page    Step1LinkWidget                at   300.1 ms     19.1 ms
+      ...
+
+Spans nest (a phase contains the pages it builds); "at" is the start offset.
+--startup-trace FILE (or YTC_STARTUP_TRACE=FILE) also writes the spans as
+Chrome trace JSON (chrome://tracing, ui.perfetto.dev) when the first frame is
+up, rewritten with the idle jobs by update_trace(); benchmarks/startup_bench.py
+reads it.
+
+Only the standard library is imported here, so it can be the first import.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+_T0 = time.perf_counter()
+# Wall clock at _T0, to line the trace up with the launching process
+_T0_EPOCH = time.time()
+
+# (category, name, start, end) in seconds since _T0
+_spans: List[Tuple[str, str, float, float]] = []
+_first_frame: Optional[float] = None
+
+
+def verbose() -> bool:
+    return "--startup-report" in sys.argv[1:] or bool(
+        os.environ.get("YTC_STARTUP_REPORT")
+    )
+
+
+def trace_path() -> Optional[str]:
+    args = sys.argv[1:]
+    for i, arg in enumerate(args):
+        if arg == "--startup-trace" and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith("--startup-trace="):
+            return arg.split("=", 1)[1]
+    return os.environ.get("YTC_STARTUP_TRACE") or None
+
+
+def elapsed_ms() -> float:
+    return (time.perf_counter() - _T0) * 1000
+
+
+@contextmanager
+def timed(category: str, name: str):
+    start = time.perf_counter() - _T0
+    try:
+        yield
+    finally:
+        end = time.perf_counter() - _T0
+        _spans.append((category, name, start, end))
+        if _first_frame is not None and verbose():
+            # After the first frame (idle job, deferred page, first dialog)
+            ms = (end - start) * 1000
+            _log(f"Startup: {category} {name} after first frame {ms:.1f} ms")
+
+
+def spans() -> List[Tuple[str, str, float, float]]:
+    return list(_spans)
+
+
+def totals() -> Dict[str, float]:
+    """Milliseconds per category, up to the first frame if it was reached.
+
+    Phases contain other spans, so they are left out.
+    """
+    out: Dict[str, float] = {}
+    for category, _name, start, end in _spans:
+        if category == "phase":
+            continue
+        if _first_frame is not None and start >= _first_frame:
+            continue
+        out[category] = out.get(category, 0.0) + (end - start) * 1000
+    return out
+
+
+def report() -> str:
+    head = "Startup:"
+    if _first_frame is not None:
+        head += f" first frame at {_first_frame * 1000:.1f} ms"
+    parts = ", ".join(f"{c} {ms:.1f} ms" for c, ms in totals().items())
+    lines = [f"{head} ({parts})" if parts else head]
+    if verbose():
+        for category, name, start, end in sorted(_spans, key=lambda s: s[2]):
+            lines.append(
+                f"  {category:<7} {name:<30} at {start * 1000:8.1f} ms"
+                f" {(end - start) * 1000:8.1f} ms"
+            )
+    return "\n".join(lines)
+
+
+def chrome_trace() -> dict:
+    """The spans as Chrome trace events (complete events, microseconds)."""
+    pid = os.getpid()
+    events = [
+        {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round(start * 1e6),
+            "dur": round((end - start) * 1e6),
+            "pid": pid,
+            "tid": 1,
+        }
+        for category, name, start, end in _spans
+    ]
+    if _first_frame is not None:
+        events.append(
+            {
+                "name": "first frame",
+                "cat": "mark",
+                "ph": "i",
+                "s": "p",
+                "ts": round(_first_frame * 1e6),
+                "pid": pid,
+                "tid": 1,
+            }
+        )
+    first = None if _first_frame is None else round(_first_frame * 1000, 3)
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {"t0_epoch": _T0_EPOCH, "first_frame_ms": first},
+    }
+
+
+def write_chrome_trace(path: str) -> bool:
+    try:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(chrome_trace(), f)
+        # Readers polling for the file never see half of it
+        os.replace(tmp, path)
+        return True
+    except OSError as e:
+        _log(f"Startup: cannot write trace {path}: {e}")
+        return False
+
+
+def finish() -> None:
+    """Mark the first frame, log the report and write the trace if asked;
+    later calls do nothing."""
+    global _first_frame
+    if _first_frame is not None:
+        return
+    _first_frame = time.perf_counter() - _T0
+    _log(report())
+    path = trace_path()
+    if path:
+        write_chrome_trace(path)
+
+
+def update_trace() -> None:
+    """Rewrite the trace (if asked) with the spans recorded since finish()."""
+    path = trace_path()
+    if path and _first_frame is not None:
+        write_chrome_trace(path)
+
+
+def _log(text: str) -> None:
+    try:
+        from core.logging import logger
+
+        logger.info(text)
+    except Exception:
+        pass
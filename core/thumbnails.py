@@ -0,0 +1,269 @@
+"""Shared thumbnail service used by every wizard step.
+
+- Memory: size-bounded LRU of decoded, pre-scaled QImages keyed by (url, size)
+- Disk: content-addressed blobs (sha256 of the bytes) plus a small
+  url -> blob reference file, so identical images are stored once
+- Network: fetches run on the shared I/O pool (core.io_pool); concurrent
+  requests for the same URL are coalesced into one fetch, priority requests
+  jump the queue
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from core import http_client
+from core.io_pool import PREFETCH, VISIBLE, CancelToken, IOPool, io_pool
+from core.settings import SETTINGS_DIR
+
+THUMB_DIR = os.path.join(SETTINGS_DIR, "thumbnails")
+THUMB_SIZE = QSize(96, 54)  # list icon size used across the wizard
+
+# Defaults
+MEMORY_BUDGET_BYTES = 48 * 1024 * 1024
+DISK_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8", "ignore")).hexdigest()
+
+
+class _DiskCache:
+    def __init__(self, root: str = THUMB_DIR, budget: int = DISK_BUDGET_BYTES):
+        self.root = root
+        self.budget = budget
+        self._refs = os.path.join(root, "refs")
+        self._blobs = os.path.join(root, "blobs")
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _ref_path(self, url: str) -> str:
+        return os.path.join(self._refs, _url_key(url))
+
+    def get(self, url: str) -> Optional[bytes]:
+        try:
+            with open(self._ref_path(url), "r", encoding="ascii") as f:
+                digest = f.read().strip()
+            blob = os.path.join(self._blobs, digest)
+            with open(blob, "rb") as f:
+                data = f.read()
+            try:
+                os.utime(blob, None)  # LRU by mtime
+            except Exception:
+                pass
+            return data or None
+        except Exception:
+            return None
+
+    def put(self, url: str, data: bytes) -> None:
+        if not data:
+            return
+        try:
+            digest = hashlib.sha256(data).hexdigest()
+            with self._lock:
+                os.makedirs(self._refs, exist_ok=True)
+                os.makedirs(self._blobs, exist_ok=True)
+                blob = os.path.join(self._blobs, digest)
+                if not os.path.exists(blob):
+                    tmp = f"{blob}.{threading.get_ident()}.tmp"
+                    with open(tmp, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp, blob)
+                with open(self._ref_path(url), "w", encoding="ascii") as f:
+                    f.write(digest)
+                self._writes += 1
+                if self._writes % 50 == 0:
+                    self._trim()
+        except Exception:
+            pass
+
+    def _trim(self) -> None:
+        # Oldest blobs go first; dangling refs are harmless (treated as misses)
+        try:
+            entries = []
+            total = 0
+            for name in os.listdir(self._blobs):
+                p = os.path.join(self._blobs, name)
+                st = os.stat(p)
+                entries.append((st.st_mtime, st.st_size, p))
+                total += st.st_size
+            if total <= self.budget:
+                return
+            for _, size, p in sorted(entries):
+                try:
+                    os.remove(p)
+                    total -= size
+                except Exception:
+                    pass
+                if total <= self.budget * 0.8:
+                    break
+        except Exception:
+            pass
+
+
+_disk = _DiskCache()
+
+
+def fetch_thumbnail_bytes(url: str, timeout: float = 6) -> bytes:
+    """Blocking fetch (disk cache first); safe from any thread. b"" on failure.
+
+    One request: transient failures are retried by the shared HTTP adapter
+    (core.http_client), so a dead URL frees its I/O slot quickly.
+    """
+    if not url:
+        return b""
+    data = _disk.get(url)
+    if data:
+        return data
+    try:
+        r = http_client.get(url, timeout=timeout)
+        if r.ok and r.content:
+            _disk.put(url, r.content)
+            return r.content
+    except Exception:
+        pass
+    return b""
+
+
+def _load_image(url: str) -> QImage:
+    # Runs on the I/O pool: fetch and decode off the GUI thread
+    img = QImage()
+    data = fetch_thumbnail_bytes(url)
+    if data:
+        img.loadFromData(data)
+    return img
+
+
+def _scaled(img: QImage, size: Optional[QSize]) -> QImage:
+    if size is None or img.isNull():
+        return img
+    return img.scaled(
+        size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+class ThumbnailService(QObject):
+    """Async thumbnail loader; callbacks run on the GUI thread with a QPixmap."""
+
+    # Internal: worker -> GUI thread hand-off
+    _loaded = pyqtSignal(str, QImage)
+
+    def __init__(
+        self,
+        pool: Optional[IOPool] = None,
+        memory_budget: int = MEMORY_BUDGET_BYTES,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.memory_budget = memory_budget
+        self._mem: "OrderedDict[Tuple[str, int, int], QImage]" = OrderedDict()
+        self._mem_bytes = 0
+        # url -> [(size, callback)] waiting on one in-flight fetch
+        self._waiters: Dict[str, List[Tuple[Optional[QSize], Callable]]] = {}
+        self._pool = pool or io_pool()
+        # Replaced by cancel_pending(); withdraws every fetch queued before it
+        self._token = CancelToken()
+        self._loaded.connect(self._deliver)
+
+    # ----- memory LRU (GUI thread only) -----
+    @staticmethod
+    def _key(url: str, size: Optional[QSize]) -> Tuple[str, int, int]:
+        if size is None:
+            return (url, 0, 0)
+        return (url, size.width(), size.height())
+
+    def _mem_get(self, key) -> Optional[QImage]:
+        img = self._mem.get(key)
+        if img is not None:
+            self._mem.move_to_end(key)
+        return img
+
+    def _mem_put(self, key, img: QImage) -> None:
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self._mem_bytes -= old.sizeInBytes()
+        self._mem[key] = img
+        self._mem_bytes += img.sizeInBytes()
+        while self._mem_bytes > self.memory_budget and len(self._mem) > 1:
+            _, evicted = self._mem.popitem(last=False)
+            self._mem_bytes -= evicted.sizeInBytes()
+
+    # ----- public API -----
+    def cached(self, url: str, size: Optional[QSize] = THUMB_SIZE) -> Optional[QPixmap]:
+        """Pixmap from the memory cache, or None (never touches disk/network)."""
+        img = self._mem_get(self._key(url, size)) if url else None
+        return QPixmap.fromImage(img) if img is not None else None
+
+    def request(
+        self,
+        url: str,
+        callback: Callable[[QPixmap], None],
+        size: Optional[QSize] = THUMB_SIZE,
+        priority: bool = False,
+    ) -> None:
+        """Deliver the thumbnail to callback; synchronously on a memory hit."""
+        if not url:
+            return
+        px = self.cached(url, size)
+        if px is not None:
+            callback(px)
+            return
+        waiters = self._waiters.get(url)
+        if waiters is not None:
+            # Coalesce onto the in-flight fetch
+            waiters.append((size, callback))
+            if priority:
+                self.prioritize(url)
+            return
+        self._waiters[url] = [(size, callback)]
+        self._pool.submit(
+            ("thumb", url),
+            lambda: _load_image(url),
+            lambda img: self._loaded.emit(url, img or QImage()),
+            priority=VISIBLE if priority else PREFETCH,
+            token=self._token,
+        )
+
+    def prioritize(self, url: str) -> None:
+        """Move a queued fetch to the front (no-op if started or unknown)."""
+        self._pool.prioritize(("thumb", url))
+
+    def cancel_pending(self) -> None:
+        """Withdraw outstanding fetches and drop their callbacks."""
+        self._token.cancel()
+        self._token = CancelToken()
+        self._waiters.clear()
+
+    def _deliver(self, url: str, img: QImage):
+        waiters = self._waiters.pop(url, [])
+        if img.isNull():
+            return
+        for size, cb in waiters:
+            key = self._key(url, size)
+            scaled = self._mem_get(key)
+            if scaled is None:
+                scaled = _scaled(img, size)
+                self._mem_put(key, scaled)
+            try:
+                cb(QPixmap.fromImage(scaled))
+            except Exception:
+                pass
+
+
+_service: Optional[ThumbnailService] = None
+
+
+def thumbnail_service() -> ThumbnailService:
+    """GUI-thread singleton (create after QApplication)."""
+    global _service
+    if _service is None:
+        _service = ThumbnailService()
+    return _service
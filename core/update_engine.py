@@ -0,0 +1,564 @@
+"""Qt-free installs and updates: ffmpeg, the yt-dlp binary and the app.
+
+Each job runs blocking on the calling thread, reports to an UpdateListener
+and stops at the next download chunk once its cancel event is set
+(core.runtime.run_blocking(..., cancellable=True) passes one). The Qt
+workers in core.update and core.ffmpeg_manager wrap these.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import zipfile
+from typing import Optional
+
+from core import http_client
+from core.paths import (
+    FF_DIR,
+    FF_EXE,
+    FP_EXE,
+    ROOT_DIR,
+    YTDLP_DIR,
+    YTDLP_EXE,
+    YTDLP_MODULE,
+)
+from core.runtime import Cancelled
+
+
+class UpdateListener:
+    """Receives job events on the worker thread; the defaults ignore them."""
+
+    def status(self, text: str) -> None:
+        pass
+
+    def progress(self, percent: int) -> None:
+        pass
+
+    # App update finished; changed = an update was staged
+    def updated(self, changed: bool) -> None:
+        pass
+
+    def available(self, remote: str, local: str, notes: str) -> None:
+        pass
+
+
+STAGING_DIR = os.path.join(ROOT_DIR, "_update_staging")
+
+
+def get_latest_release_info(branch: str) -> dict:
+    if branch == "nightly":
+        repo = "yt-dlp/yt-dlp-nightly-builds"
+    elif branch == "master":
+        repo = "yt-dlp/yt-dlp-master-builds"
+    else:
+        repo = "yt-dlp/yt-dlp"
+    api = f"https://api.github.com/repos/{repo}/releases/latest"
+    tag = ""
+    try:
+        r = http_client.get(api, timeout=15)
+        r.raise_for_status()
+        rel = r.json()
+        tag = rel.get("tag_name") or rel.get("name") or ""
+    except Exception:
+        pass
+    # Pinned to the tag when known, so the binary and module always match
+    if tag:
+        base = f"https://github.com/{repo}/releases/download/{tag}"
+    else:
+        base = f"https://github.com/{repo}/releases/latest/download"
+    return {
+        "repo": repo,
+        "api": api,
+        "download_url": f"{base}/yt-dlp.exe",
+        # Platform-independent zipapp: importable as a sys.path entry
+        "module_url": f"{base}/yt-dlp",
+        "tag": tag,
+    }
+
+
+def _hidden_subprocess_kwargs():
+    kwargs = {}
+    if os.name == "nt":
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        si.wShowWindow = 0
+        kwargs["startupinfo"] = si
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    return kwargs
+
+
+def _probe_binary_version() -> str:
+    try:
+        kwargs = _hidden_subprocess_kwargs()
+        out = subprocess.check_output([YTDLP_EXE, "--version"], timeout=10, **kwargs)
+        return (out.decode(errors="ignore").strip().split()[0]) if out else ""
+    except Exception:
+        return ""
+
+
+def current_binary_version() -> str:
+    """Version of the bundled binary; only runs it when the file changed."""
+    if not os.path.exists(YTDLP_EXE):
+        return ""
+    from core.probe_cache import probe_cache
+
+    return probe_cache().cached("version", YTDLP_EXE, _probe_binary_version)
+
+
+def current_module_version(path: str = YTDLP_MODULE) -> str:
+    """Version of the yt-dlp zipimport build ("" when missing or unreadable)."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            text = zf.read("yt_dlp/version.py").decode("utf-8", "replace")
+    except Exception:
+        return ""
+    m = re.search(r"^__version__\s*=\s*['\"]([^'\"]+)['\"]", text, re.M)
+    return m.group(1) if m else ""
+
+
+def ensure_ytdlp_dir():
+    os.makedirs(YTDLP_DIR, exist_ok=True)
+
+
+def clear_ytdlp_cache():
+    try:
+        if os.path.exists(YTDLP_EXE):
+            kwargs = _hidden_subprocess_kwargs()
+            subprocess.run([YTDLP_EXE, "--rm-cache-dir"], timeout=15, **kwargs)
+    except Exception:
+        pass
+
+
+def _download_file(url: str, dest: str, cancel: Optional[threading.Event]):
+    """Stream url to dest via a .tmp file; dest is only replaced when done."""
+    tmp_path = dest + ".tmp"
+    try:
+        with http_client.stream(url) as r:
+            r.raise_for_status()
+            with open(tmp_path, "wb") as f:
+                for chunk in r.iter_content(256 * 1024):
+                    if cancel is not None and cancel.is_set():
+                        raise Cancelled()
+                    if chunk:
+                        f.write(chunk)
+        if os.path.exists(dest):
+            try:
+                os.remove(dest)
+            except Exception:
+                pass
+        os.replace(tmp_path, dest)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except Exception:
+            pass
+        raise
+
+
+def _update_module(
+    rel: dict,
+    version: str,
+    listener: UpdateListener,
+    cancel: Optional[threading.Event],
+) -> bool:
+    """Fetch the zipimport build matching the binary; True if it changed.
+
+    A failed download keeps the previous file; the extraction pool then
+    retires itself if what the workers import is older than the binary.
+    """
+    url = rel.get("module_url")
+    if not url or not version or current_module_version() == version:
+        return False
+    listener.status("Downloading yt-dlp for metadata workers...")
+    try:
+        _download_file(url, YTDLP_MODULE, cancel)
+    except Cancelled:
+        raise
+    except Exception:
+        return False
+    return True
+
+
+def _restart_extraction_pool():
+    # Warm workers restart on the new module (and are retired if older)
+    try:
+        from core.extract_worker import extraction_pool
+
+        extraction_pool().restart()
+    except Exception:
+        pass
+
+
+def update_ytdlp(
+    branch: str = "stable",
+    check_only: bool = True,
+    listener: Optional[UpdateListener] = None,
+    cancel: Optional[threading.Event] = None,
+) -> None:
+    """Check or install the yt-dlp binary; outcome is reported as status text."""
+    listener = listener or UpdateListener()
+    try:
+        ensure_ytdlp_dir()
+        current = current_binary_version()
+        rel = get_latest_release_info(branch)
+        latest = rel.get("tag", "")
+        dl_url = rel.get("download_url")
+        if check_only:
+            if latest and current:
+                if current == latest:
+                    listener.status(f"yt-dlp binary up-to-date ({current})")
+                else:
+                    listener.status(f"yt-dlp binary current {current}; latest {latest}")
+            elif current:
+                listener.status(f"yt-dlp binary current {current}; latest unknown")
+            else:
+                listener.status("yt-dlp binary not installed")
+            return
+        if latest and current and current == latest and os.path.exists(YTDLP_EXE):
+            # Binaries installed before the module existed get it now
+            if _update_module(rel, current, listener, cancel):
+                _restart_extraction_pool()
+            listener.status("yt-dlp is up-to-date.")
+            return
+        if not dl_url:
+            listener.status("Cannot resolve yt-dlp download URL")
+            return
+        listener.status("Downloading yt-dlp binary...")
+        _download_file(dl_url, YTDLP_EXE, cancel)
+        try:
+            os.chmod(YTDLP_EXE, 0o755)
+        except Exception:
+            pass
+        _update_module(rel, latest or current_binary_version(), listener, cancel)
+        listener.status("yt-dlp updated.")
+        clear_ytdlp_cache()
+        _restart_extraction_pool()
+    except Cancelled:
+        pass
+    except Exception as e:
+        listener.status(f"yt-dlp update failed: {e}")
+
+
+FFMPEG_ZIP_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+
+
+def ensure_ffmpeg_in_path() -> bool:
+    # If local exists, ensure PATH includes it
+    if os.path.exists(FF_EXE):
+        add_to_path(FF_DIR)
+        return True
+    # If discoverable in PATH, ok
+    if shutil.which("ffmpeg"):
+        return True
+    return False
+
+
+def add_to_path(directory: str):
+    current = os.environ.get("PATH", "")
+    if directory not in current:
+        os.environ["PATH"] = directory + os.pathsep + current
+
+
+def install_ffmpeg(
+    listener: Optional[UpdateListener] = None,
+    cancel: Optional[threading.Event] = None,
+) -> str:
+    """Download ffmpeg/ffprobe into FF_DIR; returns FF_DIR, raises on failure."""
+    listener = listener or UpdateListener()
+    tmp_zip = ""
+    try:
+        os.makedirs(FF_DIR, exist_ok=True)
+        # Download zip
+        tmp_fd, tmp_zip = tempfile.mkstemp(suffix=".zip")
+        os.close(tmp_fd)
+        with http_client.stream(FFMPEG_ZIP_URL) as r:
+            r.raise_for_status()
+            total = int(r.headers.get("content-length", 0)) or None
+            downloaded = 0
+            with open(tmp_zip, "wb") as f:
+                for chunk in r.iter_content(chunk_size=1024 * 256):
+                    if cancel is not None and cancel.is_set():
+                        raise Cancelled()
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    if total:
+                        downloaded += len(chunk)
+                        listener.progress(int(downloaded * 100 / total))
+        # Extract ffmpeg.exe and ffprobe.exe
+        with zipfile.ZipFile(tmp_zip, "r") as z:
+            names = z.namelist()
+            ffmpeg_name = next(
+                (n for n in names if n.endswith("/bin/ffmpeg.exe")), None
+            )
+            ffprobe_name = next(
+                (n for n in names if n.endswith("/bin/ffprobe.exe")), None
+            )
+            if not ffmpeg_name or not ffprobe_name:
+                raise RuntimeError("ffmpeg.exe or ffprobe.exe not found in archive")
+            z.extract(ffmpeg_name, FF_DIR)
+            z.extract(ffprobe_name, FF_DIR)
+            src_ff = os.path.join(FF_DIR, ffmpeg_name)
+            src_fp = os.path.join(FF_DIR, ffprobe_name)
+            os.makedirs(FF_DIR, exist_ok=True)
+            if os.path.exists(FF_EXE):
+                try:
+                    os.remove(FF_EXE)
+                except Exception:
+                    pass
+            if os.path.exists(FP_EXE):
+                try:
+                    os.remove(FP_EXE)
+                except Exception:
+                    pass
+            os.replace(src_ff, FF_EXE)
+            os.replace(src_fp, FP_EXE)
+            # Cleanup extracted nested dirs
+            top = ffmpeg_name.split("/")[0]
+            top_dir = os.path.join(FF_DIR, top)
+            if os.path.isdir(top_dir):
+                shutil.rmtree(top_dir, ignore_errors=True)
+        add_to_path(FF_DIR)
+        return FF_DIR
+    finally:
+        if tmp_zip and os.path.exists(tmp_zip):
+            try:
+                os.remove(tmp_zip)
+            except Exception:
+                pass
+
+
+class AppUpdate:
+    """Check a GitHub repo for a newer app release; with do_update, stage it
+    under STAGING_DIR to be applied on the next start."""
+
+    def __init__(
+        self,
+        repo: str,
+        channel: str,
+        current_version: str,
+        do_update: bool,
+        listener: Optional[UpdateListener] = None,
+    ):
+        self.repo = repo
+        self.channel = (channel or "release").lower()
+        self.current_version = current_version
+        self.do_update = do_update
+        self.listener = listener or UpdateListener()
+
+    def _local_version(self) -> str:
+        try:
+            vp = os.path.join(ROOT_DIR, "version.txt")
+            if os.path.exists(vp):
+                with open(vp, "r", encoding="utf-8") as f:
+                    return f.read().strip()
+        except Exception:
+            pass
+        return self.current_version or ""
+
+    def _get_release_json(self) -> Optional[dict]:
+        base = f"https://api.github.com/repos/{self.repo}/releases"
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "YoutubeConverter-Updater",
+        }
+
+        from requests.exceptions import RequestException
+
+        def _get(url: str):
+            try:
+                r = http_client.get(url, headers=headers, timeout=20)
+                if r.status_code == 403:
+                    self.listener.status(f"GitHub API rate limited (403) for {url}")
+                elif r.status_code == 404:
+                    self.listener.status(f"Not found (404) for {url}")
+                r.raise_for_status()
+                return r.json()
+            except RequestException as e:
+                self.listener.status(f"GitHub API error: {e}")
+                return None
+
+        if self.channel == "nightly":
+            rel = _get(f"{base}/tags/nightly")
+            if rel:
+                return rel
+            tags = (
+                _get(f"https://api.github.com/repos/{self.repo}/tags?per_page=100")
+                or []
+            )
+            tag = next(
+                (t for t in tags if (t.get("name") or "").lower() == "nightly"), None
+            )
+            if not tag:
+                return None
+            rel = _get(f"{base}/tags/{tag.get('name')}")
+            return rel or {"tag_name": tag.get("name"), "assets": []}
+
+        rels = _get(base) or []
+        if rels:
+            if self.channel == "release":
+                rel = next((x for x in rels if not x.get("prerelease")), None)
+                if rel:
+                    return rel
+            elif self.channel == "prerelease":
+                # Prefer the most recent prerelease that is not literally named 'nightly'
+                rel = next(
+                    (
+                        x
+                        for x in rels
+                        if x.get("prerelease")
+                        and (x.get("tag_name") or "").lower() != "nightly"
+                        and (x.get("name") or "").lower() != "nightly"
+                    ),
+                    None,
+                )
+                if not rel:
+                    # Fallback: any prerelease (maintains behavior if no clean prerelease exists)
+                    rel = next((x for x in rels if x.get("prerelease")), None)
+                if rel:
+                    return rel
+            else:
+                return rels[0]
+
+        tags = _get(f"https://api.github.com/repos/{self.repo}/tags?per_page=100") or []
+        if not tags:
+            return None
+        if self.channel == "release":
+            ver = next(
+                (t for t in tags if (t.get("name") or "").lower().startswith("v")), None
+            )
+            chosen = ver or tags[0]
+        elif self.channel == "prerelease":
+            chosen = next(
+                (t for t in tags if (t.get("name") or "").lower() != "nightly"), tags[0]
+            )
+        else:
+            chosen = tags[0]
+        rel = _get(f"{base}/tags/{chosen.get('name')}")
+        return rel or {"tag_name": chosen.get("name"), "assets": []}
+
+    def _pick_zip_asset(self, rel: dict) -> Optional[dict]:
+        assets = rel.get("assets") or []
+        for a in assets:
+            n = (a.get("name") or "").lower()
+            if n.startswith("youtubeconverter") and n.endswith(".zip"):
+                return a
+        for a in assets:
+            n = (a.get("name") or "").lower()
+            if n.endswith(".zip"):
+                return a
+        return None
+
+    def _extract_zip_flat(self, zip_path: str, dest_dir: str):
+        with zipfile.ZipFile(zip_path) as zf:
+            for m in zf.infolist():
+                name = m.filename.replace("\\", "/")
+                parts = name.split("/")
+                rel = "/".join(parts[1:]) if len(parts) > 1 else parts[0]
+                if not rel or rel.endswith("/"):
+                    continue
+                out_path = os.path.join(dest_dir, rel)
+                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                with zf.open(m) as src, open(out_path, "wb") as dst:
+                    dst.write(src.read())
+
+    @staticmethod
+    def _normalize_version(v: str) -> str:
+        if not v:
+            return ""
+        s = v.strip()
+        if len(s) >= 2 and (s[0] in ("v", "V")) and s[1].isdigit():
+            s = s[1:]
+        return s.strip().lower()
+
+    def run(self, cancel: Optional[threading.Event] = None) -> None:
+        try:
+            self.listener.status(f"Checking app updates from {self.repo}...")
+            rel = self._get_release_json()
+            if not rel:
+                self.listener.status(
+                    f"No releases found for {self.repo} [{self.channel}]."
+                )
+                self.listener.updated(False)
+                return
+            if self.channel == "nightly":
+                tag = rel.get("name") or rel.get("tag_name") or ""
+            else:
+                tag = rel.get("tag_name") or rel.get("name") or ""
+            raw_remote_ver = (tag or "").strip()
+            raw_local_ver = self._local_version()
+
+            remote_ver = self._normalize_version(raw_remote_ver)
+            local_ver = self._normalize_version(raw_local_ver)
+
+            if remote_ver and local_ver and remote_ver == local_ver:
+                self.listener.status(
+                    f"App up-to-date ({raw_local_ver or local_ver}) [{self.channel}]"
+                )
+                self.listener.updated(False)
+                return
+
+            if not self.do_update:
+                if remote_ver and local_ver and remote_ver != local_ver:
+                    self.listener.status(
+                        f"Update available {raw_local_ver or local_ver} -> {raw_remote_ver or remote_ver} [{self.channel}]"
+                    )
+                    body_md = rel.get("body") or ""
+                    # Emit only one detailed signal to prevent duplicate prompts
+                    self.listener.available(
+                        raw_remote_ver or remote_ver,
+                        raw_local_ver or local_ver,
+                        body_md,
+                    )
+                else:
+                    self.listener.status(f"Update check complete [{self.channel}]")
+                self.listener.updated(False)
+                return
+            asset = self._pick_zip_asset(rel)
+            if not asset:
+                self.listener.status("No zip asset found in release.")
+                self.listener.updated(False)
+                return
+
+            url = asset.get("browser_download_url")
+            name = asset.get("name") or "update.zip"
+            self.listener.status(f"Downloading {name}...")
+            os.makedirs(STAGING_DIR, exist_ok=True)
+            tmp_zip = os.path.join(STAGING_DIR, "_update_tmp.zip")
+            with http_client.stream(url) as r:
+                r.raise_for_status()
+                with open(tmp_zip, "wb") as f:
+                    for chunk in r.iter_content(256 * 1024):
+                        if cancel is not None and cancel.is_set():
+                            raise Cancelled()
+                        if chunk:
+                            f.write(chunk)
+
+            self.listener.status("Preparing update...")
+            for root, dirs, files in os.walk(STAGING_DIR):
+                for fn in files:
+                    if fn != "_update_tmp.zip":
+                        try:
+                            os.remove(os.path.join(root, fn))
+                        except Exception:
+                            pass
+            self._extract_zip_flat(tmp_zip, STAGING_DIR)
+            try:
+                os.remove(tmp_zip)
+            except Exception:
+                pass
+            try:
+                with open(os.path.join(STAGING_DIR, ".pending"), "w") as f:
+                    f.write(remote_ver or "")
+            except Exception:
+                pass
+            self.listener.status("Update ready. It will be applied on restart.")
+            self.listener.updated(True)
+        except Cancelled:
+            pass
+        except Exception as e:
+            self.listener.status(f"App update failed: {e}")
+            self.listener.updated(False)
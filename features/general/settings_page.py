@@ -394,6 +394,36 @@ class SettingsPage(QWidget):
         )
         section_dl.add_widget(self.chk_auto_reset_after)
 
+        row_parallel = QHBoxLayout()
+        row_parallel.addWidget(QLabel("Parallel downloads (0 = auto):"))
+        self.spn_parallel_downloads = QSpinBox()
+        self.spn_parallel_downloads.setRange(0, 16)
+        self.spn_parallel_downloads.setValue(
+            int(getattr(getattr(settings, "downloads", None), "max_concurrent", 0))
+        )
+        self.spn_parallel_downloads.setToolTip(
+            "How many items download at the same time. "
+            "Auto picks a value based on your CPU."
+        )
+        row_parallel.addWidget(self.spn_parallel_downloads)
+        section_dl.add_layout(row_parallel)
+
+        self.chk_pipeline_pp = QCheckBox("Convert while the next item downloads")
+        self.chk_pipeline_pp.setChecked(
+            bool(
+                getattr(
+                    getattr(settings, "downloads", None),
+                    "pipeline_postprocessing",
+                    True,
+                )
+            )
+        )
+        self.chk_pipeline_pp.setToolTip(
+            "Run audio extraction, merging and SponsorBlock cutting in a separate "
+            "stage so the network keeps downloading while ffmpeg works."
+        )
+        section_dl.add_widget(self.chk_pipeline_pp)
+
         # Filename template
         lbl_filename = QLabel("Filename template:")
         lbl_filename.setStyleSheet("margin-top: 8px; font-weight: 600;")
@@ -667,6 +697,8 @@ class SettingsPage(QWidget):
             self.chk_auto_search_text,
             self.spn_search_debounce,
             self.chk_auto_reset_after,
+            self.spn_parallel_downloads,
+            self.chk_pipeline_pp,
             self.txt_filename_template,
             self.cmb_notif,
             self.cmb_ytdlp_schedule,
@@ -731,6 +763,13 @@ class SettingsPage(QWidget):
         settings.ui.auto_search_text = self.chk_auto_search_text.isChecked()
         settings.ui.search_debounce_seconds = int(self.spn_search_debounce.value())
         settings.app.auto_reset_after_downloads = self.chk_auto_reset_after.isChecked()
+        try:
+            settings.downloads.max_concurrent = int(self.spn_parallel_downloads.value())
+            settings.downloads.pipeline_postprocessing = (
+                self.chk_pipeline_pp.isChecked()
+            )
+        except Exception:
+            pass
         settings.app.notifications_detail = self.cmb_notif.currentText().lower()
         rev_sched = {0: "off", 1: "launch", 2: "daily", 3: "weekly", 4: "monthly"}
         # Update unified configs first
@@ -1,6 +1,14 @@
 import re
-from typing import Dict, List, Tuple
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QThread
+from typing import Callable, Dict, List, Optional, Tuple
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QSize,
+    QTimer,
+    QPoint,
+    QAbstractListModel,
+    QModelIndex,
+)
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -9,6 +17,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QListWidget,
     QListWidgetItem,
+    QListView,
     QLabel,
     QTabWidget,
     QMessageBox,
@@ -18,51 +27,168 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QIcon, QPixmap, QColor, QImage
 from urllib.parse import urlparse, parse_qs, urlunparse, urlencode
-from collections import deque
+from collections import OrderedDict, deque
 
 from core.settings import AppSettings
-from core.yt_manager import InfoFetcher
+from core.yt_manager import InfoFetcher, BatchInfoFetcher
+from core.thumbnails import thumbnail_service
+from core.selection import SelectionIndex, selection_key
 
 YOUTUBE_URL_RE = re.compile(r"https?://[^\s]+")
 VIDEO_HOSTS = ("www.youtube.com", "m.youtube.com", "youtube.com", "youtu.be")
 ICON_PIXMAP_ROLE = int(Qt.ItemDataRole.UserRole) + 1  # store original pixmap
 
 
+def _entry_thumb(e: Dict) -> str:
+    if not e:
+        return ""
+    return e.get("thumbnail") or (e.get("thumbnails") or [{}])[-1].get("url") or ""
+
+
+class _PlaylistModel(QAbstractListModel):
+    """Playlist entries backing the (virtualized) playlist view.
+
+    Only the entry dicts are stored per row. Colors and icons are produced in
+    data() when the view paints a row; rendered icons live in a small LRU, so
+    memory follows what is on screen rather than the playlist length.
+    """
+
+    ICON_CACHE_ROWS = 256
+
+    def __init__(
+        self,
+        is_selected: Callable[[Dict], bool],
+        accent_hex: Callable[[], str],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._entries: List[Dict] = []
+        self._is_selected = is_selected
+        self._accent_hex = accent_hex
+        self._thumbs = thumbnail_service()
+        # (row, selected) -> QIcon for recently painted rows
+        self._icons: "OrderedDict[Tuple[int, bool], QIcon]" = OrderedDict()
+        # Rows whose thumbnail was requested for the current entries
+        self._requested: set[int] = set()
+        # selection key -> row, built on first lookup
+        self._rows: Optional[Dict[str, int]] = None
+        self.generation = 0
+
+    # ----- Qt model API -----
+    def rowCount(self, parent=QModelIndex()):  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or index.row() >= len(self._entries):
+            return None
+        e = self._entries[index.row()] or {}
+        if role == Qt.ItemDataRole.DisplayRole:
+            return e.get("title") or "Untitled"
+        if role == Qt.ItemDataRole.UserRole:
+            return e
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if self._is_selected(e):
+                return QColor(self._accent_hex())
+            return QColor("#8a8b90")
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon(index.row(), e)
+        return None
+
+    # ----- entries -----
+    def set_entries(self, entries: List[Dict]) -> None:
+        self.beginResetModel()
+        self._entries = [e or {} for e in entries]
+        self._icons.clear()
+        self._requested.clear()
+        self._rows = None
+        self.generation += 1
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_entries([])
+
+    def entries(self) -> List[Dict]:
+        return self._entries
+
+    def entry(self, row: int) -> Dict:
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return {}
+
+    def row_for_key(self, key: str) -> int:
+        if self._rows is None:
+            rows: Dict[str, int] = {}
+            for i, e in enumerate(self._entries):
+                rows.setdefault(selection_key(e), i)
+            self._rows = rows
+        return self._rows.get(key, -1) if key else -1
+
+    # ----- styling -----
+    def refresh_rows(self, first: int = 0, last: Optional[int] = None) -> None:
+        """Re-evaluate selected styling (one signal for the whole range)."""
+        if not self._entries:
+            return
+        last = len(self._entries) - 1 if last is None else last
+        for key in [k for k in self._icons if first <= k[0] <= last]:
+            self._icons.pop(key, None)
+        self.dataChanged.emit(
+            self.index(first),
+            self.index(last),
+            [Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.DecorationRole],
+        )
+
+    # ----- thumbnails -----
+    def needs_thumb(self, row: int) -> str:
+        """Thumbnail URL to request for row, or "" if loaded/requested/none."""
+        if row in self._requested:
+            return ""
+        url = _entry_thumb(self.entry(row))
+        if not url:
+            return ""
+        self._requested.add(row)
+        if self._thumbs.cached(url) is not None:
+            self.thumb_ready(row, self.generation)
+            return ""
+        return url
+
+    def thumb_ready(self, row: int, generation: int) -> None:
+        if generation != self.generation or row >= len(self._entries):
+            return
+        self._icons.pop((row, True), None)
+        self._icons.pop((row, False), None)
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DecorationRole])
+
+    def _icon(self, row: int, e: Dict) -> Optional[QIcon]:
+        selected = self._is_selected(e)
+        key = (row, selected)
+        icon = self._icons.get(key)
+        if icon is not None:
+            self._icons.move_to_end(key)
+            return icon
+        turl = _entry_thumb(e)
+        pix = self._thumbs.cached(turl) if turl else None
+        if pix is None:
+            # Not loaded yet (or evicted from the shared cache): allow re-request
+            self._requested.discard(row)
+            return None
+        if not selected:
+            pix = QPixmap.fromImage(
+                pix.toImage().convertToFormat(QImage.Format.Format_Grayscale8)
+            )
+        icon = QIcon(pix)
+        self._icons[key] = icon
+        while len(self._icons) > self.ICON_CACHE_ROWS:
+            self._icons.popitem(last=False)
+        return icon
+
+
 class Step1LinkWidget(QWidget):
     # Signals consumed by MainWindow wiring
     urlDetected = pyqtSignal(dict)
     requestAdvance = pyqtSignal(dict)
     selectionConfirmed = pyqtSignal(list)
 
-    # Small worker to fetch a single thumbnail without blocking UI
-    class _ThumbWorker(QThread):
-        # Emit bytes instead of QPixmap to keep GUI ops in UI thread
-        done = pyqtSignal(int, bytes, str)  # row, image_bytes, url
-
-        def __init__(self, row: int, url: str, parent=None):
-            super().__init__(parent)
-            self.row = row
-            self.url = url
-
-        def run(self):
-            try:
-                from urllib.request import urlopen
-                import time
-
-                data = None
-                for _ in range(3):  # retry up to 3 times
-                    try:
-                        data = urlopen(self.url, timeout=5).read()
-                        if data:
-                            break
-                    except Exception:
-                        pass
-                    time.sleep(0.2)
-                if data:
-                    self.done.emit(self.row, data, self.url)
-            except Exception:
-                pass
-
     def __init__(self, settings: AppSettings | None = None):
         super().__init__()
         try:
@@ -77,22 +203,20 @@ class Step1LinkWidget(QWidget):
             # State
             self.fetcher = None
             self._fetchers: set[InfoFetcher] = set()
-            self.selected: List[Dict] = []
+            # Multi-select state keyed by video ID; _selected_items mirrors it
+            self.selected = SelectionIndex()
+            self._selected_items: Dict[str, QListWidgetItem] = {}
             self._bg_fetchers = {}
             self._active_req_id = 0
             # Thumbnails
-            self._thumb_threads: List[Step1LinkWidget._ThumbWorker] = []
-            self._thumb_max = 3
-            self._thumb_queue = deque()
-            self._thumb_active: set = set()
-            self._thumb_cache = {}
-            self._thumb_pending: set = set()
+            # Thumbnails come from the shared service (cache + bounded pool)
+            self._thumbs = thumbnail_service()
             # Queue
             self._queue = deque()
             self._queued_search: str | None = None
             # Confirm
             self._confirm_inflight = False
-            self._confirm_fetchers: dict[int, InfoFetcher] = {}
+            self._confirm_fetchers: dict[str, BatchInfoFetcher] = {}
             self._confirm_total = 0
             self._confirm_done = 0
 
@@ -184,12 +308,22 @@ class Step1LinkWidget(QWidget):
             self.chk_pl_select_all.toggled.connect(self._on_pl_select_all_toggled)
             pl_lay.addWidget(self.chk_pl_select_all, 0, Qt.AlignmentFlag.AlignLeft)
 
-            self.playlist_list = QListWidget()
+            # Virtualized: rows are painted from the model on demand
+            self.playlist_model = _PlaylistModel(
+                self._is_selected, lambda: self.settings.ui.accent_color_hex, self
+            )
+            self.playlist_list = QListView()
+            self.playlist_list.setModel(self.playlist_model)
+            self.playlist_list.setUniformItemSizes(True)
             self.playlist_list.setIconSize(QSize(96, 54))
             self.playlist_list.setFrameShape(QFrame.Shape.NoFrame)
             self.playlist_list.setSpacing(3)
             self.playlist_list.setVerticalScrollMode(
-                QListWidget.ScrollMode.ScrollPerPixel
+                QListView.ScrollMode.ScrollPerPixel
+            )
+            self.playlist_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+            self.playlist_list.verticalScrollBar().valueChanged.connect(
+                self._load_visible_playlist_thumbnails
             )
             pl_lay.addWidget(self.playlist_list, 1)
             # Trigger lazy thumb loading on viewport resize/show
@@ -213,7 +347,7 @@ class Step1LinkWidget(QWidget):
             self.chk_multi.toggled.connect(self._on_multi_toggled)
             self.results.itemClicked.connect(self._toggle_from_results)
             self.selected_list.itemClicked.connect(self._remove_from_selected_prompt)
-            self.playlist_list.itemClicked.connect(self._toggle_from_playlist)
+            self.playlist_list.clicked.connect(self._toggle_from_playlist)
             self.btn_next.clicked.connect(self._confirm_selection)
 
             # Debounced search timer
@@ -276,25 +410,55 @@ class Step1LinkWidget(QWidget):
 
     def _refresh_selected_list(self):
         self.selected_list.clear()
-        for it in self.selected:
-            title = it.get("title") or "Untitled"
-            lw = QListWidgetItem(title)
-            # Async thumb fetch (bounded)
-            url = (it or {}).get("webpage_url") or (it or {}).get("url")
-            thumb = (
-                (it.get("thumbnail") or (it.get("thumbnails") or [{}])[-1].get("url"))
-                if isinstance(it, dict)
-                else None
-            )
-            if thumb:
-                self._enqueue_thumb(
-                    thumb,
-                    lambda px, _, vurl=url: self._set_selected_icon_for_url(vurl, px),
-                )
-            lw.setData(Qt.ItemDataRole.UserRole, it)
-            self.selected_list.addItem(lw)
+        self._selected_items.clear()
+        self._selected_list_append(self.selected.keys())
+
+    def _selected_list_append(self, keys: List[str]):
+        """Append rows for newly selected keys (no rebuild)."""
+        bulk = len(keys) > 1
+        if bulk:
+            self.selected_list.setUpdatesEnabled(False)
+        try:
+            for key in keys:
+                it = self.selected.get(key)
+                if it is None or key in self._selected_items:
+                    continue
+                lw = QListWidgetItem(it.get("title") or "Untitled")
+                lw.setData(Qt.ItemDataRole.UserRole, it)
+                self.selected_list.addItem(lw)
+                self._selected_items[key] = lw
+                # Async thumb fetch (bounded)
+                thumb = _entry_thumb(it)
+                if thumb:
+                    self._enqueue_thumb(
+                        thumb,
+                        lambda px, k=key: self._set_selected_icon(k, px),
+                        low_priority=bulk,
+                    )
+        finally:
+            if bulk:
+                self.selected_list.setUpdatesEnabled(True)
         self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
 
+    def _selected_list_remove(self, keys: List[str]):
+        """Drop rows for deselected keys; large removals rebuild once instead."""
+        if len(keys) > 32:
+            self._refresh_selected_list()
+            return
+        for key in keys:
+            lw = self._selected_items.pop(key, None)
+            if lw is not None:
+                self.selected_list.takeItem(self.selected_list.row(lw))
+        self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
+
+    def _selected_list_update(self, key: str):
+        lw = self._selected_items.get(key)
+        it = self.selected.get(key)
+        if lw is None or it is None:
+            return
+        lw.setText(it.get("title") or "Untitled")
+        lw.setData(Qt.ItemDataRole.UserRole, it)
+
     # ----- Event Handlers -----
 
     def eventFilter(self, obj, event):
@@ -740,64 +904,20 @@ class Step1LinkWidget(QWidget):
             self._run_pending_if_any()
             return
 
-        # Handle real playlist - use smaller chunks and defer thumbnail loading
+        # Handle real playlist - one model reset; rows/thumbs are produced lazily
         if info.get("_type") == "playlist" and info.get("entries"):
             entries = list(info.get("entries") or [])
             total = len(entries)
-            self.lbl_status.setText(f"Loaded playlist with {total} videos.")
-            self.playlist_list.clear()
             self.chk_pl_select_all.blockSignals(True)
             self.chk_pl_select_all.setChecked(False)
             self.chk_pl_select_all.blockSignals(False)
-
-            # Use smaller chunks (25 instead of 50) for smoother UI
-            chunk = 25
-            self.playlist_list.setUpdatesEnabled(False)
-
-            # Chunk processing function
-            def _add_chunk(start: int = 0):
-                end = min(start + chunk, total)
-                for j in range(start, end):
-                    if j >= len(entries):
-                        break
-                    e = entries[j] or {}
-                    title = e.get("title") or "Untitled"
-                    item = QListWidgetItem(title)
-                    item.setData(Qt.ItemDataRole.UserRole, e)
-                    self._style_playlist_item(item, self._is_selected(e))
-                    self.playlist_list.addItem(item)
-
-                # Update status progressively
-                self.lbl_status.setText(f"Loaded {end}/{total} videos...")
-
-                # Process next chunk with delay to allow UI updates
-                if end < total:
-                    QTimer.singleShot(10, lambda s=end: _add_chunk(s))
-                else:
-                    self.playlist_list.setUpdatesEnabled(True)
-                    self.tabs.setTabVisible(self.idx_playlist, True)
-                    self.tabs.setCurrentIndex(self.idx_playlist)
-                    self.chk_pl_select_all.setVisible(self.chk_multi.isChecked())
-                    self.lbl_status.setText(f"Loaded {total} videos")
-
-                    # Only NOW set up scroll event handler for lazy loading thumbnails
-                    QTimer.singleShot(100, self._load_visible_playlist_thumbnails)
-
-                    # Connect to scrolling event for lazy loading
-                    self.playlist_list.verticalScrollBar().valueChanged.connect(
-                        self._load_visible_playlist_thumbnails
-                    )
-
-                    # Free memory
-                    try:
-                        import gc
-
-                        gc.collect()
-                    except:
-                        pass
-
-            # Start the chunked loading process
-            _add_chunk(0)
+            self.playlist_model.set_entries(entries)
+            self.playlist_list.scrollToTop()
+            self.tabs.setTabVisible(self.idx_playlist, True)
+            self.tabs.setCurrentIndex(self.idx_playlist)
+            self.chk_pl_select_all.setVisible(self.chk_multi.isChecked())
+            self.lbl_status.setText(f"Loaded {total} videos")
+            QTimer.singleShot(0, self._load_visible_playlist_thumbnails)
             self._run_pending_if_any()
             return
 
@@ -861,11 +981,15 @@ class Step1LinkWidget(QWidget):
         try:
             for f in list(getattr(self, "_confirm_fetchers", {}).values()):
                 try:
-                    f.finished_ok.disconnect()
+                    f.cancel()
+                except Exception:
+                    pass
+                try:
+                    f.itemOk.disconnect()
                 except Exception:
                     pass
                 try:
-                    f.finished_fail.disconnect()
+                    f.itemFailed.disconnect()
                 except Exception:
                     pass
             self._confirm_fetchers.clear()
@@ -876,32 +1000,18 @@ class Step1LinkWidget(QWidget):
     # ----- Selection Management -----
 
     def _is_selected(self, info: Dict) -> bool:
-        url = (info or {}).get("webpage_url") or (info or {}).get("url")
-        if not url:
-            return False
-        return any(
-            (it.get("webpage_url") or it.get("url")) == url for it in self.selected
-        )
+        return info in self.selected
 
     def _upsert_selected(self, info: Dict):
         if not isinstance(info, dict):
             return
-        url = info.get("webpage_url") or info.get("url")
-        if not url:
+        key, added = self.selected.upsert(info)
+        if not key:
             return
-        idx = next(
-            (
-                i
-                for i, it in enumerate(self.selected)
-                if (it.get("webpage_url") or it.get("url")) == url
-            ),
-            -1,
-        )
-        if idx >= 0:
-            self.selected[idx] = {**self.selected[idx], **info}
+        if added:
+            self._selected_list_append([key])
         else:
-            self.selected.append(info)
-        self._refresh_selected_list()
+            self._selected_list_update(key)
 
     # --- UI lock helper during confirm ---
     def _set_ui_enabled(self, enabled: bool):
@@ -928,11 +1038,11 @@ class Step1LinkWidget(QWidget):
         for it in list(self.selected):
             if not _has_formats(it):
                 u = (it or {}).get("webpage_url") or (it or {}).get("url")
-                if u:
+                if u and u not in urls:
                     urls.append(u)
 
         if not urls:
-            self.selectionConfirmed.emit(list(self.selected))
+            self.selectionConfirmed.emit(self.selected.to_list())
             return
         if getattr(self, "_confirm_inflight", False):
             return
@@ -973,34 +1083,39 @@ class Step1LinkWidget(QWidget):
                 self.loading_bar.setRange(0, 0)
                 self._set_ui_enabled(True)
                 self.btn_next.setEnabled(True)
-                self.selectionConfirmed.emit(list(self.selected))
+                self.selectionConfirmed.emit(self.selected.to_list())
 
-        # Launch parallel fetchers keyed by URL to avoid index drift
-        for u in urls:
-            f = InfoFetcher(u)
-
-            def _ok(meta: dict, url=u):
-                try:
-                    if isinstance(meta, dict):
-                        # merge into the matching selected item by URL if still present
-                        for i, s in enumerate(list(self.selected)):
-                            surl = (s or {}).get("webpage_url") or (s or {}).get("url")
-                            if surl == url:
-                                self.selected[i] = {**s, **meta}
-                                break
-                        self._refresh_selected_list()
-                finally:
-                    self._confirm_fetchers.pop(url, None)
-                    _on_done_one()
-
-            def _fail(_: str, url=u):
-                self._confirm_fetchers.pop(url, None)
+        # One bounded, rate-limited batch; results keyed by URL to avoid index drift
+        def _ok(url: str, meta: dict):
+            try:
+                key = selection_key({"url": url})
+                # merge into the matching selected item if still present
+                if isinstance(meta, dict) and self.selected.merge(key, meta):
+                    self._selected_list_update(key)
+            finally:
                 _on_done_one()
 
-            f.finished_ok.connect(_ok)
-            f.finished_fail.connect(_fail)
-            self._confirm_fetchers[u] = f
-            f.start()
+        def _fail(url: str, _: str):
+            _on_done_one()
+
+        # Labels only; Step 3 fetches formats for items that lack them
+        batch = BatchInfoFetcher(
+            urls,
+            max_concurrent=self._metadata_concurrency(),
+            parent=self,
+            include_formats=False,
+        )
+        batch.itemOk.connect(_ok)
+        batch.itemFailed.connect(_fail)
+        batch.finished.connect(batch.deleteLater)
+        self._confirm_fetchers["batch"] = batch
+        batch.start()
+
+    def _metadata_concurrency(self) -> int:
+        try:
+            return max(1, int(getattr(self.settings.ytdlp, "metadata_concurrency", 4)))
+        except Exception:
+            return 4
 
     # --- Multi toggle: also hide/show playlist "Select all" ---
     def _on_multi_toggled(self, checked: bool):
@@ -1020,9 +1135,7 @@ class Step1LinkWidget(QWidget):
                 self._refresh_selected_list()
                 self.tabs.setTabVisible(self.idx_selected, False)
                 # Reset playlist item styling
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    self._style_playlist_item(it, False)
+                self.playlist_model.refresh_rows()
                 self.lbl_status.setText("")
             else:
                 # Revert to ON
@@ -1033,8 +1146,9 @@ class Step1LinkWidget(QWidget):
         self.lbl_status.setText("")
 
     # Toggle a playlist entry in/out of selection
-    def _toggle_from_playlist(self, item: QListWidgetItem):
-        info = item.data(Qt.ItemDataRole.UserRole) or {}
+    def _toggle_from_playlist(self, index: QModelIndex):
+        row = index.row()
+        info = self.playlist_model.entry(row)
         url = info.get("webpage_url") or info.get("url")
         if not url:
             return
@@ -1047,20 +1161,15 @@ class Step1LinkWidget(QWidget):
                 )
                 == QMessageBox.StandardButton.Yes
             ):
-                self.selected = [
-                    it
-                    for it in self.selected
-                    if (it.get("webpage_url") or it.get("url")) != url
-                ]
-                self._refresh_selected_list()
-                self._style_playlist_item(item, False)  # update styling
+                self._selected_list_remove([self.selected.remove(info)])
+                self.playlist_model.refresh_rows(row, row)  # update styling
         else:
             if self.chk_multi.isChecked():
                 # Multi: add placeholder and style as selected; do not fetch metadata now
                 self._upsert_selected(
                     info if isinstance(info, dict) else {"url": url, "webpage_url": url}
                 )
-                self._style_playlist_item(item, True)
+                self.playlist_model.refresh_rows(row, row)
                 self.lbl_status.setText("Added to selected.")
             else:
                 self.lbl_status.setText("Fetching info...")
@@ -1076,16 +1185,7 @@ class Step1LinkWidget(QWidget):
             return
 
         # Check if already selected
-        idx = next(
-            (
-                i
-                for i, it in enumerate(self.selected)
-                if (it.get("webpage_url") or it.get("url")) == url
-            ),
-            -1,
-        )
-
-        if idx >= 0:
+        if data in self.selected:
             # Already selected - confirm removal
             if (
                 QMessageBox.question(
@@ -1093,8 +1193,11 @@ class Step1LinkWidget(QWidget):
                 )
                 == QMessageBox.StandardButton.Yes
             ):
-                self.selected.pop(idx)
-                self._refresh_selected_list()
+                key = self.selected.remove(data)
+                self._selected_list_remove([key])
+                row = self.playlist_model.row_for_key(key)
+                if row >= 0:
+                    self.playlist_model.refresh_rows(row, row)
             return
 
         # Not selected - add it
@@ -1127,9 +1230,10 @@ class Step1LinkWidget(QWidget):
 
         # Clear all lists
         self.results.clear()
-        self.playlist_list.clear()
+        self.playlist_model.clear()
         self.selected.clear()
         self.selected_list.clear()
+        self._selected_items.clear()
 
         # Reset UI state
         self.tabs.setCurrentWidget(self.tab_search)
@@ -1151,17 +1255,7 @@ class Step1LinkWidget(QWidget):
         if hasattr(self, "search_timer"):
             self.search_timer.stop()
 
-        self._thumb_threads.clear()
-        self._thumb_cache.clear()
-        self._thumb_pending.clear()
-
-        # Disconnect scroll handlers
-        try:
-            self.playlist_list.verticalScrollBar().valueChanged.disconnect(
-                self._load_visible_playlist_thumbnails
-            )
-        except Exception:
-            pass
+        self._thumbs.cancel_pending()
 
     # Keep only one definition of this handler
     def _remove_from_selected_prompt(self, item: QListWidgetItem):
@@ -1176,20 +1270,11 @@ class Step1LinkWidget(QWidget):
             )
             == QMessageBox.StandardButton.Yes
         ):
-            self.selected = [
-                it
-                for it in self.selected
-                if (it.get("webpage_url") or it.get("url")) != url
-            ]
-            self._refresh_selected_list()
-            for i in range(self.playlist_list.count()):
-                pit = self.playlist_list.item(i)
-                pdata = pit.data(Qt.ItemDataRole.UserRole) or {}
-                pu = pdata.get("webpage_url") or pdata.get("url")
-                if pu == url:
-                    self._style_playlist_item(pit, False)
-                    break
-            self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
+            key = self.selected.remove(info)
+            self._selected_list_remove([key])
+            row = self.playlist_model.row_for_key(key)
+            if row >= 0:
+                self.playlist_model.refresh_rows(row, row)
 
     # "Next" in multi-select mode: emit all selected infos
     def _confirm_selection(self):
@@ -1200,39 +1285,6 @@ class Step1LinkWidget(QWidget):
         self._fetch_all_selected_then_emit()
 
     # ----- Thumbnail and Styling Helpers (ADDED) -----
-    def _load_thumb(self, url: str):
-        if not url:
-            return None
-        try:
-            from urllib.request import urlopen
-
-            data = urlopen(url, timeout=5).read()
-            pix = QPixmap()
-            if pix.loadFromData(data):
-                return pix
-        except Exception:
-            pass
-        return None
-
-    def _to_gray(self, pix: QPixmap) -> QPixmap:
-        try:
-            img = pix.toImage().convertToFormat(QImage.Format.Format_Grayscale8)
-            return QPixmap.fromImage(img)
-        except Exception:
-            return pix
-
-    def _apply_icon_style(self, item: QListWidgetItem, selected: bool):
-        pix = item.data(ICON_PIXMAP_ROLE)
-        if isinstance(pix, QPixmap):
-            item.setIcon(QIcon(pix if selected else self._to_gray(pix)))
-
-    def _style_playlist_item(self, item: QListWidgetItem, selected: bool):
-        if selected:
-            item.setForeground(QColor(self.settings.ui.accent_color_hex))
-        else:
-            item.setForeground(QColor("#8a8b90"))
-        self._apply_icon_style(item, selected)
-
     def _set_result_icon_if_match(self, row: int, pix: QPixmap, expected_url: str):
         try:
             if row < 0 or row >= self.results.count():
@@ -1248,37 +1300,13 @@ class Step1LinkWidget(QWidget):
             it.setData(ICON_PIXMAP_ROLE, pix)
         except Exception:
             pass
-        self._thumb_threads.clear()
-
-    # Set icon in playlist tab by video URL
-    def _set_playlist_icon_for_url(self, video_url: str, pix: QPixmap):
-        try:
-            for i in range(self.playlist_list.count()):
-                item = self.playlist_list.item(i)
-                data = item.data(Qt.ItemDataRole.UserRole) or {}
-                u = (data.get("webpage_url") or data.get("url")) or ""
-                if u == video_url:
-                    item.setIcon(QIcon(pix))
-                    item.setData(ICON_PIXMAP_ROLE, pix)
-                    # keep current selected/gray style
-                    self._apply_icon_style(item, self._is_selected(data))
-                    break
-        except Exception:
-            pass
 
-    # Set icon in selected tab by video URL
-    def _set_selected_icon_for_url(self, video_url: str, pix: QPixmap):
-        try:
-            for i in range(self.selected_list.count()):
-                item = self.selected_list.item(i)
-                data = item.data(Qt.ItemDataRole.UserRole) or {}
-                u = (data.get("webpage_url") or data.get("url")) or ""
-                if u == video_url:
-                    item.setIcon(QIcon(pix))
-                    item.setData(ICON_PIXMAP_ROLE, pix)
-                    break
-        except Exception:
-            pass
+    # Set icon in selected tab by selection key
+    def _set_selected_icon(self, key: str, pix: QPixmap):
+        item = self._selected_items.get(key)
+        if item is not None:
+            item.setIcon(QIcon(pix))
+            item.setData(ICON_PIXMAP_ROLE, pix)
 
     # Allow MainWindow to enable/disable Next and optionally show a hint
     def set_next_enabled(self, enabled: bool, note: str = ""):
@@ -1289,178 +1317,73 @@ class Step1LinkWidget(QWidget):
         except Exception:
             pass
 
-    # --- Thumbnail queue helpers (bounded concurrency) ---
+    # --- Thumbnail helpers (shared service handles caching/coalescing) ---
     def _enqueue_thumb(self, thumb_url: str, setter_cb, low_priority=False):
-        """Queue thumbnail for fetching with prioritization and caching"""
+        """Request a thumbnail; visible/interactive requests jump the queue"""
         if not thumb_url:
             return
-
-        # Use cache if available
-        if thumb_url in self._thumb_cache:
-            try:
-                setter_cb(self._thumb_cache[thumb_url])
-                return
-            except Exception:
-                pass
-
-        # Skip if already queued/active
-        if thumb_url in self._thumb_pending:
-            return
-
-        # Only queue if not overloaded
-        if len(self._thumb_queue) < 100:
-            item = (thumb_url, setter_cb)
-            if low_priority:
-                self._thumb_queue.append(item)
-            else:
-                self._thumb_queue.appendleft(item)
-            self._thumb_maybe_start()
-
-    def _thumb_maybe_start(self):
-        while len(self._thumb_active) < self._thumb_max and self._thumb_queue:
-            url, cb = self._thumb_queue.popleft()
-            # Serve from cache if filled while waiting
-            if url in self._thumb_cache:
-                try:
-                    cb(self._thumb_cache[url])
-                    continue
-                except Exception:
-                    pass
-            # Avoid launching duplicate worker
-            if url in self._thumb_pending:
-                continue
-            w = Step1LinkWidget._ThumbWorker(-1, url, self)
-            self._thumb_pending.add(url)
-            self._thumb_active.add(w)
-            self._thumb_threads.append(w)
-
-            # Build QPixmap in UI thread, cache it, then call original callback
-            def _forward(_row, img_bytes, u, _cb=cb, _url=url, _self=self):
-                try:
-                    px = QPixmap()
-                    if img_bytes and px.loadFromData(img_bytes):
-                        _self._thumb_cache[_url] = px
-                        try:
-                            _cb(px)  # most callbacks accept (pixmap)
-                        except TypeError:
-                            try:
-                                _cb(px, u)  # some accept (pixmap, url)
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
-
-            w.done.connect(_forward)
-            w.finished.connect(lambda _w=w: self._on_thumb_finished(_w, url))
-            w.start()
-
-    # Worker finished handler (cleanup + start next)
-    def _on_thumb_finished(self, w, url: str):
-        try:
-            self._thumb_active.discard(w)
-            self._thumb_pending.discard(url)
-            try:
-                w.deleteLater()
-            except Exception:
-                pass
-        finally:
-            self._thumb_maybe_start()
+        self._thumbs.request(thumb_url, setter_cb, priority=not low_priority)
+
+    def _visible_playlist_rows(self) -> range:
+        """Rows intersecting the viewport; O(1) via indexAt (uniform sizes)."""
+        count = self.playlist_model.rowCount()
+        if count <= 0:
+            return range(0)
+        view = self.playlist_list
+        vp = view.viewport().rect()
+        # Probe just inside the spacing margin so the hit lands on an item
+        pad = view.spacing() + 1
+        top = view.indexAt(QPoint(vp.left() + pad, vp.top() + pad))
+        if not top.isValid():
+            top = view.indexAt(QPoint(vp.left() + pad, vp.top() + 2 * pad))
+        first = top.row() if top.isValid() else 0
+        bottom = view.indexAt(QPoint(vp.left() + pad, vp.bottom() - pad))
+        if bottom.isValid():
+            last = bottom.row()
+        else:
+            # Probe hit the spacing/empty area: derive from the uniform row pitch
+            pitch = max(1, view.visualRect(self.playlist_model.index(first)).height())
+            last = first + vp.height() // (pitch + view.spacing()) + 1
+        return range(first, min(count, last + 1))
 
     # Lazy thumbnail loading for playlist based on scroll position
-    def _load_visible_playlist_thumbnails(self):
+    def _load_visible_playlist_thumbnails(self, *_):
         try:
             if self.tabs.currentIndex() != self.idx_playlist:
                 return
-            vp = self.playlist_list.viewport().rect()
-            count = self.playlist_list.count()
-            if count <= 0:
+            visible = self._visible_playlist_rows()
+            if not visible:
                 return
-
-            first = None
-            last = None
-            # Scan items until we pass the viewport bottom; breaks early
-            for i in range(count):
-                it = self.playlist_list.item(i)
-                r = self.playlist_list.visualItemRect(it)
-                if not r.isValid():
-                    continue
-                if r.intersects(vp):
-                    if first is None:
-                        first = i
-                    last = i
-                elif first is not None and r.top() > vp.bottom():
-                    break
-
-            if first is None:
-                first = 0
-                last = min(count - 1, 29)
-            else:
-                first = max(0, first - 5)
-                last = min(count - 1, (last if last is not None else first) + 5)
-
-            for i in range(first, last + 1):
-                item = self.playlist_list.item(i)
-                if not item or not item.icon().isNull():
-                    continue
-                data = item.data(Qt.ItemDataRole.UserRole) or {}
-                turl = data.get("thumbnail") or (data.get("thumbnails") or [{}])[
-                    -1
-                ].get("url")
-                if not turl:
-                    continue
-                vurl = (data.get("webpage_url") or data.get("url")) or ""
-                if not vurl:
-                    continue
-                if turl in self._thumb_cache:
-                    pix = self._thumb_cache[turl]
-                    item.setIcon(QIcon(pix))
-                    item.setData(ICON_PIXMAP_ROLE, pix)
-                    self._apply_icon_style(item, self._is_selected(data))
-                    continue
-                # Queue with low priority; callback sets by URL to avoid races
-                self._enqueue_thumb(
-                    turl,
-                    lambda px, _, v=vurl: self._set_playlist_icon_for_url(v, px),
-                    low_priority=True,
-                )
+            model = self.playlist_model
+            gen = model.generation
+            # Visible rows first (priority), then a small margin around them
+            margin = list(range(max(0, visible.start - 5), visible.start))
+            margin += list(
+                range(visible.stop, min(model.rowCount(), visible.stop + 5))
+            )
+            for rows, prio in ((visible, True), (margin, False)):
+                for row in rows:
+                    turl = model.needs_thumb(row)
+                    if not turl:
+                        continue
+                    self._enqueue_thumb(
+                        turl,
+                        lambda _px, r=row, g=gen: model.thumb_ready(r, g),
+                        low_priority=not prio,
+                    )
         except Exception:
             pass
 
     # Handle the "Select all" checkbox in playlist tab
     def _on_pl_select_all_toggled(self, checked: bool):
-        self.playlist_list.setUpdatesEnabled(False)
-        try:
-            if checked:
-                # Add all playlist items to selection
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    e = it.data(Qt.ItemDataRole.UserRole) or {}
-                    if self._is_selected(e):
-                        continue
-                    self.selected.append(e)
-                    self._style_playlist_item(it, True)
-            else:
-                # Remove any selected item that belongs to this playlist view
-                urls = []
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    e = it.data(Qt.ItemDataRole.UserRole) or {}
-                    u = e.get("webpage_url") or e.get("url")
-                    if not u:
-                        continue
-                    urls.append(u)
-                    self._style_playlist_item(it, False)
-                urlset = set(urls)
-                self.selected = [
-                    s
-                    for s in self.selected
-                    if (s.get("webpage_url") or s.get("url")) not in urlset
-                ]
-            self._refresh_selected_list()
-            self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
-        finally:
-            self.playlist_list.setUpdatesEnabled(True)
-            self._thumb_threads.clear()
+        entries = self.playlist_model.entries()
+        if checked:
+            # Add all playlist items to selection
+            self._selected_list_append(self.selected.extend(entries))
+        else:
+            # Remove any selected item that belongs to this playlist view
+            self._selected_list_remove(self.selected.remove_many(entries))
+        self.playlist_model.refresh_rows()
 
     def cancel_pending(self):
         try:
@@ -27,10 +27,11 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QLineEdit,
 )
-from PyQt6.QtGui import QIcon, QPixmap, QStandardItemModel, QStandardItem  #
+from PyQt6.QtGui import QIcon, QPixmap, QColor, QStandardItemModel, QStandardItem  #
 
 from core.settings import AppSettings, SettingsManager
-from core.yt_manager import InfoFetcher
+from core.yt_manager import BatchInfoFetcher
+from core.thumbnails import thumbnail_service, THUMB_SIZE
 
 
 class Step3QualityWidget(QWidget):
@@ -41,7 +42,7 @@ class Step3QualityWidget(QWidget):
         super().__init__()
         self.settings = settings
         self.items: List[Dict] = []
-        self._meta_fetchers: List[InfoFetcher] = []
+        self._meta_fetchers: List[BatchInfoFetcher] = []
         self._url_index: Dict[str, int] = {}
 
         # ADDED: selection state
@@ -119,7 +120,19 @@ class Step3QualityWidget(QWidget):
         self.preview.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
         # Enable multi-selection with Ctrl/Cmd key
         self.preview.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        # Uniform rows keep scrolling/layout cheap for large selections
+        self.preview.setUniformItemSizes(True)
         content.addWidget(self.preview, 2)
+        # Thumbnails load asynchronously, visible rows first
+        self._preview_gen = 0
+        self._thumbs_queued = False
+        self._thumb_loaded: set = set()
+        placeholder = QPixmap(THUMB_SIZE)
+        placeholder.fill(QColor(128, 128, 128, 60))
+        self._placeholder_icon = QIcon(placeholder)
+        self.preview.verticalScrollBar().valueChanged.connect(
+            self._request_visible_thumbs
+        )
 
         # Accent vertical separator between list and options
         vsep = QFrame()
@@ -429,7 +442,7 @@ class Step3QualityWidget(QWidget):
         self.chk_auto_subs.toggled.connect(self._on_subtitle_changed)
         self.chk_embed_subs.toggled.connect(self._on_subtitle_changed)
 
-        # Timer (kept but unused for background refetch)
+        # Timer for background refetch of items missing formats
         self._refetch_timer = QTimer(self)
         self._refetch_timer.setSingleShot(True)
         self._refetch_timer.timeout.connect(self._start_refetch_missing)
@@ -601,14 +614,23 @@ class Step3QualityWidget(QWidget):
         self.header.setText(
             f"Selected {len(items)} item(s). Choose output format and quality."
         )
-        self.preview.clear()
-        for it in items:
-            title = it.get("title") or "Untitled"
-            lw = QListWidgetItem(title)
-            pix = self._load_thumb(it)
-            if pix:
-                lw.setIcon(QIcon(pix))
-            self.preview.addItem(lw)
+        # Pure UI work here: placeholders now, thumbnails arrive async
+        self._preview_gen += 1
+        self._thumbs_queued = False
+        self._thumb_loaded = set()
+        self.preview.setUpdatesEnabled(False)
+        try:
+            self.preview.clear()
+            thumbs = self._thumbs
+            for it in items:
+                lw = QListWidgetItem(it.get("title") or "Untitled")
+                url = self._thumb_url(it)
+                px = thumbs.cached(url) if url else None
+                lw.setIcon(QIcon(px) if px is not None else self._placeholder_icon)
+                self.preview.addItem(lw)
+        finally:
+            self.preview.setUpdatesEnabled(True)
+        QTimer.singleShot(0, self._request_visible_thumbs)
 
         # Fade-in transition for a clean update
         eff = QGraphicsOpacityEffect(self.preview)
@@ -623,6 +645,9 @@ class Step3QualityWidget(QWidget):
         self._cleanup_fetchers()
         if hasattr(self, "_refetch_timer"):
             self._refetch_timer.stop()
+            if any(not self._has_formats(it) for it in self.items):
+                delay = int(getattr(self.settings.ui, "quality_refetch_seconds", 1))
+                self._refetch_timer.start(max(0, delay) * 1000)
 
         # Initialize warnings and load controls for context
         self._update_header_text()
@@ -640,26 +665,58 @@ class Step3QualityWidget(QWidget):
         except Exception:
             pass
 
-    def _load_thumb(self, it: Dict):
-        url = it.get("thumbnail") or (it.get("thumbnails") or [{}])[-1].get("url")
-        if not url:
-            return None
-        try:
-            import requests, time
-
-            for _ in range(3):
-                try:
-                    r = requests.get(url, timeout=6)
-                    if r.ok:
-                        pix = QPixmap()
-                        if pix.loadFromData(r.content):
-                            return pix
-                except Exception:
-                    pass
-                time.sleep(0.2)
-        except Exception:
-            return None
-        return None
+    @property
+    def _thumbs(self):
+        return thumbnail_service()
+
+    @staticmethod
+    def _thumb_url(it: Dict):
+        return it.get("thumbnail") or (it.get("thumbnails") or [{}])[-1].get("url")
+
+    def _visible_rows(self) -> range:
+        count = self.preview.count()
+        if count <= 0:
+            return range(0)
+        vp = self.preview.viewport().rect()
+        top = self.preview.indexAt(vp.topLeft())
+        bottom = self.preview.indexAt(vp.bottomLeft())
+        first = top.row() if top.isValid() else 0
+        last = bottom.row() if bottom.isValid() else min(count - 1, first + 20)
+        return range(max(0, first - 2), min(count, last + 3))
+
+    def _request_visible_thumbs(self, *_):
+        # Visible rows jump the queue; everything else follows in list order
+        visible = self._visible_rows()
+        n = min(self.preview.count(), len(self.items))
+        if self._thumbs_queued:
+            # Already queued: just move newly visible, still-missing rows up
+            for row in visible:
+                if row < n and row not in self._thumb_loaded:
+                    url = self._thumb_url(self.items[row])
+                    if url:
+                        self._thumbs.prioritize(url)
+            return
+        self._thumbs_queued = True
+        gen = self._preview_gen
+        order = [r for r in visible if r < n]
+        order += [r for r in range(n) if r not in visible]
+        for row in order:
+            url = self._thumb_url(self.items[row])
+            if not url:
+                continue
+            self._thumbs.request(
+                url,
+                lambda px, r=row, g=gen: self._set_preview_thumb(r, g, px),
+                priority=row in visible,
+            )
+
+    def _set_preview_thumb(self, row: int, gen: int, pix: QPixmap):
+        if gen != self._preview_gen or row >= self.preview.count():
+            return  # list was rebuilt meanwhile
+        self._thumb_loaded.add(row)
+        item = self.preview.item(row)
+        if item is not None:
+            item.setIcon(QIcon(pix))
 
     # Helpers for multi-select SB categories
     def _set_sb_categories(self, cats: List[str]):
@@ -1018,16 +1075,54 @@ class Step3QualityWidget(QWidget):
 
     def _start_refetch_missing(self):
         self._cleanup_fetchers()
-        return
+        if not getattr(self.settings.ui, "background_metadata_enabled", True):
+            return
+        urls = []
+        for it in self.items:
+            u = it.get("webpage_url") or it.get("url")
+            if u and not self._has_formats(it):
+                urls.append(u)
+        if not urls:
+            return
+        try:
+            conc = int(getattr(self.settings.ytdlp, "metadata_concurrency", 4))
+        except Exception:
+            conc = 4
+        batch = BatchInfoFetcher(urls, max_concurrent=conc, parent=self)
+        batch.itemOk.connect(self._on_refetched)
+        batch.finished.connect(batch.deleteLater)
+        self._meta_fetchers.append(batch)
+        batch.start()
+
+    def _on_refetched(self, url: str, meta: dict):
+        idx = self._url_index.get(url)
+        if idx is None or idx >= len(self.items) or not isinstance(meta, dict):
+            return
+        self.items[idx] = {**self.items[idx], **meta}
+        # Refresh options without losing the user's current pick
+        current = self.cmb_quality.currentText()
+        self.cmb_quality.blockSignals(True)
+        try:
+            self._populate_quality_options()
+            i = self.cmb_quality.findText(current)
+            if i >= 0:
+                self.cmb_quality.setCurrentIndex(i)
+        finally:
+            self.cmb_quality.blockSignals(False)
+        try:
+            self._populate_subtitle_languages(idx)
+        except Exception:
+            pass
+        self._update_warnings()
 
     def _cleanup_fetchers(self):
         for f in self._meta_fetchers:
             try:
-                f.finished_ok.disconnect()
+                f.cancel()
             except Exception:
                 pass
             try:
-                f.finished_fail.disconnect()
+                f.itemOk.disconnect()
             except Exception:
                 pass
         self._meta_fetchers.clear()
@@ -1,10 +1,31 @@
 import os
 import sys
 import subprocess
-from typing import Dict, List, Optional
-
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
-from PyQt6.QtGui import QPixmap
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QPoint,
+    QRect,
+    QRectF,
+    QSize,
+    QTimer,
+)
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPalette,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+)
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -12,107 +33,381 @@ from PyQt6.QtWidgets import (
     QLabel,
     QPushButton,
     QFileDialog,
-    QListWidget,
-    QListWidgetItem,
-    QProgressBar,
+    QListView,
+    QStyledItemDelegate,
+    QToolTip,
     QFrame,
     QMessageBox,
+    QSpinBox,
 )
 
 from core.settings import AppSettings, SettingsManager
-from core.ffmpeg_manager import FF_EXE, FF_DIR
-from core.yt_manager import Downloader
-
-
-class DownloadItemWidget(QWidget):
-    # Signal for when open icon is clicked
-    openFileRequested = pyqtSignal(int)  # Emits row index
-
-    def __init__(self, title: str, row: int = -1):
-        super().__init__()
-        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        self.setStyleSheet("DownloadItemWidget { background: transparent; }")
-        self.row = row  # Store row index for click handling
-
-        lay = QHBoxLayout(self)
-        lay.setContentsMargins(4, 4, 4, 4)  # keep in sync with Step 1 spacing feel
-        lay.setSpacing(6)
-
-        self.thumb = QLabel()
-        self.thumb.setFixedSize(96, 54)
-        self.thumb.setObjectName(
-            "ThumbnailLabel"
-        )  # Use object name for theme-aware styling
-        self.thumb.setAlignment(Qt.AlignmentFlag.AlignCenter)  # center with letterbox
-        self.thumb.setScaledContents(False)
-
-        self.title = QLabel(title)
-        self.title.setWordWrap(True)
-
-        self.status = QLabel("Waiting...")
-        self.progress = QProgressBar()
-        self.progress.setObjectName("DlProgress")
-        self.progress.setValue(0)
-        self.progress.setFixedHeight(20)
-
-        col = QVBoxLayout()
-        col.addWidget(self.title)
-        col.addWidget(self.status)
-        col.addWidget(self.progress)
-
-        lay.addWidget(self.thumb)
-        lay.addLayout(col, 1)
-
-        self.open_icon = QLabel("📂")
-        self.open_icon.setStyleSheet(
-            """
-            QLabel {
-                font-size: 24px;
-                padding: 8px;
-                border-radius: 6px;
-                background: transparent;
-            }
-            QLabel:hover {
-                background: rgba(242, 140, 40, 0.15);
-            }
-        """
+from core.paths import FF_EXE, FF_DIR
+from core.yt_manager import (
+    Downloader,
+    discard_partial_files,
+    item_video_id,
+    partial_files_for,
+)
+from core.download_journal import DownloadJournal
+from core.models import DownloadState
+from core.thumbnails import THUMB_SIZE, thumbnail_service
+from core.bandwidth import MB, bandwidth_limiter
+from core.progress_aggregator import PROGRESS, STATUS, ProgressAggregator
+
+
+# Stage tag painted next to the status ("" hides it)
+_STAGE_LABELS = {"downloading": "⬇ Downloading", "converting": "⚙ Converting"}
+
+
+def _item_thumb(it: Dict) -> str:
+    if not it:
+        return ""
+    return it.get("thumbnail") or (it.get("thumbnails") or [{}])[-1].get("url") or ""
+
+
+def _pill(size: QSize, radius: int, pen: str, brush: str, dpr: float) -> QPixmap:
+    """Antialiased rounded box, rendered once per look and blitted afterwards."""
+    key = f"ytc-pill:{size.width()}x{size.height()}@{dpr}:{radius}:{pen}:{brush}"
+    pix = QPixmapCache.find(key)
+    if pix is not None:
+        return pix
+    pix = QPixmap(size * dpr)
+    pix.setDevicePixelRatio(dpr)
+    pix.fill(Qt.GlobalColor.transparent)
+    p = QPainter(pix)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    p.setPen(QPen(QColor(pen), 1) if pen else Qt.PenStyle.NoPen)
+    p.setBrush(QColor(brush))
+    box = QRectF(0, 0, size.width(), size.height())
+    p.drawRoundedRect(box.adjusted(0.5, 0.5, -0.5, -0.5), radius, radius)
+    p.end()
+    QPixmapCache.insert(key, pix)
+    return pix
+
+
+class _RowState:
+    """Per-row download state painted by _DownloadDelegate."""
+
+    __slots__ = (
+        "started",
+        "status",
+        "progress",
+        "busy",
+        "stage",
+        "outcome",
+        "active",
+        "paused",
+        "file_path",
+    )
+
+    def __init__(self):
+        self.started = False  # status/progress shown once the item is queued
+        self.status = "Waiting..."
+        self.progress = 0
+        self.busy = False  # indeterminate bar (ffmpeg work)
+        self.stage = ""
+        self.outcome = ""  # "" | "done" | "error"
+        self.active = False  # per-item pause button shown
+        self.paused = False
+        self.file_path = ""
+
+
+class _DownloadsModel(QAbstractListModel):
+    """Queue entries plus their download state; rows are painted, not widgets.
+
+    Thumbnails come from the shared thumbnail service; rendered pixmaps for
+    recently painted rows live in a small LRU, so memory follows the screen
+    rather than the queue length.
+    """
+
+    StateRole = Qt.ItemDataRole.UserRole + 1
+    PIXMAP_CACHE_ROWS = 128
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[Dict] = []
+        self._states: List[_RowState] = []
+        self._thumbs = thumbnail_service()
+        self._pixmaps: "OrderedDict[int, QPixmap]" = OrderedDict()
+        self._requested: set[int] = set()
+        self.generation = 0
+
+    # ----- Qt model API -----
+    def rowCount(self, parent=QModelIndex()):  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or index.row() >= len(self._items):
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._items[row].get("title") or "Untitled"
+        if role == Qt.ItemDataRole.UserRole:
+            return self._items[row]
+        if role == self.StateRole:
+            return self._states[row]
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._pixmap(row)
+        return None
+
+    # ----- items/state -----
+    def set_items(self, items: List[Dict]) -> None:
+        self.beginResetModel()
+        self._items = [it or {} for it in items]
+        self._states = [_RowState() for _ in self._items]
+        self._pixmaps.clear()
+        self._requested.clear()
+        self.generation += 1
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_items([])
+
+    def state(self, row: int) -> Optional[_RowState]:
+        if 0 <= row < len(self._states):
+            return self._states[row]
+        return None
+
+    def states(self) -> List[_RowState]:
+        return self._states
+
+    def changed(self, first: int, last: Optional[int] = None) -> None:
+        """Repaint rows first..last after their state was edited."""
+        last = first if last is None else last
+        if 0 <= first <= last < len(self._items):
+            self.dataChanged.emit(self.index(first), self.index(last), [self.StateRole])
+
+    def changed_all(self) -> None:
+        if self._items:
+            self.changed(0, len(self._items) - 1)
+
+    # ----- thumbnails -----
+    def needs_thumb(self, row: int) -> str:
+        """Thumbnail URL to request for row, or "" if loaded/requested/none."""
+        if row in self._requested or not 0 <= row < len(self._items):
+            return ""
+        url = _item_thumb(self._items[row])
+        if not url:
+            return ""
+        self._requested.add(row)
+        if self._thumbs.cached(url) is not None:
+            self.thumb_ready(row, self.generation)
+            return ""
+        return url
+
+    def thumb_ready(self, row: int, generation: int) -> None:
+        if generation != self.generation or row >= len(self._items):
+            return
+        self._pixmaps.pop(row, None)
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DecorationRole])
+
+    def _pixmap(self, row: int) -> Optional[QPixmap]:
+        pix = self._pixmaps.get(row)
+        if pix is not None:
+            self._pixmaps.move_to_end(row)
+            return pix
+        url = _item_thumb(self._items[row])
+        pix = self._thumbs.cached(url) if url else None
+        if pix is None:
+            # Not loaded yet (or evicted from the shared cache): allow re-request
+            self._requested.discard(row)
+            return None
+        self._pixmaps[row] = pix
+        while len(self._pixmaps) > self.PIXMAP_CACHE_ROWS:
+            self._pixmaps.popitem(last=False)
+        return pix
+
+
+class _DownloadDelegate(QStyledItemDelegate):
+    """Paints a download row: thumbnail, title, status, progress, actions."""
+
+    openRequested = pyqtSignal(int)
+    pauseToggled = pyqtSignal(int)
+
+    ROW_HEIGHT = 74
+    MARGIN = 4
+    BAR_HEIGHT = 20
+    BUTTON = 32
+
+    def __init__(self, accent_hex: Callable[[], str], parent=None):
+        super().__init__(parent)
+        self._accent_hex = accent_hex
+        self.phase = 0  # busy-bar animation step
+
+    def sizeHint(self, option, index):  # type: ignore[override]
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    # ----- geometry -----
+    def _rects(self, rect: QRect, st: _RowState) -> Dict[str, QRect]:
+        m = self.MARGIN
+        r = rect.adjusted(m, m, -m, -m)
+        size = THUMB_SIZE
+        thumb = QRect(r.left(), r.top() + (r.height() - size.height()) // 2, 0, 0)
+        thumb.setSize(size)
+        right = r.right()
+        rects = {"thumb": thumb}
+        if st.active:
+            b = self.BUTTON
+            rects["pause"] = QRect(right - b + 1, r.center().y() - b // 2, b, b)
+            right -= b + 6
+        if st.file_path:
+            b = self.BUTTON + 8
+            rects["open"] = QRect(right - b + 1, r.center().y() - b // 2, b, b)
+            right -= b + 6
+        left = thumb.right() + 7
+        rects["title"] = QRect(left, r.top(), right - left + 1, 20)
+        rects["status"] = QRect(left, r.top() + 22, right - left + 1, 18)
+        bar_top = r.bottom() - self.BAR_HEIGHT + 1
+        rects["bar"] = QRect(left, bar_top, right - left + 1, self.BAR_HEIGHT)
+        return rects
+
+    # ----- painting -----
+    def paint(self, painter, option, index):  # type: ignore[override]
+        st = index.data(_DownloadsModel.StateRole)
+        if st is None:
+            return
+        pal = option.palette
+        rects = self._rects(option.rect, st)
+        dpr = painter.device().devicePixelRatioF()
+        mid = pal.color(QPalette.ColorRole.Mid).name()
+        painter.save()
+
+        thumb = rects["thumb"]
+        base = pal.color(QPalette.ColorRole.Base).name()
+        painter.drawPixmap(thumb.topLeft(), _pill(thumb.size(), 6, mid, base, dpr))
+        pix = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(pix, QPixmap) and not pix.isNull():
+            # Letterbox inside the fixed thumbnail box
+            x = thumb.left() + (thumb.width() - pix.width()) // 2
+            y = thumb.top() + (thumb.height() - pix.height()) // 2
+            painter.drawPixmap(x, y, pix)
+
+        text_color = pal.color(QPalette.ColorRole.Text)
+        fm = option.fontMetrics
+        painter.setPen(text_color)
+        title = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        r = rects["title"]
+        painter.drawText(
+            r,
+            int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter),
+            fm.elidedText(title, Qt.TextElideMode.ElideRight, r.width()),
         )
-        self.open_icon.setToolTip("Click to open file")
-        self.open_icon.hide()
-        self.open_icon.setCursor(Qt.CursorShape.PointingHandCursor)
-        # Make the icon clickable
-        self.open_icon.mousePressEvent = lambda event: self._on_icon_clicked()
-        lay.addWidget(self.open_icon)
-
-        # Reserve full height before hiding status/progress so the list doesn't jump
-        self._full_size_hint = self.sizeHint()
-        self.status.hide()
-        self.progress.hide()
-
-    def _on_icon_clicked(self):
-        """Emit signal when folder icon is clicked."""
-        if self.row >= 0:
-            self.openFileRequested.emit(self.row)
-
-    def full_size_hint(self):
-        return self._full_size_hint
-
-    def show_open_icon(self, accent_color: str = "#F28C28"):
-        """Show the open file icon with accent color styling."""
-        self.open_icon.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 24px;
-                padding: 8px;
-                border-radius: 6px;
-                background: transparent;
-            }}
-            QLabel:hover {{
-                background: rgba({int(accent_color[1:3], 16)}, {int(accent_color[3:5], 16)}, {int(accent_color[5:7], 16)}, 0.15);
-            }}
-        """
+
+        if st.started:
+            self._paint_status(painter, option, st, rects["status"])
+            self._paint_bar(painter, option, st, rects["bar"], dpr)
+        if "open" in rects:
+            f = QFont(option.font)
+            f.setPixelSize(22)
+            painter.setFont(f)
+            painter.drawText(rects["open"], int(Qt.AlignmentFlag.AlignCenter), "📂")
+            painter.setFont(option.font)
+        if "pause" in rects:
+            r = rects["pause"]
+            button = pal.color(QPalette.ColorRole.Button).name()
+            painter.drawPixmap(r.topLeft(), _pill(r.size(), 6, mid, button, dpr))
+            painter.setPen(pal.color(QPalette.ColorRole.ButtonText))
+            glyph = "▶" if st.paused else "⏸"
+            painter.drawText(r, int(Qt.AlignmentFlag.AlignCenter), glyph)
+        painter.restore()
+
+    def _paint_status(self, painter, option, st: _RowState, r: QRect):
+        fm = option.fontMetrics
+        if st.stage:
+            f = QFont(option.font)
+            f.setPixelSize(11)
+            painter.setFont(f)
+            painter.setPen(option.palette.color(QPalette.ColorRole.Mid))
+            stage_w = QFontMetrics(f).horizontalAdvance(st.stage) + 6
+            painter.drawText(
+                r,
+                int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter),
+                st.stage,
+            )
+            r = r.adjusted(0, 0, -stage_w, 0)
+            painter.setFont(option.font)
+        if st.outcome == "error":
+            f = QFont(option.font)
+            f.setBold(True)
+            painter.setFont(f)
+            painter.setPen(QColor("#c62828"))
+            fm = QFontMetrics(f)
+        else:
+            painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.drawText(
+            r,
+            int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter),
+            fm.elidedText(st.status, Qt.TextElideMode.ElideRight, r.width()),
         )
-        self.open_icon.show()
+        painter.setFont(option.font)
+
+    def _paint_bar(self, painter, option, st: _RowState, r: QRect, dpr: float):
+        pal = option.palette
+        if st.outcome == "done":
+            border, track, chunk = "#4caf50", "#e8f5e9", "#4caf50"
+        elif st.outcome == "error":
+            border, track, chunk = "#f44336", "#ffebee", "#f44336"
+        else:
+            border = pal.color(QPalette.ColorRole.Mid).name()
+            track, chunk = "#00000000", self._accent_hex()
+        painter.drawPixmap(r.topLeft(), _pill(r.size(), 8, border, track, dpr))
+        if st.busy:
+            # Indeterminate: a segment sweeping across the track
+            seg = QSize(r.width() // 4, r.height())
+            span = r.width() + seg.width()
+            x = r.left() - seg.width() + (self.phase * 12) % span
+            painter.setClipRect(r)
+            painter.drawPixmap(x, r.top(), _pill(seg, 8, "", chunk, dpr))
+            painter.setClipping(False)
+            return
+        value = max(0, min(100, int(st.progress)))
+        if value:
+            # Left part of a full-width chunk, like QProgressBar's chunk
+            w = r.width() * value / 100
+            painter.drawPixmap(
+                QRectF(r.left(), r.top(), w, r.height()),
+                _pill(r.size(), 8, "", chunk, dpr),
+                QRectF(0, 0, w * dpr, r.height() * dpr),
+            )
+        if st.outcome == "error":
+            painter.setPen(QColor("#c62828"))
+        else:
+            painter.setPen(pal.color(QPalette.ColorRole.Text))
+        painter.drawText(r, int(Qt.AlignmentFlag.AlignCenter), f"{value}%")
+
+    # ----- clicks on the painted buttons -----
+    def editorEvent(self, event, model, option, index):  # type: ignore[override]
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            st = index.data(_DownloadsModel.StateRole)
+            if st is not None:
+                rects = self._rects(option.rect, st)
+                pos = event.position().toPoint()
+                if "pause" in rects and rects["pause"].contains(pos):
+                    self.pauseToggled.emit(index.row())
+                    return True
+                if "open" in rects and rects["open"].contains(pos):
+                    self.openRequested.emit(index.row())
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):  # type: ignore[override]
+        st = index.data(_DownloadsModel.StateRole)
+        if st is not None and event.type() == QEvent.Type.ToolTip:
+            rects = self._rects(option.rect, st)
+            tip = ""
+            if "pause" in rects and rects["pause"].contains(event.pos()):
+                tip = "Resume this download" if st.paused else "Pause this download"
+            elif "open" in rects and rects["open"].contains(event.pos()):
+                tip = "Click to open file"
+            if tip:
+                QToolTip.showText(event.globalPos(), tip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
 
 
 class Step4DownloadsWidget(QWidget):
@@ -124,28 +419,6 @@ class Step4DownloadsWidget(QWidget):
     downloadsStarted = pyqtSignal()
     downloadsStopped = pyqtSignal()
 
-    class _ThumbWorker(QThread):
-        done = pyqtSignal(str, QPixmap)
-
-        def __init__(self, video_url: str, thumb_url: str, parent=None):
-            super().__init__(parent)
-            self.vurl = video_url
-            self.turl = thumb_url
-
-        def run(self):
-            try:
-                import requests
-
-                r = requests.get(self.turl, timeout=8)
-                if not r.ok:
-                    return
-                px = QPixmap()
-                if px.loadFromData(r.content):
-                    # ensure we emit original pixmap; scaling is done in UI thread
-                    self.done.emit(self.vurl, px)
-            except Exception:
-                pass
-
     def __init__(self, settings: AppSettings | None = None):
         super().__init__()
         if settings is None:
@@ -163,10 +436,16 @@ class Step4DownloadsWidget(QWidget):
         self.quality = "best"
         self.downloader: Optional[Downloader] = None
         self._meta_fetchers: dict = {}  # Legacy cleanup dict
-        self._thumb_threads: List[Step4DownloadsWidget._ThumbWorker] = []
         self._downloading = False
         self._file_map = {}  # row -> filepath
         self._nightly_prompt_shown = False
+        # Persistent queue state for the current batch (crash/restart resume)
+        self.journal: Optional[DownloadJournal] = None
+        # Downloader progress is applied to the list once per frame
+        self._progress = ProgressAggregator(parent=self)
+        self._progress.batchReady.connect(self._apply_progress_batch)
+        # Latest progress of rows scrolled out of view, applied when shown
+        self._offscreen_progress: Dict[int, tuple] = {}
 
         lay = QVBoxLayout(self)
         lay.setContentsMargins(8, 8, 8, 8)
@@ -191,19 +470,51 @@ class Step4DownloadsWidget(QWidget):
         self.btn_stop.setVisible(False)  # Hidden until started
         self.btn_done = QPushButton("Done")
         self.btn_done.setVisible(False)
+        # Shown after Stop: partial files are kept for resume unless discarded
+        self.btn_discard = QPushButton("Discard partials")
+        self.btn_discard.setToolTip(
+            "Delete this batch's partially downloaded files "
+            "(unfinished items start from zero)"
+        )
+        self.btn_discard.setVisible(False)
+        # Total speed cap shared by running items; applies to them live
+        self.spin_limit = QSpinBox()
+        self.spin_limit.setRange(0, 1000)
+        self.spin_limit.setSuffix(" MB/s")
+        self.spin_limit.setSpecialValueText("No limit")
+        self.spin_limit.setValue(self._limit_mbps())
+        self.spin_limit.valueChanged.connect(self._on_limit_changed)
+        self._apply_bandwidth_settings()
         self.btn_back.clicked.connect(self.backRequested.emit)
         self.btn_choose.clicked.connect(self._choose_dir)
         self.btn_start.clicked.connect(self._toggle_start_pause)
         self.btn_stop.clicked.connect(self._stop_downloads)
         self.btn_done.clicked.connect(self._done_clicked)
+        self.btn_discard.clicked.connect(self._discard_partials)
 
         # List content
-        self.list = QListWidget()
+        # Virtualized: rows are painted from the model, no widget per item
+        self.model = _DownloadsModel(self)
+        self.delegate = _DownloadDelegate(self._accent_hex, self)
+        self.delegate.openRequested.connect(self._open_file_by_row)
+        self.delegate.pauseToggled.connect(self._toggle_item_pause)
+        self.list = QListView()
+        self.list.setModel(self.model)
+        self.list.setItemDelegate(self.delegate)
+        self.list.setUniformItemSizes(True)
         self.list.setFrameShape(QFrame.Shape.NoFrame)
         self.list.setSpacing(4)
-        self.list.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
-        self.list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        self.list.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.list.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.list.verticalScrollBar().valueChanged.connect(self._on_list_scrolled)
+        # Trigger lazy thumb loading on viewport resize/show
+        self.list.viewport().installEventFilter(self)
         lay.addWidget(self.list, 1)
+        # Animates indeterminate bars of visible rows (ffmpeg work)
+        self._busy_timer = QTimer(self)
+        self._busy_timer.setInterval(100)
+        self._busy_timer.timeout.connect(self._animate_busy_rows)
 
         # Footer with separator and controls (Back on left, folder + actions on right)
         sep = QFrame()
@@ -226,6 +537,9 @@ class Step4DownloadsWidget(QWidget):
         # Right: actions
         actions = QHBoxLayout()
         actions.setSpacing(6)
+        actions.addWidget(QLabel("Limit:"))
+        actions.addWidget(self.spin_limit)
+        actions.addWidget(self.btn_discard)
         actions.addWidget(self.btn_start)
         actions.addWidget(self.btn_stop)
         actions.addWidget(self.btn_done)
@@ -251,12 +565,55 @@ class Step4DownloadsWidget(QWidget):
             self.downloader = None
         self._downloading = False
         self._nightly_prompt_shown = False
+        self._discard_journal()
         self.items = selection.get("items", [])
         self.kind = selection.get("kind", settings.defaults.kind)
         self.fmt = selection.get("format", settings.defaults.format)
         self.quality = selection.get("quality", "best")
+        self._apply_bandwidth_settings()
         self._populate()
 
+    def resume_from_journal(self, journal: DownloadJournal):
+        """Restore an interrupted batch and continue where it stopped."""
+        self.configure(
+            {
+                "items": list(journal.items),
+                "kind": journal.kind,
+                "format": journal.fmt,
+                "quality": journal.quality,
+            },
+            self.settings,
+        )
+        self.journal = journal
+        if journal.base_dir:
+            self.lbl_dir.setText(journal.base_dir)
+        for idx, st in enumerate(journal.states):
+            shown = self.model.state(idx)
+            if shown is None:
+                continue
+            if journal.is_completed(idx):
+                shown.started = True
+                shown.status = "Done"
+                shown.progress = 100
+            else:
+                self._show_journaled(shown, st)
+        self.model.changed_all()
+        self.start_downloads()
+
+    @staticmethod
+    def _show_journaled(shown, saved) -> bool:
+        """Show where a resumed item stopped; False if it had not started."""
+        if saved is None or saved.progress <= 0:
+            return False
+        shown.status = f"Interrupted at {saved.progress:.1f}%"
+        shown.progress = int(saved.progress)
+        return True
+
+    def _discard_journal(self):
+        if self.journal is not None:
+            self.journal.discard()
+            self.journal = None
+
     # Call when downloads are about to start
     def _on_downloads_started(self):
         self._downloading = True
@@ -271,35 +628,12 @@ class Step4DownloadsWidget(QWidget):
             pass
 
     def _populate(self):
-        self.list.clear()
         self._file_map.clear()
-        for idx, it in enumerate(self.items):
-            title = it.get("title") or "Untitled"
-            w = DownloadItemWidget(title, row=idx)  # Pass row index
-            # Connect the widget's signal to open file handler
-            w.openFileRequested.connect(self._open_file_by_row)
-
-            # Async thumb fetch
-            vurl = (it.get("webpage_url") or it.get("url")) or ""
-            thumb_url = it.get("thumbnail") or (it.get("thumbnails") or [{}])[-1].get(
-                "url"
-            )
-            if thumb_url and vurl:
-                worker = Step4DownloadsWidget._ThumbWorker(vurl, thumb_url, self)
-                worker.done.connect(self._set_dl_thumb_if_match)
-                worker.finished.connect(
-                    lambda w=worker: (
-                        self._thumb_threads.remove(w)
-                        if w in self._thumb_threads
-                        else None
-                    )
-                )
-                self._thumb_threads.append(worker)
-                worker.start()
-            item = QListWidgetItem()
-            item.setSizeHint(w.full_size_hint())  # Keep height stable
-            self.list.addItem(item)
-            self.list.setItemWidget(item, w)
+        self._progress.reset()
+        self._offscreen_progress.clear()
+        # One model reset; thumbnails are requested for visible rows only
+        self.model.set_items(self.items)
+        QTimer.singleShot(0, self._load_visible_thumbnails)
 
         # Reset button states for new items
         self.btn_start.setEnabled(bool(self.items))
@@ -307,6 +641,7 @@ class Step4DownloadsWidget(QWidget):
         self.btn_stop.setVisible(False)
         self.btn_stop.setEnabled(False)
         self.btn_done.setVisible(False)
+        self.btn_discard.setVisible(False)
         self._downloading = False
 
     def _cleanup_bg_metadata(self):
@@ -342,6 +677,22 @@ class Step4DownloadsWidget(QWidget):
             self.downloader.pause()
             self.btn_start.setText("Resume")
 
+    def _toggle_item_pause(self, row: int):
+        if not self.downloader:
+            return
+        st = self.model.state(row)
+        if self.downloader.is_item_paused(row):
+            self.downloader.resume_item(row)
+            paused = False
+        else:
+            self.downloader.pause_item(row)
+            paused = True
+        if st is not None:
+            st.paused = paused
+            if paused:
+                st.status = "Paused"
+            self.model.changed(row)
+
     def _check_file_conflicts(self, base_dir: str) -> list:
         """
         Check if any files in the download list already exist.
@@ -351,6 +702,8 @@ class Step4DownloadsWidget(QWidget):
         conflicts = []
         try:
             for idx, item in enumerate(self.items):
+                if self.journal is not None and self.journal.is_completed(idx):
+                    continue  # produced by this batch before a restart
                 title = item.get("title", "Untitled")
                 # Construct expected filename based on download settings
                 ext = self.fmt or ("mp3" if self.kind == "audio" else "mp4")
@@ -403,15 +756,21 @@ class Step4DownloadsWidget(QWidget):
         except Exception:
             pass
 
-        # Ensure all items show their UI only now
-        for i in range(self.list.count()):
-            w = self._get_widget(i)
-            if w:
-                w.status.setText("Queued")
-                w.status.show()
-                w.progress.setRange(0, 100)
-                w.progress.setValue(0)
-                w.progress.show()
+        # Ensure all items show their UI only now; a resumed batch keeps the
+        # journaled progress until yt-dlp reports from the .part file
+        journal = self.journal
+        if journal is not None and not journal.matches(self.items):
+            journal = None
+        for i, st in enumerate(self.model.states()):
+            if journal is not None and journal.is_completed(i):
+                continue
+            st.started = True
+            st.busy = False
+            saved = journal.state(i) if journal is not None else None
+            if not self._show_journaled(st, saved):
+                st.status = "Queued"
+                st.progress = 0
+        self.model.changed_all()
 
         ff_path = FF_DIR if os.path.exists(FF_EXE) else None
 
@@ -443,6 +802,21 @@ class Step4DownloadsWidget(QWidget):
                 # Dialog was cancelled
                 return
 
+        # Write-ahead journal: a restart after Stop or a crash resumes this
+        # batch instead of starting over
+        if (
+            self.journal is None
+            or self.journal.base_dir != base
+            or not self.journal.matches(self.items)
+        ):
+            self._discard_journal()
+            try:
+                self.journal = DownloadJournal.begin(
+                    base, self.kind, self.fmt, self.quality, self.items
+                )
+            except Exception:
+                self.journal = None
+
         self.downloader = Downloader(
             self.items,
             base,
@@ -450,10 +824,13 @@ class Step4DownloadsWidget(QWidget):
             self.fmt,
             ff_path,
             quality=self.quality,
+            max_concurrent=self._max_concurrent(),
+            pipeline=self._pipeline_enabled(),
+            journal=self.journal,
+            progress_hz=self._progress_hz(),
         )
-        self.downloader.itemStatus.connect(self._on_item_status)
-        self.downloader.itemProgress.connect(self._on_item_progress)
-        self.downloader.itemThumb.connect(self._on_item_thumb)
+        self._progress.attach(self.downloader)
+        self._busy_timer.start()
         self.downloader.itemFileReady.connect(self._on_item_file_ready)
         self.downloader.finished_all.connect(self._on_all_finished)
         self.downloader.retryLimitReached.connect(self._on_retry_limit)
@@ -461,6 +838,7 @@ class Step4DownloadsWidget(QWidget):
         self.btn_start.setEnabled(True)
         self.btn_stop.setVisible(True)  # Show Stop once started
         self.btn_stop.setEnabled(True)
+        self.btn_discard.setVisible(False)
 
         # Disable Back button during downloads
         self.btn_back.setEnabled(False)
@@ -473,7 +851,63 @@ class Step4DownloadsWidget(QWidget):
 
         self.downloader.start()
 
+    def _max_concurrent(self) -> int:
+        try:
+            return int(getattr(self.settings.downloads, "max_concurrent", 0) or 0)
+        except Exception:
+            return 0
+
+    def _progress_hz(self) -> Optional[float]:
+        try:
+            return float(self.settings.downloads.progress_hz)
+        except Exception:
+            return None
+
+    def _limit_mbps(self) -> int:
+        try:
+            return int(
+                getattr(self.settings.downloads, "bandwidth_limit_mbps", 0) or 0
+            )
+        except Exception:
+            return 0
+
+    def _apply_bandwidth_settings(self):
+        try:
+            schedules = getattr(self.settings.downloads, "bandwidth_schedules", [])
+        except Exception:
+            schedules = []
+        limiter = bandwidth_limiter()
+        limiter.configure(self._limit_mbps() * MB, schedules)
+        if limiter.scheduled():
+            cap = limiter.effective_limit() / MB
+            note = f"{cap:g} MB/s" if cap else "no limit"
+            self.spin_limit.setToolTip(
+                f"A bandwidth schedule is active ({note}); it overrides this value"
+            )
+        else:
+            self.spin_limit.setToolTip(
+                "Total download speed shared by all running items"
+            )
+
+    def _on_limit_changed(self, value: int):
+        try:
+            self.settings.downloads.bandwidth_limit_mbps = float(value)
+            self.settings_mgr.save(self.settings)
+        except Exception:
+            pass
+        self._apply_bandwidth_settings()
+
+    def _pipeline_enabled(self) -> bool:
+        try:
+            return bool(
+                getattr(self.settings.downloads, "pipeline_postprocessing", True)
+            )
+        except Exception:
+            return False
+
     def _stop_downloads(self):
+        self._progress.flush()
+        self._progress.detach()
         if self.downloader:
             try:
                 self.downloader.stop()
@@ -497,22 +931,74 @@ class Step4DownloadsWidget(QWidget):
             pass
 
         # Update all items to "Stopped" state
-        for i in range(self.list.count()):
-            w = self._get_widget(i)
-            if w:
-                current_status = w.status.text().lower()
-                # Only update if not already done or failed
-                if not (
-                    "done" in current_status
-                    or "error" in current_status
-                    or "failed" in current_status
-                ):
-                    w.status.setText("Stopped")
-                    w.progress.setRange(0, 100)
-                    w.progress.setValue(0)
+        self._busy_timer.stop()
+        for st in self.model.states():
+            current_status = st.status.lower()
+            # Only update if not already done or failed
+            if not (
+                "done" in current_status
+                or "error" in current_status
+                or "failed" in current_status
+            ):
+                st.status = "Stopped"
+                st.busy = False
+                st.progress = 0
+            st.active = False
+            st.paused = False
+        self.model.changed_all()
 
         self._on_downloads_stopped()
         self._cleanup_bg_metadata()
+        # Partial files stay on disk so Start resumes; offer to drop them
+        self.btn_discard.setVisible(bool(self._batch_partials()))
+
+    def _unfinished_video_ids(self) -> List[str]:
+        ids = []
+        for idx, it in enumerate(self.items):
+            if self.journal is not None and self.journal.is_completed(idx):
+                continue
+            st = self.model.state(idx)
+            if st is not None and st.outcome == "done":
+                continue
+            ids.append(item_video_id(it))
+        return ids
+
+    def _batch_partials(self) -> List[str]:
+        return partial_files_for(self.lbl_dir.text(), self._unfinished_video_ids())
+
+    def _discard_partials(self):
+        if self._downloading:
+            return
+        files = self._batch_partials()
+        if files:
+            resp = QMessageBox.question(
+                self,
+                "Discard partial downloads",
+                f"Delete {len(files)} partially downloaded file(s) from this batch?\n"
+                "Unfinished items will start from zero next time.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            )
+            if resp != QMessageBox.StandardButton.Yes:
+                return
+            discard_partial_files(self.lbl_dir.text(), self._unfinished_video_ids())
+        if self.journal is not None:
+            for idx in range(len(self.items)):
+                if not self.journal.is_completed(idx):
+                    st = self.journal.state(idx)
+                    if st is not None and st.info_json:
+                        try:
+                            os.remove(st.info_json)
+                        except Exception:
+                            pass
+                    self.journal.mark(
+                        idx,
+                        DownloadState.CREATED,
+                        downloaded_bytes=0,
+                        total_bytes=0,
+                        progress=0.0,
+                        info_json=None,
+                    )
+        self.btn_discard.setVisible(False)
 
     def _choose_dir(self):
         d = QFileDialog.getExistingDirectory(
@@ -554,123 +1040,129 @@ class Step4DownloadsWidget(QWidget):
             pass
 
     def _on_item_status(self, idx: int, text: str):
-        w = self._get_widget(idx)
-        if w:
-            if not w.status.isVisible():
-                w.status.show()
-            if not w.progress.isVisible():
-                w.progress.show()
-            w.status.setText(text)
-
-            # Busy indicator for processing/removal phase
-            t = (text or "").strip().lower()
-            if (
-                t.startswith("processing")
-                or t.startswith("removing")
-                or t.startswith("trimming")
-                or t.startswith("merging")
-            ):
-                w.progress.setRange(0, 0)
-            elif (
-                t.startswith("error")
-                or t.startswith("failed")
-                or t.startswith("done")
-                or t.startswith("stopped")
-                or "already downloaded" in t
-            ):
-                w.progress.setRange(0, 100)
-
-                # Visual feedback for different states
-                if t.startswith("done") or "already downloaded" in t:
-                    # Success - green-tinted progress bar
-                    w.progress.setValue(100)
-                    try:
-                        w.progress.setStyleSheet(
-                            """
-                            QProgressBar {
-                                border: 1px solid #4caf50;
-                                border-radius: 4px;
-                                text-align: center;
-                                background: #e8f5e9;
-                            }
-                            QProgressBar::chunk {
-                                background-color: #4caf50;
-                            }
-                        """
-                        )
-                    except Exception:
-                        pass
-                elif t.startswith("error") or t.startswith("failed"):
-                    # Error - red-tinted progress bar
-                    w.progress.setValue(0)
-                    try:
-                        w.progress.setStyleSheet(
-                            """
-                            QProgressBar {
-                                border: 1px solid #f44336;
-                                border-radius: 4px;
-                                text-align: center;
-                                background: #ffebee;
-                                color: #c62828;
-                            }
-                            QProgressBar::chunk {
-                                background-color: #f44336;
-                            }
-                        """
-                        )
-                        # Make error text more prominent
-                        w.status.setStyleSheet("color: #c62828; font-weight: bold;")
-                    except Exception:
-                        pass
-                elif t.startswith("stopped"):
-                    # Stopped - neutral gray
-                    w.progress.setValue(0)
-                    try:
-                        w.progress.setStyleSheet("")
-                        w.status.setStyleSheet("")
-                    except Exception:
-                        pass
+        st = self.model.state(idx)
+        if st is None:
+            return
+        st.started = True
+        st.status = text
+
+        # Busy indicator for processing/removal phase
+        t = (text or "").strip().lower()
+        if self.downloader:
+            st.active = True
+        if (
+            t.startswith("processing")
+            or t.startswith("converting")
+            or t.startswith("removing")
+            or t.startswith("trimming")
+            or t.startswith("merging")
+        ):
+            st.busy = True
+        elif (
+            t.startswith("error")
+            or t.startswith("failed")
+            or t.startswith("done")
+            or t.startswith("stopped")
+            or "already downloaded" in t
+        ):
+            st.busy = False
+            st.stage = ""
+            st.active = False
+
+            # Visual feedback for different states
+            if t.startswith("done") or "already downloaded" in t:
+                # Success - green-tinted progress bar
+                st.outcome = "done"
+                st.progress = 100
+            elif t.startswith("error") or t.startswith("failed"):
+                # Error - red-tinted bar and prominent status text
+                st.outcome = "error"
+                st.progress = 0
+            elif t.startswith("stopped"):
+                # Stopped - neutral gray
+                st.outcome = ""
+                st.progress = 0
+        self.model.changed(idx)
+
+    def _visible_rows(self) -> range:
+        """Rows intersecting the viewport; O(1) via indexAt (uniform sizes)."""
+        count = self.model.rowCount()
+        if count <= 0:
+            return range(0)
+        vp = self.list.viewport().rect()
+        # Probe just inside the spacing margin so the hit lands on an item
+        pad = self.list.spacing() + 1
+        top = self.list.indexAt(QPoint(vp.left() + pad, vp.top() + pad))
+        if not top.isValid():
+            top = self.list.indexAt(QPoint(vp.left() + pad, vp.top() + 2 * pad))
+        first = top.row() if top.isValid() else 0
+        bottom = self.list.indexAt(QPoint(vp.left() + pad, vp.bottom() - pad))
+        if bottom.isValid():
+            last = bottom.row()
+        else:
+            # Probe hit the spacing/empty area: derive from the uniform row pitch
+            pitch = max(1, self.list.visualRect(self.model.index(first)).height())
+            last = first + vp.height() // (pitch + self.list.spacing()) + 1
+        return range(first, min(count, last + 1))
+
+    def _apply_progress_batch(self, batch: Dict):
+        visible = self._visible_rows()
+        for idx, changes in batch.items():
+            for field, value in changes:
+                if field == PROGRESS:
+                    if idx in visible:
+                        self._offscreen_progress.pop(idx, None)
+                        self._on_item_progress(idx, *value)
+                    else:
+                        # Off-screen bars cost nothing until scrolled to
+                        self._offscreen_progress[idx] = value
+                elif field == STATUS:
+                    self._offscreen_progress.pop(idx, None)
+                    self._on_item_status(idx, value)
+                else:
+                    self._on_item_stage(idx, value)
+
+    def _on_list_scrolled(self, *_):
+        self._apply_offscreen_progress()
+        self._load_visible_thumbnails()
+
+    def _apply_offscreen_progress(self, *_):
+        if not self._offscreen_progress:
+            return
+        for idx in self._visible_rows():
+            value = self._offscreen_progress.pop(idx, None)
+            if value is not None:
+                self._on_item_progress(idx, *value)
+
+    def _on_item_stage(self, idx: int, stage: str):
+        st = self.model.state(idx)
+        if st is not None:
+            st.stage = _STAGE_LABELS.get((stage or "").lower(), "")
+            self.model.changed(idx)
 
     def _on_item_progress(
-        self, idx: int, percent: float, speed: float, eta: Optional[int]
+        self, idx: int, percent: float, speed: Optional[float], eta: Optional[int]
     ):
-        w = self._get_widget(idx)
-        if w:
-            # Ensure determinate during downloading
-            if w.progress.minimum() == 0 and w.progress.maximum() == 0:
-                w.progress.setRange(0, 100)
-            w.progress.setValue(int(percent))
-            if eta is not None:
-                w.status.setText(
-                    f"{percent:.1f}% | {speed/1024/1024:.2f} MB/s | ETA {eta}s"
-                )
-
-    def _on_item_thumb(self, idx: int, data: bytes):
-        w = self._get_widget(idx)
-        if w:
-            px = QPixmap()
-            if px.loadFromData(data):
-                w.thumb.setPixmap(
-                    px.scaled(
-                        w.thumb.size(),
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
-                )
+        st = self.model.state(idx)
+        if st is None:
+            return
+        # Ensure determinate during downloading
+        st.busy = False
+        st.progress = int(percent)
+        # None = yt-dlp is still estimating
+        rate = "-- MB/s" if speed is None else f"{speed/1024/1024:.2f} MB/s"
+        left = "ETA --" if eta is None else f"ETA {eta}s"
+        st.status = f"{percent:.1f}% | {rate} | {left}"
+        self.model.changed(idx)
 
     # Connect this to Downloader.itemFileReady
     def _on_item_file_ready(self, row: int, path: str):
         """Store file path and show open icon when file is ready."""
         self._file_map[row] = path
-
-        # Show the open icon on the widget
-        w = self._get_widget(row)
-        if w:
-            try:
-                accent = getattr(self.settings.ui, "accent_color_hex", "#F28C28")
-                w.show_open_icon(accent)
-            except Exception:
-                w.show_open_icon()
+        st = self.model.state(row)
+        if st is not None:
+            st.file_path = path
+            self.model.changed(row)
 
     def _open_file_by_row(self, row: int):
         """Open file by row index (called from folder icon click)."""
@@ -717,11 +1209,53 @@ class Step4DownloadsWidget(QWidget):
         except Exception:
             pass
 
-    def _get_widget(self, idx: int) -> Optional[DownloadItemWidget]:
-        it = self.list.item(idx)
-        if not it:
-            return None
-        return self.list.itemWidget(it)
+    def _accent_hex(self) -> str:
+        try:
+            return getattr(self.settings.ui, "accent_color_hex", "#F28C28")
+        except Exception:
+            return "#F28C28"
+
+    def _animate_busy_rows(self):
+        visible = self._visible_rows()
+        busy = [r for r in visible if self.model.state(r).busy]
+        if busy:
+            self.delegate.phase += 1
+            self.model.changed(busy[0], busy[-1])
+
+    # Lazy thumbnail loading based on scroll position
+    def _load_visible_thumbnails(self, *_):
+        try:
+            visible = self._visible_rows()
+            if not visible:
+                return
+            model = self.model
+            gen = model.generation
+            # Visible rows first (priority), then a small margin around them
+            margin = list(range(max(0, visible.start - 5), visible.start))
+            margin += list(
+                range(visible.stop, min(model.rowCount(), visible.stop + 5))
+            )
+            for rows, prio in ((visible, True), (margin, False)):
+                for row in rows:
+                    turl = model.needs_thumb(row)
+                    if not turl:
+                        continue
+                    thumbnail_service().request(
+                        turl,
+                        lambda _px, r=row, g=gen: model.thumb_ready(r, g),
+                        priority=prio,
+                    )
+        except Exception:
+            pass
+
+    def eventFilter(self, obj, event):
+        # React to list viewport resize/show to (re)load visible thumbs
+        if obj is self.list.viewport() and event.type() in (
+            QEvent.Type.Resize,
+            QEvent.Type.Show,
+        ):
+            QTimer.singleShot(0, self._load_visible_thumbnails)
+        return super().eventFilter(obj, event)
 
     # Call when user presses Stop (ensure to re-enable Back only after stopped)
     def _on_downloads_stopped(self):
@@ -734,7 +1268,13 @@ class Step4DownloadsWidget(QWidget):
 
     # Call when all finished
     def _on_all_finished(self):
+        # Apply the last statuses before the finish handling reads them
+        self._progress.flush()
+        self._progress.detach()
+        self._busy_timer.stop()
         self._downloading = False
+        # Batch is over; nothing left to resume
+        self._discard_journal()
 
         # Emit signal to unlock UI
         try:
@@ -785,7 +1325,7 @@ class Step4DownloadsWidget(QWidget):
                 # Light mode: subtle gray overlay
                 self.list.setStyleSheet(
                     """
-                    QListWidget {
+                    QListView {
                         background: #f8f9fa;
                         opacity: 0.8;
                     }
@@ -795,7 +1335,7 @@ class Step4DownloadsWidget(QWidget):
                 # OLED mode: very dark, subtle
                 self.list.setStyleSheet(
                     """
-                    QListWidget {
+                    QListView {
                         background: #0a0a0a;
                         opacity: 0.8;
                     }
@@ -805,7 +1345,7 @@ class Step4DownloadsWidget(QWidget):
                 # Dark mode (default): slightly lighter than normal
                 self.list.setStyleSheet(
                     """
-                    QListWidget {
+                    QListView {
                         background: #1e1f24;
                         opacity: 0.8;
                     }
@@ -859,9 +1399,14 @@ class Step4DownloadsWidget(QWidget):
     def reset(self):
         """Reset widget to initial state and free resources"""
         self._cleanup_bg_metadata()
-        self.list.clear()
+        self._discard_journal()
+        self.model.clear()
         self.items = []
         self._file_map.clear()
+        self._offscreen_progress.clear()
+        self._busy_timer.stop()
+        self._progress.detach()
+        self._progress.reset()
         self.downloader = None
         self._downloading = False
         self.btn_start.setText("Start")
@@ -870,6 +1415,7 @@ class Step4DownloadsWidget(QWidget):
         self.btn_stop.setEnabled(False)
         self.btn_done.setVisible(False)
         self.btn_done.setStyleSheet("")
+        self.btn_discard.setVisible(False)
         self._nightly_prompt_shown = False
 
         # Re-enable buttons for next download session
@@ -885,17 +1431,6 @@ class Step4DownloadsWidget(QWidget):
         except Exception:
             pass
 
-        # Clear thumbnail threads
-        for worker in self._thumb_threads:
-            try:
-                if worker.isRunning():
-                    worker.disconnect()
-                    worker.terminate()
-                    worker.wait(100)
-            except Exception:
-                pass
-        self._thumb_threads.clear()
-
         # Force garbage collection
         try:
             import gc
@@ -904,24 +1439,5 @@ class Step4DownloadsWidget(QWidget):
         except Exception:
             pass
 
-    # Apply a thumbnail to the matching list widget by video URL
-    def _set_dl_thumb_if_match(self, video_url: str, pix: QPixmap):
-        try:
-            for i, it in enumerate(self.items):
-                u = (it.get("webpage_url") or it.get("url")) or ""
-                if u == video_url:
-                    w = self._get_widget(i)
-                    if w:
-                        w.thumb.setPixmap(
-                            pix.scaled(
-                                w.thumb.size(),
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation,
-                            )
-                        )
-                    break
-        except Exception:
-            pass
-
 
 DownloadsWidget = Step4DownloadsWidget
@@ -2,24 +2,35 @@ import os
 import sys
 import signal
 from typing import List, Dict
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import (
-    QApplication,
-    QMainWindow,
-    QWidget,
-    QVBoxLayout,
-    QHBoxLayout,
-    QStackedWidget,
-    QPushButton,
-    QFrame,
-    QScrollArea,
-    QProgressDialog,
-    QDialog,
-    QDialogButtonBox,
-    QTextBrowser,
-    QLabel,
-)
+
+# Frozen builds re-launch this executable as a headless extraction worker;
+# checked before any Qt import so workers start without loading PyQt6
+if "--extract-worker" in sys.argv[1:]:
+    from core.extract_worker import serve
+
+    sys.exit(serve())
+
+from core import startup
+
+with startup.timed("import", "PyQt6"):
+    from PyQt6.QtCore import Qt, QTimer
+    from PyQt6.QtGui import QIcon
+    from PyQt6.QtWidgets import (
+        QApplication,
+        QMainWindow,
+        QWidget,
+        QVBoxLayout,
+        QHBoxLayout,
+        QStackedWidget,
+        QPushButton,
+        QFrame,
+        QScrollArea,
+        QProgressDialog,
+        QDialog,
+        QDialogButtonBox,
+        QTextBrowser,
+        QLabel,
+    )
 
 
 def _app_dir() -> str:
@@ -180,19 +191,21 @@ if getattr(sys, "frozen", False):
         pass
 
 # CHANGED: also import SETTINGS_DIR for user-writable path
-from core.settings import SettingsManager, AppSettings, SETTINGS_DIR
-
-from core.ffmpeg_manager import FfmpegInstaller, ensure_ffmpeg_in_path
-from core.update import YtDlpUpdateWorker, AppUpdateWorker
-from core.yt_manager import InfoFetcher
-from ui.style import StyleManager
-from ui.stepper import Stepper
-from ui.toast import ToastManager
-from features.youtube_converter.step1_link import Step1LinkWidget
-from features.youtube_converter.step3_quality import Step3QualityWidget
-from features.youtube_converter.step4_downloads import Step4DownloadsWidget
-from features.general.settings_page import SettingsPage
-from features.general.faq_page import FaqPage
+with startup.timed("import", "core.settings"):
+    from core.settings import SettingsManager, AppSettings, SETTINGS_DIR
+
+# Updaters, the ffmpeg installer, Settings and the FAQ are imported on first
+# use; yt-dlp and requests load with the first fetch or download
+with startup.timed("import", "ui"):
+    from ui.style import StyleManager
+    from ui.stepper import Stepper
+    from ui.toast import ToastManager
+with startup.timed("import", "steps"):
+    from core.yt_manager import InfoFetcher
+    from features.youtube_converter.step1_link import Step1LinkWidget
+    from features.youtube_converter.step3_quality import Step3QualityWidget
+    from features.youtube_converter.step4_downloads import Step4DownloadsWidget
+from core.idle_tasks import IdleTaskScheduler
 from core.logging import export_logs
 from core.models import UpdateAction
 
@@ -242,13 +255,20 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"YouTube Converter - {APP_VERSION}")
         self.setMinimumSize(1024, 640)
         self.setWindowIcon(QIcon("YTConverterIcon.png"))
-        self.settings_mgr = SettingsManager()
-        self.settings: AppSettings = self.settings_mgr.load()
-        self._migrate_settings()
+        with startup.timed("phase", "SettingsManager.load"):
+            self.settings_mgr = SettingsManager()
+            self.settings: AppSettings = self.settings_mgr.load()
+            self._migrate_settings()
 
         self.style_mgr = StyleManager(self.settings.ui.accent_color_hex)
 
-        self.setStyleSheet(self.style_mgr.qss())
+        # Themed sheet once, before any page exists: setting it afterwards
+        # re-polishes every widget that was already built
+        try:
+            with startup.timed("phase", "stylesheet"):
+                self._apply_theme()
+        except Exception:
+            pass
         self.toast = ToastManager(self)
 
         # Track dependency state
@@ -265,7 +285,8 @@ class MainWindow(QMainWindow):
         self.sidebar = self._build_sidebar()
         self.stepper = Stepper()
         self.stack = QStackedWidget()
-        self._build_pages()
+        with startup.timed("phase", "_build_pages"):
+            self._build_pages()
 
         root = QWidget()
         root_layout = QHBoxLayout(root)
@@ -303,10 +324,25 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # FFmpeg ensure
-        self._ensure_ffmpeg()
-        self._ensure_ytdlp()
+        # Dependency checks, warm workers and update checks wait until the
+        # window is up; the link field is usable before any of them runs
+        self._idle = IdleTaskScheduler(self)
+        self._idle.add("_ensure_ffmpeg", self._ensure_ffmpeg)
+        self._idle.add("_ensure_ytdlp", self._ensure_ytdlp)
+        self._idle.add(
+            "_start_extraction_workers", self._start_extraction_workers, priority=1
+        )
+        self._idle.add("update checks", self._start_update_checks, priority=2)
+        QTimer.singleShot(0, self._idle.start)
 
+        self._refresh_stepper_titles()
+
+        # Offer to continue a batch interrupted by a crash or app exit
+        QTimer.singleShot(0, self._offer_queue_resume)
+
+        self._bg_fetcher = None
+
+    def _start_update_checks(self):
         # yt-dlp auto update per schedule (default Daily)
         try:
             if getattr(self.settings, "ytdlp_update", None):
@@ -333,14 +369,6 @@ class MainWindow(QMainWindow):
             elif getattr(self.settings.app, "check_on_launch", False):
                 self._check_app_updates(check_only=True, prompt_on_available=True)
 
-        self._refresh_stepper_titles()
-
-        self._bg_fetcher = None
-        try:
-            self._apply_theme()
-        except Exception:
-            pass
-
     def _build_sidebar(self) -> QWidget:
         side = QFrame()
         side.setObjectName("Sidebar")
@@ -378,9 +406,10 @@ class MainWindow(QMainWindow):
 
     def _build_pages(self):
         # Home page
-        from features.home.home_page import HomePage
+        with startup.timed("page", "HomePage"):
+            from features.home.home_page import HomePage
 
-        self.home_page = HomePage()
+            self.home_page = HomePage()
 
         # YouTube download flow
         self.page_flow = QWidget()
@@ -388,9 +417,12 @@ class MainWindow(QMainWindow):
         flow_layout.setContentsMargins(0, 0, 0, 0)
         flow_layout.setSpacing(0)
 
-        self.step1 = Step1LinkWidget(self.settings)
-        self.step3 = Step3QualityWidget(self.settings)
-        self.step4 = Step4DownloadsWidget(self.settings)
+        with startup.timed("page", "Step1LinkWidget"):
+            self.step1 = Step1LinkWidget(self.settings)
+        with startup.timed("page", "Step3QualityWidget"):
+            self.step3 = Step3QualityWidget(self.settings)
+        with startup.timed("page", "Step4DownloadsWidget"):
+            self.step4 = Step4DownloadsWidget(self.settings)
 
         self.flow_stack = QStackedWidget()
         self.flow_stack.addWidget(self.step1)
@@ -399,24 +431,34 @@ class MainWindow(QMainWindow):
 
         flow_layout.addWidget(self.flow_stack)
 
-        # Settings page
-        self.settings_page = SettingsPage(self.settings)
-
-        # Make settings scrollable
-        self.settings_scroll = QScrollArea()
-        self.settings_scroll.setWidgetResizable(True)
-        self.settings_scroll.setObjectName("SettingsScrollArea")
-        self.settings_scroll.setWidget(self.settings_page)
-        # Flatten look: remove border/frame, keep scrollbar
-        self.settings_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self.settings_scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            "QScrollArea > QWidget > QWidget { background: transparent; }"
-        )
+        # Settings are built on first visit (_ensure_settings_page)
+        self.settings_page = None
+        self.settings_scroll = None
 
         self.stack.addWidget(self.home_page)
         self.stack.addWidget(self.page_flow)
-        self.stack.addWidget(self.settings_scroll)
+
+    def _ensure_settings_page(self):
+        if self.settings_page is not None:
+            return
+        with startup.timed("page", "SettingsPage"):
+            from features.general.settings_page import SettingsPage
+
+            self.settings_page = SettingsPage(self.settings)
+
+            # Make settings scrollable
+            self.settings_scroll = QScrollArea()
+            self.settings_scroll.setWidgetResizable(True)
+            self.settings_scroll.setObjectName("SettingsScrollArea")
+            self.settings_scroll.setWidget(self.settings_page)
+            # Flatten look: remove border/frame, keep scrollbar
+            self.settings_scroll.setFrameShape(QFrame.Shape.NoFrame)
+            self.settings_scroll.setStyleSheet(
+                "QScrollArea { border: none; background: transparent; }"
+                "QScrollArea > QWidget > QWidget { background: transparent; }"
+            )
+            self.stack.addWidget(self.settings_scroll)
+        self._wire_settings_signals()
 
     def _wire_signals(self):
         self.btn_home.clicked.connect(self._show_home)
@@ -442,6 +484,7 @@ class MainWindow(QMainWindow):
         self.step4.downloadsStarted.connect(lambda: self._lock_ui(True))
         self.step4.downloadsStopped.connect(lambda: self._lock_ui(False))
 
+    def _wire_settings_signals(self):
         # Settings actions
         try:
             self.settings_page.openFaqRequested.connect(self._open_faq)
@@ -498,9 +541,9 @@ class MainWindow(QMainWindow):
             url = payload.get("url") or info.get("webpage_url") or info.get("url")
             if not url:
                 return
-            # Fetch full metadata before adding
+            # Fetch metadata before adding (quality "best" needs no formats)
             self.toast.show("Fetching video info...")
-            self._bg_fetcher = InfoFetcher(url, parent=self)
+            self._bg_fetcher = InfoFetcher(url, parent=self, include_formats=False)
 
             def _ok(meta):
                 # Build default selection (use user's defaults; quality best)
@@ -606,6 +649,33 @@ class MainWindow(QMainWindow):
         self.flow_stack.setCurrentIndex(2)
         self.stepper.set_current(2)
 
+    def _offer_queue_resume(self):
+        try:
+            from core.download_journal import DownloadJournal
+            from PyQt6.QtWidgets import QMessageBox
+
+            journal = DownloadJournal.load()
+            if journal is None:
+                return
+            total = len(journal.items)
+            pending = journal.pending_count()
+            resp = QMessageBox.question(
+                self,
+                "Resume downloads",
+                f"{pending} of {total} download(s) from your last session did not "
+                "finish.\nResume them now?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            )
+            if resp != QMessageBox.StandardButton.Yes:
+                journal.discard()
+                return
+            self._show_youtube()
+            self.flow_stack.setCurrentIndex(2)
+            self.stepper.set_current(2)
+            self.step4.resume_from_journal(journal)
+        except Exception:
+            pass
+
     def _on_downloads_finished(self):
         # Always reset or hold per user preference
         auto_reset = getattr(self.settings.app, "auto_reset_after_downloads", True)
@@ -640,7 +710,8 @@ class MainWindow(QMainWindow):
 
     def _show_settings(self):
         """Show settings page and hide stepper"""
-        self.stack.setCurrentIndex(2)
+        self._ensure_settings_page()
+        self.stack.setCurrentWidget(self.settings_scroll)
         self.stepper.setVisible(False)
 
     def _lock_ui(self, lock: bool):
@@ -820,20 +891,36 @@ class MainWindow(QMainWindow):
         self.yt_install_thread.finished.connect(_after)
         self.yt_install_thread.start()
 
+    def _start_extraction_workers(self):
+        # Warm yt-dlp processes so metadata fetches skip interpreter start-up
+        try:
+            from core.extract_worker import extraction_pool
+
+            pool = extraction_pool()
+            pool.configure(int(getattr(self.settings.ytdlp, "extraction_workers", 2)))
+            pool.warm_up()
+        except Exception:
+            pass
+
     def _check_ytdlp_updates(self, startup: bool = False):
-        if startup:
+        from core.update import YtDlpUpdateWorker
+
+        # A start-up check that only reports stays in toasts; block the
+        # window only while the binary may be replaced
+        blocking = startup and bool(self.settings.ytdlp.auto_update)
+        if blocking:
             self._begin_init("Checking for yt-dlp updates...")
         self._toast("Checking for yt-dlp updates...")
         self.yt_check_thread = YtDlpUpdateWorker(
             self.settings.ytdlp.branch, check_only=True
         )
         self.yt_check_thread.status.connect(
-            lambda s: (self._toast(s), self._update_init(s) if startup else None)
+            lambda s: (self._toast(s), self._update_init(s) if blocking else None)
         )
         if self.settings.ytdlp.auto_update:
             self.yt_check_thread.check_only = False
         self.yt_check_thread.finished.connect(
-            lambda: (self._end_init() if startup else None)
+            lambda: (self._end_init() if blocking else None)
         )
         self.yt_check_thread.start()
 
@@ -910,6 +997,8 @@ class MainWindow(QMainWindow):
         prompt_on_available: bool = False,
         force_update: bool = False,
     ):
+        from core.update import AppUpdateWorker
+
         do_update = (not check_only) and (self.settings.app.auto_update or force_update)
         channel = self.settings.app.channel
         if do_update:
@@ -1103,7 +1192,10 @@ class MainWindow(QMainWindow):
             dlg.setWindowTitle("FAQ")
             dlg.setMinimumSize(640, 480)
             lay = QVBoxLayout(dlg)
-            page = FaqPage(dlg)
+            with startup.timed("page", "FaqPage"):
+                from features.general.faq_page import FaqPage
+
+                page = FaqPage(dlg)
             lay.addWidget(page)
             bb = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
             bb.rejected.connect(dlg.reject)
@@ -1189,7 +1281,8 @@ class MainWindow(QMainWindow):
 
 def main():
     signal.signal(signal.SIGINT, signal.SIG_DFL)
-    app = CrashSafeApplication(sys.argv)
+    with startup.timed("phase", "QApplication"):
+        app = CrashSafeApplication(sys.argv)
     try:
         if hasattr(Qt.ApplicationAttribute, "AA_EnableHighDpiScaling"):
             app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling)
@@ -1197,8 +1290,12 @@ def main():
             app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps)
     except Exception:
         pass
-    win = MainWindow()
-    win.show()
+    with startup.timed("phase", "MainWindow"):
+        win = MainWindow()
+    with startup.timed("phase", "show"):
+        win.show()
+    # First event-loop turn: the window has been laid out and painted
+    QTimer.singleShot(0, startup.finish)
     sys.exit(app.exec())
 
 
@@ -0,0 +1,29 @@
+import os
+import tempfile
+import time
+
+import pytest
+
+# core.settings resolves its directory on import: keep the user's settings,
+# queue journal and metadata cache out of the test run
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="ytc-tests-")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication on the offscreen platform for tests that need Qt."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def wait_until(app, predicate, timeout: float = 5.0) -> bool:
+    """Process Qt events until predicate() holds (False on timeout)."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.01)
+    return True
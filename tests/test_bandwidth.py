@@ -0,0 +1,101 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from core.bandwidth import HEADROOM, MB, MIN_SHARE, BandwidthLimiter, schedule_limit
+
+MONDAY = datetime(2024, 1, 1)
+
+
+def _at(day: datetime, hh: int, mm: int = 0) -> datetime:
+    return day.replace(hour=hh, minute=mm)
+
+
+def _limiter(cap, demand):
+    """Limiter with one flow per demand: None wants a full share, else the
+    observed bytes/s of the last window."""
+    lim = BandwidthLimiter(cap)
+    for key, rate in demand.items():
+        lim.start(key)
+        flow = lim._flows[key]
+        if rate is not None:
+            flow.rate = rate
+            flow.throttled = False
+    now = time.monotonic()
+    lim._window_start = now  # too early to re-measure: keep the rates above
+    lim._reallocate(now)
+    return lim
+
+
+def test_equal_split_when_every_item_wants_more():
+    lim = _limiter(9 * MB, {"a": None, "b": None, "c": None})
+    assert [lim.allocation(k) for k in "abc"] == [3 * MB] * 3
+
+
+def test_water_filling_gives_unused_share_to_the_others():
+    lim = _limiter(10 * MB, {"slow": 1 * MB, "a": None, "b": None})
+    assert lim.allocation("slow") == pytest.approx(HEADROOM * MB)
+    rest = (10 * MB - HEADROOM * MB) / 2
+    assert lim.allocation("a") == pytest.approx(rest)
+    assert lim.allocation("b") == pytest.approx(rest)
+
+
+def test_water_filling_settles_in_rounds():
+    # "mid" is below the fair level only once "slow" has been settled
+    lim = _limiter(12 * MB, {"slow": 0.8 * MB, "mid": 3.4 * MB, "big": None})
+    assert lim.allocation("slow") == pytest.approx(HEADROOM * 0.8 * MB)
+    assert lim.allocation("mid") == pytest.approx(HEADROOM * 3.4 * MB)
+    used = HEADROOM * (0.8 + 3.4) * MB
+    assert lim.allocation("big") == pytest.approx(12 * MB - used)
+
+
+def test_allocation_never_below_min_share():
+    lim = _limiter(4 * MB, {"idle": 0.0, "a": None})
+    assert lim.allocation("idle") == MIN_SHARE
+    assert lim.allocation("a") == pytest.approx(4 * MB - MIN_SHARE)
+
+
+def test_unlimited_and_share():
+    lim = BandwidthLimiter(0)
+    lim.start("a")
+    assert lim.throttle("a", 10 * MB) == 0.0
+    assert lim.share("a") == 0.0
+
+    lim = BandwidthLimiter(8 * MB)
+    lim.start("a")
+    lim.start("b")
+    assert lim.share("a") == 4 * MB  # before the first reallocation
+
+
+def test_throttle_paces_to_the_allocation():
+    lim = BandwidthLimiter(1 * MB)
+    lim.start("a")
+    # Half a second of burst credit, then one second per MB
+    assert lim.throttle("a", 1 * MB) == pytest.approx(0.5, abs=0.05)
+    assert lim.throttle("a", 1 * MB) == pytest.approx(1.5, abs=0.05)
+
+
+def test_schedule_window():
+    rules = [{"start": "09:00", "end": "18:00", "limit_mbps": 2}]
+    assert schedule_limit(rules, _at(MONDAY, 10)) == 2 * MB
+    assert schedule_limit(rules, _at(MONDAY, 18)) is None
+    assert schedule_limit(rules, _at(MONDAY, 8, 59)) is None
+
+
+def test_schedule_wrapping_midnight_belongs_to_its_start_day():
+    rules = [{"start": "22:00", "end": "06:00", "limit_mbps": 1, "days": [0]}]
+    assert schedule_limit(rules, _at(MONDAY, 23)) == 1 * MB
+    tuesday = MONDAY.replace(day=2)
+    assert schedule_limit(rules, _at(tuesday, 3)) == 1 * MB
+    assert schedule_limit(rules, _at(MONDAY, 3)) is None  # Sunday's night
+
+
+def test_schedule_first_match_wins_and_zero_means_unlimited():
+    rules = [
+        {"start": "bad", "end": "10:00", "limit_mbps": 5},
+        {"start": "00:00", "end": "24:00", "limit_mbps": 0},
+        {"start": "00:00", "end": "24:00", "limit_mbps": 3},
+    ]
+    assert schedule_limit(rules, _at(MONDAY, 12)) == 0.0
+    assert schedule_limit([], _at(MONDAY, 12)) is None
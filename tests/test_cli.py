@@ -0,0 +1,122 @@
+import _thread
+import io
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from core import cli
+
+
+class _FakeEngine:
+    """Stands in for DownloadEngine: reports every item done (errors from
+    ERRORS) or, with INTERRUPT, sends Ctrl+C to the main thread and waits."""
+
+    ERRORS = {}
+    INTERRUPT = False
+
+    def __init__(self, items, base, kind, fmt, ffmpeg_location, **options):
+        self.items = items
+        self.ffmpeg_location = ffmpeg_location
+        self.max_concurrent = options.get("max_concurrent") or 1
+        self.listener = options["listener"]
+        self._stop = threading.Event()
+
+    def run(self):
+        if self.INTERRUPT:
+            time.sleep(0.1)
+            _thread.interrupt_main()
+            self._stop.wait(5)
+            return
+        for idx in range(len(self.items)):
+            self.listener.item_done(idx, self.ERRORS.get(idx))
+
+    def stop(self):
+        self._stop.set()
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(cli, "DownloadEngine", _FakeEngine)
+    monkeypatch.setattr(cli, "YTDLP_EXE", sys.executable)
+    monkeypatch.setattr(_FakeEngine, "ERRORS", {})
+    monkeypatch.setattr(_FakeEngine, "INTERRUPT", False)
+    return _FakeEngine
+
+
+def _run(tmp_path, *argv):
+    out = io.StringIO()
+    args = cli.build_parser().parse_args(
+        ["--ignore-settings", "-o", str(tmp_path / "out"), *argv]
+    )
+    code = cli.run(args, out=out)
+    return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_read_urls_order_dedup_and_comments(tmp_path, monkeypatch):
+    listing = tmp_path / "urls.txt"
+    listing.write_text(
+        "\ufeffhttps://a\n# comment\n\n  https://b  \nhttps://a\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(sys, "stdin", io.StringIO("https://c\nhttps://b\n"))
+    urls = cli.read_urls(["https://z", "https://a"], [str(listing), "-"])
+    assert urls == ["https://z", "https://a", "https://b", "https://c"]
+
+
+def test_read_urls_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        cli.read_urls([], [str(tmp_path / "missing.txt")])
+
+
+def test_exit_ok(tmp_path, engine):
+    code, events = _run(tmp_path, "https://a", "https://b")
+    assert code == cli.EXIT_OK == 0
+    assert events[0]["event"] == "start" and events[0]["items"] == 2
+    assert [e["ok"] for e in events if e["event"] == "done"] == [True, True]
+    assert events[-1]["event"] == "finished"
+    assert (events[-1]["ok"], events[-1]["failed"]) == (2, 0)
+
+
+def test_exit_failed(tmp_path, engine):
+    engine.ERRORS = {1: "HTTP Error 403"}
+    code, events = _run(tmp_path, "https://a", "https://b")
+    assert code == cli.EXIT_FAILED == 1
+    done = [e for e in events if e["event"] == "done"]
+    assert done[1] == {
+        "event": "done",
+        "index": 1,
+        "url": "https://b",
+        "ok": False,
+        "error": "HTTP Error 403",
+    }
+    assert (events[-1]["ok"], events[-1]["failed"]) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["-i", "missing.txt"],
+        ["-p", "2", "--journal", "queue.jsonl", "https://a"],
+    ],
+)
+def test_exit_usage(tmp_path, engine, monkeypatch, argv):
+    monkeypatch.chdir(tmp_path)
+    code, events = _run(tmp_path, *argv)
+    assert code == cli.EXIT_USAGE == 2
+    assert events == []
+
+
+def test_bad_arguments_exit_usage():
+    with pytest.raises(SystemExit) as e:
+        cli.main(["--sponsorblock", "bogus", "https://a"])
+    assert e.value.code == cli.EXIT_USAGE
+
+
+def test_exit_interrupted(tmp_path, engine):
+    engine.INTERRUPT = True
+    code, events = _run(tmp_path, "https://a")
+    assert code == cli.EXIT_INTERRUPTED == 130
+    assert events[-1]["event"] == "finished" and events[-1]["stopped"] is True
@@ -0,0 +1,266 @@
+import os
+import threading
+import time
+
+from core.bandwidth import BandwidthLimiter
+from core.download_engine import (
+    DownloadEngine,
+    DownloadListener,
+    _PAUSED,
+    discard_partial_files,
+    partial_files_for,
+)
+
+URLS = [f"https://example.com/v{i}" for i in range(6)]
+
+
+class Recorder(DownloadListener):
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def _add(self, *event):
+        with self._lock:
+            self.events.append(event)
+
+    def item_status(self, idx, text):
+        self._add("status", idx, text)
+
+    def item_stage(self, idx, stage):
+        self._add("stage", idx, stage)
+
+    def item_done(self, idx, error):
+        self._add("done", idx, error)
+
+    def retry_limit_reached(self, message):
+        self._add("retry_limit", None, message)
+
+    def finished_all(self):
+        self._add("finished", None, None)
+
+    def done(self):
+        return {e[1]: e[2] for e in self.events if e[0] == "done"}
+
+    def of(self, kind, idx=None):
+        return [
+            e[2] for e in self.events if e[0] == kind and (idx is None or e[1] == idx)
+        ]
+
+
+class FakeEngine(DownloadEngine):
+    """Runs the real scheduling; each attempt calls ATTEMPT instead of yt-dlp."""
+
+    def __init__(self, urls=URLS, attempt=None, **kwargs):
+        items = [{"webpage_url": u} for u in urls]
+        kwargs.setdefault("listener", Recorder())
+        super().__init__(
+            items, "/tmp", "audio", "mp3", limiter=BandwidthLimiter(), **kwargs
+        )
+        self.attempt = attempt or (lambda engine, idx, stage: (True, None))
+        self.calls = []
+        self.info_jsons = set()
+        self.running = 0
+        self.peak = 0
+        self._calls_lock = threading.Lock()
+
+    def _attempt_download(self, idx, *job, stage="full", info_json=None):
+        with self._calls_lock:
+            self.calls.append((idx, stage, threading.current_thread().name))
+            if info_json:
+                self.info_jsons.add(info_json)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            return self.attempt(self, idx, stage)
+        finally:
+            with self._calls_lock:
+                self.running -= 1
+
+
+def _slow(seconds):
+    def attempt(engine, idx, stage):
+        time.sleep(seconds)
+        return True, None
+
+    return attempt
+
+
+def test_runs_at_most_max_concurrent_items():
+    engine = FakeEngine(attempt=_slow(0.1), max_concurrent=2)
+    engine.run()
+    assert engine.peak == 2
+    assert engine.listener.done() == dict.fromkeys(range(len(URLS)))
+    assert engine.listener.events[-1][0] == "finished"
+
+
+def test_items_start_in_queue_order():
+    engine = FakeEngine(attempt=_slow(0.02), max_concurrent=1)
+    engine.run()
+    assert [idx for idx, _stage, _t in engine.calls] == list(range(len(URLS)))
+
+
+def test_failed_attempts_are_retried_per_item():
+    failures = {1: 2}  # item 1 fails twice, then succeeds
+
+    def attempt(engine, idx, stage):
+        if failures.get(idx, 0) > 0:
+            failures[idx] -= 1
+            return False, "HTTP Error 503"
+        return True, None
+
+    engine = FakeEngine(urls=URLS[:3], attempt=attempt, max_concurrent=3)
+    engine.run()
+    rec = engine.listener
+    assert [idx for idx, _s, _t in engine.calls].count(1) == 3
+    assert "Retrying (2/3)…" in rec.of("status", 1)
+    assert rec.done() == {0: None, 1: None, 2: None}
+    assert rec.of("retry_limit") == []
+
+
+def test_retry_limit_reports_failure():
+    def attempt(engine, idx, stage):
+        return (False, "gone") if idx == 0 else (True, None)
+
+    engine = FakeEngine(urls=URLS[:2], attempt=attempt, max_concurrent=2)
+    engine.run()
+    rec = engine.listener
+    assert [idx for idx, _s, _t in engine.calls].count(0) == engine.max_retries + 1
+    assert rec.done() == {0: "gone", 1: None}
+    assert rec.of("status", 0)[-1] == "Failed: gone"
+    assert len(rec.of("retry_limit")) == 1
+
+
+def test_stop_leaves_queued_items_unstarted():
+    def attempt(engine, idx, stage):
+        engine.stop()
+        return False, "Stopped"
+
+    engine = FakeEngine(attempt=attempt, max_concurrent=1)
+    engine.run()
+    assert len(engine.calls) == 1
+    assert engine.listener.done() == {}
+    assert engine.listener.of("finished") == []
+
+
+def test_pipeline_converts_on_a_separate_pool():
+    finished = {}
+
+    def attempt(engine, idx, stage):
+        if stage == "post":
+            time.sleep(0.2)
+        finished[(idx, stage)] = time.monotonic()
+        return True, None
+
+    engine = FakeEngine(urls=URLS[:3], attempt=attempt, max_concurrent=1, pipeline=True)
+    engine.run()
+    stages = [(idx, stage) for idx, stage, _t in engine.calls]
+    assert sorted(stages) == [(i, s) for i in range(3) for s in ("download", "post")]
+    threads = {
+        stage: {t.split("_")[0] for _i, st, t in engine.calls if st == stage}
+        for stage in ("download", "post")
+    }
+    assert threads == {"download": {"yt-download"}, "post": {"yt-postprocess"}}
+    # The download worker never waited for a conversion
+    last_download = max(t for (i, st), t in finished.items() if st == "download")
+    first_post = min(t for (i, st), t in finished.items() if st == "post")
+    assert last_download < first_post
+    assert engine.listener.done() == {0: None, 1: None, 2: None}
+    assert engine.listener.of("stage", 0) == ["downloading", "converting"]
+
+
+def test_pipeline_falls_back_to_a_full_run():
+    def attempt(engine, idx, stage):
+        return (False, "ffmpeg failed") if stage == "post" else (True, None)
+
+    engine = FakeEngine(urls=URLS[:1], attempt=attempt, pipeline=True)
+    engine.run()
+    assert [stage for _i, stage, _t in engine.calls] == ["download", "post", "full"]
+    assert "Retrying conversion…" in engine.listener.of("status", 0)
+    assert engine.listener.done() == {0: None}
+
+
+def test_pipeline_work_dir_is_removed():
+    engine = FakeEngine(urls=URLS[:2], pipeline=True)
+    engine.run()
+    assert engine.info_jsons
+    for path in engine.info_jsons:
+        assert not os.path.exists(os.path.dirname(path))
+
+
+VID = "abcDEF123_-"
+OTHER = "zzzzzzzzzzz"
+
+
+def _touch(folder, *names):
+    for name in names:
+        with open(os.path.join(folder, name), "w") as f:
+            f.write("x")
+
+
+def test_partial_files_scoped_by_id_tag(tmp_path):
+    ours = [
+        f"Song [{VID}].webm.part",
+        f"Song [{VID}].f251.webm",
+        f"Song [{VID}].f137.mp4.part",
+        f"Song [{VID}].webm.part-Frag3.part",
+        f"Song [{VID}].webm.ytdl",
+        f"Song [{VID}].temp.mp3",
+    ]
+    kept = [
+        f"Song [{VID}].mp3",  # finished output
+        f"Other [{OTHER}].webm.part",  # another download in the same folder
+        f"{VID} notes.webm.part",  # ID without our "[id]" tag
+        f"Song [{VID}].webm.part.bak",
+    ]
+    _touch(tmp_path, *ours, *kept)
+    os.mkdir(tmp_path / f"Dir [{VID}].webm.part")
+
+    found = partial_files_for(str(tmp_path), [VID, ""])
+    assert sorted(os.path.basename(p) for p in found) == sorted(ours)
+
+    assert discard_partial_files(str(tmp_path), [VID]) == len(ours)
+    assert sorted(os.listdir(tmp_path)) == sorted(kept + [f"Dir [{VID}].webm.part"])
+
+
+def test_partial_files_without_ids_or_folder(tmp_path):
+    _touch(tmp_path, f"Song [{VID}].webm.part")
+    assert partial_files_for(str(tmp_path), []) == []
+    assert partial_files_for(str(tmp_path), [""]) == []
+    assert partial_files_for(str(tmp_path / "missing"), [VID]) == []
+
+
+def test_pause_mid_download_resumes_without_using_a_retry():
+    def attempt(engine, idx, stage):
+        if len(engine.calls) == 1:
+            # Aborted by a pause (Python API path / unsuspendable binary)
+            engine.pause_item(idx)
+            threading.Timer(0.3, engine.resume_item, args=(idx,)).start()
+            return False, _PAUSED
+        return True, None
+
+    engine = FakeEngine(urls=URLS[:1], attempt=attempt)
+    engine.run()
+    statuses = engine.listener.of("status", 0)
+    assert len(engine.calls) == 2
+    assert "Paused" in statuses and "Resuming..." in statuses
+    assert not any(s.startswith("Retrying") for s in statuses)
+    assert engine.listener.done() == {0: None}
+
+
+def test_paused_batch_waits_before_starting_items():
+    engine = FakeEngine(urls=URLS[:2])
+    engine.pause()
+    runner = threading.Thread(target=engine.run)
+    runner.start()
+    time.sleep(0.4)
+    assert engine.calls == []
+    engine.resume()
+    runner.join(5)
+    assert engine.listener.done() == {0: None, 1: None}
+
+
+def test_finished_items_are_not_paused():
+    engine = FakeEngine(urls=URLS[:1])
+    engine.run()
+    engine.pause_item(0)
+    assert not engine.is_item_paused(0)
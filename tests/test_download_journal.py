@@ -0,0 +1,83 @@
+from core import download_journal
+from core.download_journal import DownloadJournal
+from core.models import DownloadState
+
+ITEMS = [
+    {"id": "aaaaaaaaaaa", "title": "A", "webpage_url": "https://youtu.be/aaaaaaaaaaa"},
+    {"id": "bbbbbbbbbbb", "title": "B", "webpage_url": "https://youtu.be/bbbbbbbbbbb"},
+]
+
+
+def _begin(tmp_path):
+    path = str(tmp_path / "downloads.jsonl")
+    return DownloadJournal.begin(str(tmp_path), "audio", "mp3", "best", ITEMS, path)
+
+
+def test_replay_ignores_truncated_last_line(tmp_path):
+    j = _begin(tmp_path)
+    j.mark(0, DownloadState.COMPLETED, output_path="A.mp3")
+    j.close()
+    with open(j.path, "a", encoding="utf-8") as f:
+        f.write('{"op": "item", "idx": 1, "state": "COMPL')
+
+    loaded = DownloadJournal.load(j.path)
+    assert loaded is not None
+    assert loaded.batch_id == j.batch_id
+    assert loaded.is_completed(0)
+    assert loaded.state(0).output_path == "A.mp3"
+    assert loaded.state(1).state == DownloadState.CREATED.value
+    assert loaded.pending_count() == 1
+
+
+def test_replay_restores_progress(tmp_path):
+    j = _begin(tmp_path)
+    j.mark(1, DownloadState.DOWNLOADING)
+    j.progress(1, 512, 2048)
+    j.close()
+
+    st = DownloadJournal.load(j.path).state(1)
+    assert st.state == DownloadState.DOWNLOADING.value
+    assert (st.downloaded_bytes, st.total_bytes) == (512, 2048)
+    assert st.progress == 25.0
+
+
+def test_completed_clears_earlier_error(tmp_path):
+    j = _begin(tmp_path)
+    j.mark(0, DownloadState.FAILED, error="HTTP Error 403")
+    assert j.state(0).error == "HTTP Error 403"
+    j.mark(0, DownloadState.COMPLETED, output_path="A.mp3")
+    assert j.state(0).error is None
+    j.close()
+
+    assert DownloadJournal.load(j.path).state(0).error is None
+
+
+def test_load_discards_finished_batch(tmp_path):
+    j = _begin(tmp_path)
+    j.mark(0, DownloadState.COMPLETED)
+    j.mark(1, DownloadState.COMPLETED)
+    j.close()
+
+    assert DownloadJournal.load(j.path) is None
+    assert not (tmp_path / "downloads.jsonl").exists()
+
+
+def test_compaction_keeps_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(download_journal, "COMPACT_AFTER", 3)
+    j = _begin(tmp_path)
+    j.mark(0, DownloadState.DOWNLOADING)
+    j.mark(0, DownloadState.FAILED, error="boom")
+    j.mark(1, DownloadState.DOWNLOADING)
+    j.mark(0, DownloadState.COMPLETED, output_path="A.mp3")
+    j.close()
+
+    with open(j.path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    # Header snapshot plus the one record appended after the rewrite
+    assert len(lines) == 2
+    loaded = DownloadJournal.load(j.path)
+    assert loaded.is_completed(0)
+    assert loaded.state(0).output_path == "A.mp3"
+    assert loaded.state(0).error is None  # cleared by the later success
+    assert loaded.state(1).state == DownloadState.DOWNLOADING.value
+    assert loaded.matches(ITEMS)
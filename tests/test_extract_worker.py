@@ -0,0 +1,114 @@
+import threading
+import time
+import zipfile
+
+import pytest
+
+from core import extract_worker, update_engine
+from core.extract_worker import ExtractionPool, version_key
+
+# Stand-in for yt-dlp's zipapp: enough of yt_dlp for the worker protocol
+_STUB = """
+import time
+from . import version
+
+
+class YoutubeDL:
+    def __init__(self, opts):
+        self.opts = opts
+
+    def extract_info(self, url, download=False):
+        if "slow" in url:
+            time.sleep(1.5)
+        if "fail" in url:
+            raise ValueError("Unsupported URL: " + url)
+        return {
+            "id": url.rsplit("/", 1)[-1],
+            "flat": self.opts["extract_flat"],
+            "tv": "extractor_args" in self.opts,
+        }
+
+    def sanitize_info(self, info):
+        return info
+
+    def close(self):
+        pass
+"""
+
+
+def _zipapp(path, version):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("__main__.py", "")
+        zf.writestr("yt_dlp/__init__.py", _STUB)
+        zf.writestr("yt_dlp/version.py", f"__version__ = '{version}'\n")
+    return str(path)
+
+
+@pytest.fixture
+def make_pool(tmp_path, monkeypatch):
+    pools = []
+
+    def make(module_version, binary_version="2025.01.15", size=1):
+        module = _zipapp(tmp_path / f"yt-dlp-{module_version}.pyz", module_version)
+        monkeypatch.setattr(extract_worker, "YTDLP_MODULE", module)
+        monkeypatch.setattr(extract_worker, "_binary_version", lambda: binary_version)
+        pool = ExtractionPool(size=size)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+
+def test_version_key_orders_releases_and_nightlies():
+    assert version_key("2025.01.15") < version_key("2025.01.15.232")
+    assert version_key("2024.12.31") < version_key("2025.01.01")
+    assert version_key("") < version_key("2020.01.01")
+
+
+def test_module_version_read_from_zipapp(tmp_path):
+    path = _zipapp(tmp_path / "yt-dlp.pyz", "2025.02.19")
+    assert update_engine.current_module_version(path) == "2025.02.19"
+    assert update_engine.current_module_version(str(tmp_path / "missing")) == ""
+
+
+def test_workers_run_the_updated_module(make_pool):
+    pool = make_pool("2025.01.15")
+    info = pool.extract("https://example.com/abc", flat=True)
+    assert info == {"id": "abc", "flat": True, "tv": True}
+    assert pool.enabled and not pool.outdated
+    assert pool._idle[0].version == "2025.01.15"
+
+
+def test_extraction_error_is_reported(make_pool):
+    pool = make_pool("2025.01.15")
+    with pytest.raises(RuntimeError, match="Unsupported URL"):
+        pool.extract("https://example.com/fail")
+    assert pool.enabled  # a failed extraction does not retire the pool
+
+
+def test_pool_retires_when_module_is_older_than_binary(make_pool):
+    pool = make_pool("2024.12.01", binary_version="2025.01.15")
+    with pytest.raises(RuntimeError):
+        pool.extract("https://example.com/abc")
+    assert pool.outdated and not pool.enabled
+    with pytest.raises(RuntimeError, match="disabled"):
+        pool.extract("https://example.com/abc")
+
+    pool.restart()  # e.g. after the module was updated
+    assert not pool.outdated
+
+
+def test_busy_pool_fails_fast_instead_of_queueing(make_pool):
+    pool = make_pool("2025.01.15", size=1)
+    pool.extract("https://example.com/warm")
+    slow = threading.Thread(target=pool.extract, args=("https://example.com/slow",))
+    slow.start()
+    time.sleep(0.3)
+    t0 = time.monotonic()
+    with pytest.raises(RuntimeError, match="No extraction worker free"):
+        pool.extract("https://example.com/other")
+    assert time.monotonic() - t0 < 0.5
+    slow.join()
+    assert pool.extract("https://example.com/other")["id"] == "other"
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+
+from core import fetch_engine
+from core.fetch_engine import BatchFetchListener, BatchInfoFetch, InfoFetch
+from core.metadata_cache import MetadataCache
+from core.runtime import runtime
+
+
+class FakePool:
+    enabled = True
+
+    def __init__(self):
+        self.calls = []
+
+    def extract(self, url, flat=False, timeout=60):
+        self.calls.append((url, flat, timeout))
+        return {"id": url.rsplit("=", 1)[-1], "title": "warm"}
+
+
+def test_warm_worker_gets_the_fetch_timeout(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(fetch_engine, "extraction_pool", lambda: pool)
+    url = "https://www.youtube.com/playlist?list=PL123"
+    info = InfoFetch(url, timeout_sec=7, use_cache=False).fetch()
+    assert info["title"] == "warm"
+    assert pool.calls == [(url, True, 7)]
+
+
+class Collector(BatchFetchListener):
+    def __init__(self):
+        self.ok = {}
+        self.failed = {}
+        self.progress_calls = []
+
+    def item_ok(self, url, info):
+        self.ok[url] = info
+
+    def item_failed(self, url, error):
+        self.failed[url] = error
+
+    def progress(self, done, total):
+        self.progress_calls.append((done, total))
+
+
+class TimedPool(FakePool):
+    def __init__(self, fail=()):
+        super().__init__()
+        self.started = []
+        self.fail = set(fail)
+
+    def extract(self, url, flat=False, timeout=60):
+        self.started.append(time.monotonic())
+        if url in self.fail:
+            raise RuntimeError("HTTP Error 429: Too Many Requests")
+        return super().extract(url, flat, timeout)
+
+
+def _watch(vid):
+    return f"https://www.youtube.com/watch?v={vid}"
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    c = MetadataCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(fetch_engine, "metadata_cache", lambda: c)
+    yield c
+    c.close()
+
+
+def _run(batch):
+    batch.listener = Collector()
+    runtime().run(batch.run())
+    return batch.listener
+
+
+def test_cache_hits_skip_request_spacing(cache, monkeypatch):
+    pool = TimedPool()
+    monkeypatch.setattr(fetch_engine, "extraction_pool", lambda: pool)
+    vids = [f"vid{i:08d}" for i in range(20)]
+    for vid in vids:
+        cache.put({"id": vid, "title": vid, "formats": [{"format_id": "18"}]})
+
+    t0 = time.monotonic()
+    rec = _run(BatchInfoFetch([_watch(v) for v in vids], min_interval=0.5))
+    assert time.monotonic() - t0 < 0.5
+    assert {url: info["title"] for url, info in rec.ok.items()} == {
+        _watch(v): v for v in vids
+    }
+    assert pool.calls == []
+
+
+def test_misses_are_spaced_and_deduplicated(cache, monkeypatch):
+    pool = TimedPool()
+    monkeypatch.setattr(fetch_engine, "extraction_pool", lambda: pool)
+    cache.put({"id": "cachedvid01", "title": "hit", "formats": [{}]})
+    urls = [_watch("miss0000001"), _watch("cachedvid01"), _watch("miss0000002")]
+
+    rec = _run(BatchInfoFetch(urls + urls[:1], max_concurrent=4, min_interval=0.2))
+    assert len(pool.calls) == 2  # duplicate dropped, hit served from cache
+    assert pool.started[1] - pool.started[0] >= 0.19
+    assert set(rec.ok) == set(urls)
+    assert rec.ok[urls[1]]["title"] == "hit"
+    assert rec.progress_calls[-1] == (3, 3)
+
+
+def test_throttling_backs_off(cache, monkeypatch):
+    url = _watch("limited0001")
+    pool = TimedPool(fail={url})
+    monkeypatch.setattr(fetch_engine, "extraction_pool", lambda: pool)
+    monkeypatch.setattr(fetch_engine, "YTDLP_EXE", "/nonexistent/yt-dlp.exe")
+
+    def throttled(self, use_tv_client=True):
+        raise RuntimeError("HTTP Error 429: Too Many Requests")
+
+    monkeypatch.setattr(InfoFetch, "_extract_with_python_api", throttled)
+    batch = BatchInfoFetch([url], min_interval=0.1)
+    rec = _run(batch)
+    assert "429" in rec.failed[url]
+    assert batch.min_interval == 0.5
@@ -0,0 +1,50 @@
+from core.idle_tasks import IdleTaskScheduler
+from tests.conftest import wait_until
+
+
+def test_runs_by_priority_then_order_added_after_start(qapp):
+    sched = IdleTaskScheduler(gap_ms=0)
+    ran = []
+    finished = []
+    sched.finished.connect(lambda: finished.append(True))
+    sched.add("late", lambda: ran.append("late"), priority=5)
+    sched.add("a", lambda: ran.append("a"))
+    sched.add("b", lambda: ran.append("b"))
+    assert sched.pending() == ["a", "b", "late"]
+    qapp.processEvents()
+    assert ran == []  # nothing runs before start()
+    sched.start()
+    assert wait_until(qapp, lambda: finished)
+    assert ran == ["a", "b", "late"]
+    assert sched.pending() == []
+
+
+def test_failing_task_is_logged_and_queue_continues(qapp, caplog):
+    sched = IdleTaskScheduler(gap_ms=0)
+    ran = []
+    finished = []
+    sched.finished.connect(lambda: finished.append(True))
+
+    def boom():
+        raise ValueError("probe failed")
+
+    sched.add("boom", boom)
+    sched.add("next", lambda: ran.append("next"))
+    with caplog.at_level("ERROR", logger="YoutubeConverter"):
+        sched.start()
+        assert wait_until(qapp, lambda: finished)
+    assert ran == ["next"]
+    assert "Idle task boom failed" in caplog.text
+
+
+def test_tasks_added_after_drain_run_and_finish_again(qapp):
+    sched = IdleTaskScheduler(gap_ms=0)
+    finished = []
+    sched.finished.connect(lambda: finished.append(True))
+    sched.add("first", lambda: None)
+    sched.start()
+    assert wait_until(qapp, lambda: len(finished) == 1)
+    ran = []
+    sched.add("second", lambda: ran.append("second"))
+    assert wait_until(qapp, lambda: len(finished) == 2)
+    assert ran == ["second"]
@@ -0,0 +1,101 @@
+import threading
+
+from core.io_pool import PREFETCH, VISIBLE, CancelToken, IOPool
+
+
+def _blocked_pool():
+    """One-worker pool busy on a job until the returned event is set."""
+    pool = IOPool(workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    pool.submit("block", block)
+    started.wait(5)
+    return pool, release
+
+
+def _collect(pool, order, done, keys, **kwargs):
+    for key in keys:
+        pool.submit(
+            key, lambda k=key: order.append(k), lambda _r: done.release(), **kwargs
+        )
+
+
+def test_visible_jobs_run_before_prefetch_fifo_within_priority():
+    pool, release = _blocked_pool()
+    order = []
+    done = threading.Semaphore(0)
+    _collect(pool, order, done, ["p1", "p2"], priority=PREFETCH)
+    _collect(pool, order, done, ["v1", "v2"], priority=VISIBLE)
+    pool.prioritize("p2")
+    release.set()
+    for _ in range(4):
+        assert done.acquire(timeout=5)
+    assert order == ["v1", "v2", "p2", "p1"]
+
+
+def test_same_key_runs_once_and_notifies_every_caller():
+    pool, release = _blocked_pool()
+    runs = []
+    results = []
+    done = threading.Semaphore(0)
+
+    def job():
+        runs.append(1)
+        return "data"
+
+    def callback(result):
+        results.append(result)
+        done.release()
+
+    assert pool.submit("k", job, callback) is True
+    assert pool.submit("k", job, callback) is False
+    release.set()
+    for _ in range(2):
+        assert done.acquire(timeout=5)
+    assert runs == [1]
+    assert results == ["data", "data"]
+
+
+def test_cancelled_jobs_are_dropped_unrun():
+    pool, release = _blocked_pool()
+    token = CancelToken()
+    ran = []
+    done = threading.Event()
+    pool.submit("a", lambda: ran.append("a"), lambda _r: ran.append("cb"), token=token)
+    pool.submit("b", lambda: ran.append("b"), lambda _r: done.set())
+    token.cancel()
+    release.set()
+    assert done.wait(5)
+    assert ran == ["b"]
+    assert pool.pending() == 0
+
+
+def test_cancelled_caller_gets_no_callback_but_others_do():
+    pool, release = _blocked_pool()
+    token = CancelToken()
+    got = []
+    done = threading.Event()
+    pool.submit("k", lambda: 1, lambda r: got.append(("cancelled", r)), token=token)
+    pool.submit("k", lambda: 1, lambda r: (got.append(("kept", r)), done.set()))
+    token.cancel()
+    release.set()
+    assert done.wait(5)
+    assert got == [("kept", 1)]
+
+
+def test_failing_job_reports_none():
+    pool = IOPool(workers=1)
+    got = []
+    done = threading.Event()
+
+    def boom():
+        raise OSError("network down")
+
+    pool.submit("x", boom, lambda r: (got.append(r), done.set()))
+    assert done.wait(5)
+    assert got == [None]
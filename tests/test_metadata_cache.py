@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core import metadata_cache
+from core.metadata_cache import MetadataCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(metadata_cache, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = MetadataCache(
+        str(tmp_path / "cache.sqlite3"), max_entries=2, formats_ttl=60, static_ttl=600
+    )
+    yield c
+    c.close()
+
+
+def _info(vid):
+    return {"id": vid, "title": f"Title {vid}", "formats": [{"format_id": "251"}]}
+
+
+def test_formats_expire_before_static_fields(cache, clock):
+    cache.put({**_info("a"), "url": "https://signed"})
+    clock[0] += 30
+    assert cache.get("a")["formats"] == [{"format_id": "251"}]
+
+    clock[0] += 31
+    assert cache.get("a") is None
+    info = cache.get("a", include_formats=False)
+    assert info["title"] == "Title a"
+    assert "formats" not in info and "url" not in info
+
+    clock[0] += 600
+    assert cache.get("a", include_formats=False) is None
+
+
+def test_lru_evicts_least_recently_used(cache, clock):
+    cache.put(_info("a"))
+    clock[0] += 1
+    cache.put(_info("b"))
+    clock[0] += 1
+    assert cache.get("a") is not None  # a is now more recent than b
+    clock[0] += 1
+    cache.put(_info("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_uncacheable_entries_are_skipped(cache, clock):
+    cache.put({"title": "no id"})
+    cache.put({**_info("live"), "is_live": True})
+    cache.put({**_info("pl"), "_type": "playlist"})
+    assert cache.get("live") is None
+    assert cache.get("pl") is None
+    assert cache.get("") is None
+
+
+def test_invalidate(cache, clock):
+    cache.put(_info("a"))
+    cache.invalidate("a")
+    assert cache.get("a", include_formats=False) is None
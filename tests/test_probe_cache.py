@@ -0,0 +1,68 @@
+import os
+
+from core.probe_cache import ProbeCache
+
+
+def _tool(tmp_path, data=b"tool v1"):
+    exe = tmp_path / "tool.exe"
+    exe.write_bytes(data)
+    return str(exe)
+
+
+def _counting(value):
+    calls = []
+
+    def run():
+        calls.append(1)
+        return value
+
+    return run, calls
+
+
+def test_result_is_reused_across_instances(tmp_path):
+    exe = _tool(tmp_path)
+    path = str(tmp_path / "probe.json")
+    run, calls = _counting("2025.01.01")
+    assert ProbeCache(path).cached("version", exe, run) == "2025.01.01"
+    assert ProbeCache(path).cached("version", exe, run) == "2025.01.01"
+    assert len(calls) == 1
+
+
+def test_touched_file_with_same_bytes_keeps_result(tmp_path):
+    exe = _tool(tmp_path)
+    cache = ProbeCache(str(tmp_path / "probe.json"))
+    cache.put("version", exe, "1.0")
+    st = os.stat(exe)
+    os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    assert cache.get("version", exe) == "1.0"
+
+
+def test_changed_file_is_probed_again(tmp_path):
+    exe = _tool(tmp_path)
+    cache = ProbeCache(str(tmp_path / "probe.json"))
+    cache.put("version", exe, "1.0")
+    st = os.stat(exe)
+    with open(exe, "wb") as f:
+        f.write(b"tool v2")  # same size, new bytes
+    os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    assert cache.get("version", exe) is None
+    with open(exe, "ab") as f:
+        f.write(b"-longer")
+    assert cache.get("version", exe) is None
+
+
+def test_failed_probe_is_not_stored(tmp_path):
+    exe = _tool(tmp_path)
+    cache = ProbeCache(str(tmp_path / "probe.json"))
+    run, calls = _counting("")
+    cache.cached("version", exe, run)
+    cache.cached("version", exe, run)
+    assert len(calls) == 2
+
+
+def test_probes_and_missing_files_are_separate(tmp_path):
+    exe = _tool(tmp_path)
+    cache = ProbeCache(str(tmp_path / "probe.json"))
+    cache.put("version", exe, "1.0")
+    assert cache.get("features", exe) is None
+    assert cache.get("version", str(tmp_path / "missing.exe")) is None
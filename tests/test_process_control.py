@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from core.process_control import (
+    kill_process,
+    popen_kwargs,
+    resume_process,
+    suspend_process,
+    track_process,
+)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="POSIX process groups")
+
+# Parent and child each append to their own file every 20 ms
+_TREE = """
+import subprocess, sys, time
+
+def tick(path):
+    while True:
+        with open(path, "a") as f:
+            f.write("x")
+        time.sleep(0.02)
+
+if sys.argv[1] == "parent":
+    subprocess.Popen([sys.executable, __file__, "child", sys.argv[3]])
+    tick(sys.argv[2])
+else:
+    tick(sys.argv[2])
+"""
+
+
+def _size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _growing(paths, seconds=0.3):
+    before = [_size(p) for p in paths]
+    time.sleep(seconds)
+    return [_size(p) > b for p, b in zip(paths, before)]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    script = tmp_path / "tree.py"
+    script.write_text(_TREE)
+    paths = [str(tmp_path / "parent.log"), str(tmp_path / "child.log")]
+    proc = subprocess.Popen(
+        [sys.executable, str(script), "parent", *paths], **popen_kwargs()
+    )
+    assert track_process(proc)
+    deadline = time.monotonic() + 5
+    while not all(_size(p) for p in paths) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    yield proc, paths
+    kill_process(proc)
+    proc.wait(5)
+
+
+def test_suspend_holds_the_whole_tree(tree):
+    proc, paths = tree
+    assert _growing(paths) == [True, True]
+    assert suspend_process(proc)
+    time.sleep(0.1)  # writes already in flight
+    assert _growing(paths) == [False, False]
+    assert resume_process(proc)
+    assert _growing(paths) == [True, True]
+
+
+def test_kill_reaches_a_suspended_tree(tree):
+    proc, paths = tree
+    suspend_process(proc)
+    kill_process(proc)
+    assert proc.wait(5) != 0
+    assert _growing(paths) == [False, False]
+    assert not suspend_process(proc)  # already gone
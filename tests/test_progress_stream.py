@@ -0,0 +1,45 @@
+from core.progress_stream import (
+    ErrorEvent,
+    ProgressEvent,
+    ProgressStreamParser,
+    StageEvent,
+    parse_line,
+)
+
+
+def test_events_split_across_chunks():
+    p = ProgressStreamParser()
+    assert p.feed(b"[youtube] abc: Downloading webpage\n@D|100|1000|NA|") == []
+    events = p.feed(b"50.5|3\r\n@P|started|Extract")
+    assert events == [ProgressEvent(100.0, 1000.0, 50.5, 3)]
+    events = p.feed(b"Audio\nWARNING: noise\nERROR: boom \n")
+    assert events == [StageEvent("started", "ExtractAudio"), ErrorEvent("boom")]
+    assert events[0].label == "Converting audio…"
+
+
+def test_close_parses_trailing_line():
+    p = ProgressStreamParser()
+    assert p.feed(b"@D|5|10|NA|1|1") == []
+    assert p.close() == [ProgressEvent(5.0, 10.0, 1.0, 1)]
+    assert p.close() == []
+
+
+def test_na_fields():
+    ev = parse_line(b"@D|100|NA|NA|NA|NA")
+    assert ev == ProgressEvent(100.0, 0.0, None, None)
+    assert ev.percent == 0.0
+    ev = parse_line(b"@D|NA|None|NA|0|0")
+    assert ev == ProgressEvent(0.0, 0.0, 0.0, 0)
+
+
+def test_total_falls_back_to_estimate():
+    ev = parse_line(b"@D|50|NA|200.0|NA|7")
+    assert ev == ProgressEvent(50.0, 200.0, None, 7)
+    assert ev.percent == 25.0
+
+
+def test_malformed_lines_are_dropped():
+    p = ProgressStreamParser()
+    assert p.feed(b"@D|1|2|3\n@P|started\n@X|1\n\n") == []
+    assert StageEvent("started", "MoveFilesAfterDownload").label == ""
+    assert StageEvent("finished", "Merger").label == ""
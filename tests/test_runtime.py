@@ -0,0 +1,103 @@
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+
+from core.qt_bridge import RuntimeWorker
+import core.runtime as runtime_mod
+from core.runtime import Runtime
+from tests.conftest import wait_until
+
+
+@pytest.fixture
+def rt():
+    return Runtime(blocking_workers=2)
+
+
+def test_run_blocking_times_out_and_signals_cancel(rt):
+    stopped = threading.Event()
+
+    def work(cancel):
+        while not cancel.wait(0.01):
+            pass
+        stopped.set()
+
+    with pytest.raises(asyncio.TimeoutError):
+        rt.run(rt.run_blocking(work, timeout=0.1, cancellable=True), timeout=5)
+    assert stopped.wait(2)
+
+
+def test_cancelling_the_future_stops_cooperative_work(rt):
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def work(cancel):
+        started.set()
+        cancel.wait(5)
+        stopped.set()
+
+    fut = rt.submit(rt.run_blocking(work, cancellable=True))
+    assert started.wait(2)
+    fut.cancel()
+    assert stopped.wait(2)
+
+
+def test_run_process_kills_the_child_on_timeout(rt):
+    code = "import time; time.sleep(30)"
+    t0 = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        rt.run(rt.run_process([sys.executable, "-c", code], timeout=0.3), timeout=10)
+    assert time.monotonic() - t0 < 5
+    rc, out, _ = rt.run(rt.run_process([sys.executable, "-c", "print('ok')"]))
+    assert (rc, out.strip()) == (0, b"ok")
+
+
+def test_limit_is_shared_per_name(rt, monkeypatch):
+    monkeypatch.setitem(runtime_mod.LIMITS, "probe", 2)
+    active = peak = 0
+
+    async def job():
+        nonlocal active, peak
+        async with rt.limit("probe"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+
+    async def batch():
+        await asyncio.gather(*(job() for _ in range(6)))
+
+    rt.run(batch(), timeout=5)
+    assert peak == 2
+    assert rt.limit("probe") is rt.limit("probe")
+
+
+def test_run_refuses_the_loop_thread(rt):
+    async def nested():
+        coro = asyncio.sleep(0)
+        try:
+            rt.run(coro)
+        finally:
+            coro.close()
+
+    with pytest.raises(RuntimeError, match="runtime thread"):
+        rt.run(nested(), timeout=5)
+
+
+class _Failing(RuntimeWorker):
+    async def main(self):
+        raise RuntimeError("real failure")
+
+
+def test_worker_error_is_logged_not_swallowed(qapp, caplog):
+    worker = _Failing()
+    finished = []
+    worker.finished.connect(lambda: finished.append(True))
+    with caplog.at_level("ERROR", logger="YoutubeConverter"):
+        worker.start()
+        assert wait_until(qapp, lambda: finished)
+    assert "_Failing.main() failed" in caplog.text
+    with pytest.raises(RuntimeError, match="real failure"):
+        worker._future.result(1)
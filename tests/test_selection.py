@@ -0,0 +1,61 @@
+from core.selection import SelectionIndex, selection_key
+
+VID = "dQw4w9WgXcQ"
+
+
+def _entry(url, **fields):
+    return {"webpage_url": url, **fields}
+
+
+def test_key_is_video_id_across_url_spellings():
+    assert selection_key(_entry(f"https://www.youtube.com/watch?v={VID}")) == VID
+    assert selection_key(_entry(f"https://youtu.be/{VID}")) == VID
+    assert selection_key({"url": f"https://youtube.com/shorts/{VID}"}) == VID
+    assert selection_key(_entry("https://example.com/a")) == "https://example.com/a"
+    assert selection_key({}) == ""
+    assert selection_key(None) == ""
+
+
+def test_keeps_insertion_order():
+    sel = SelectionIndex()
+    for n in ("c", "a", "b"):
+        sel.upsert(_entry(f"https://example.com/{n}"))
+    assert [e["webpage_url"][-1] for e in sel] == ["c", "a", "b"]
+    sel.remove(_entry("https://example.com/a"))
+    sel.upsert(_entry("https://example.com/a"))
+    assert sel.keys()[-1] == "https://example.com/a"
+
+
+def test_upsert_merges_duplicates_in_place():
+    sel = SelectionIndex([_entry("https://example.com/x")])
+    sel.upsert(_entry(f"https://www.youtube.com/watch?v={VID}", title="Old"))
+    key, added = sel.upsert(_entry(f"https://youtu.be/{VID}", duration=212))
+    assert (key, added) == (VID, False)
+    assert len(sel) == 2
+    assert sel.keys() == ["https://example.com/x", VID]
+    assert sel.get(VID)["title"] == "Old"
+    assert sel.get(VID)["duration"] == 212
+
+
+def test_extend_skips_selected_and_invalid_entries():
+    sel = SelectionIndex([_entry(f"https://youtu.be/{VID}", title="First")])
+    added = sel.extend(
+        [
+            _entry(f"https://www.youtube.com/watch?v={VID}", title="Again"),
+            _entry("https://example.com/y"),
+            _entry("https://example.com/y"),
+            {"title": "no url"},
+        ]
+    )
+    assert added == ["https://example.com/y"]
+    assert sel.get(VID)["title"] == "First"
+    assert len(sel) == 2
+
+
+def test_membership_and_removal_by_any_spelling():
+    sel = SelectionIndex([_entry(f"https://youtu.be/{VID}")])
+    other = _entry(f"https://m.youtube.com/watch?v={VID}")
+    assert other in sel
+    assert sel.remove_many([other, _entry("https://example.com/z")]) == [VID]
+    assert not sel
+    assert sel.remove(VID) is None
@@ -0,0 +1,119 @@
+import os
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core import thumbnails
+from core.io_pool import IOPool
+from core.thumbnails import ThumbnailService, _DiskCache, fetch_thumbnail_bytes
+from tests.conftest import wait_until
+
+
+def _png() -> bytes:
+    from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+    from PyQt6.QtGui import QColor, QImage
+
+    img = QImage(320, 180, QImage.Format.Format_RGB32)
+    img.fill(QColor("red"))
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    img.save(buf, "PNG")
+    return bytes(data)
+
+
+@pytest.fixture
+def server(qapp):
+    body = _png()
+    hits = Counter()
+    gate = threading.Event()
+    gate.set()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits[self.path] += 1
+            gate.wait(5)
+            if self.path.startswith("/img"):
+                self.send_response(200)
+                self.send_header("Content-Type", "image/png")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            else:
+                self.send_error(404)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield base, hits, gate
+    gate.set()
+    httpd.shutdown()
+
+
+@pytest.fixture
+def disk(tmp_path, monkeypatch):
+    cache = _DiskCache(str(tmp_path / "thumbs"))
+    monkeypatch.setattr(thumbnails, "_disk", cache)
+    return cache
+
+
+def test_dead_url_costs_one_request(server, disk):
+    base, hits, _gate = server
+    assert fetch_thumbnail_bytes(f"{base}/gone.jpg") == b""
+    assert hits["/gone.jpg"] == 1
+
+
+def test_fetched_bytes_are_served_from_disk(server, disk):
+    base, hits, _gate = server
+    first = fetch_thumbnail_bytes(f"{base}/img1.jpg")
+    assert first.startswith(b"\x89PNG")
+    assert fetch_thumbnail_bytes(f"{base}/img1.jpg") == first
+    assert hits["/img1.jpg"] == 1
+
+
+def test_identical_images_share_one_blob(server, disk):
+    base, _hits, _gate = server
+    fetch_thumbnail_bytes(f"{base}/img1.jpg")
+    fetch_thumbnail_bytes(f"{base}/img2.jpg")
+    assert len(os.listdir(os.path.join(disk.root, "refs"))) == 2
+    assert len(os.listdir(os.path.join(disk.root, "blobs"))) == 1
+
+
+def test_service_coalesces_requests_and_scales(qapp, server, disk):
+    base, hits, gate = server
+    service = ThumbnailService(pool=IOPool(workers=2))
+    url = f"{base}/img1.jpg"
+    got = []
+    gate.clear()  # hold the fetch so both requests find it in flight
+    service.request(url, got.append)
+    service.request(url, got.append, priority=True)
+    gate.set()
+    assert wait_until(qapp, lambda: len(got) == 2)
+    assert hits["/img1.jpg"] == 1
+    assert {(px.width(), px.height()) for px in got} == {(96, 54)}
+
+    # Memory hit: delivered synchronously, no new fetch
+    again = []
+    service.request(url, again.append)
+    assert len(again) == 1
+    assert service.cached(url) is not None
+
+
+def test_cancel_pending_drops_callbacks(qapp, server, disk):
+    base, hits, gate = server
+    service = ThumbnailService(pool=IOPool(workers=1))
+    got = []
+    gate.clear()
+    service.request(f"{base}/img1.jpg", got.append)
+    service.request(f"{base}/img2.jpg", got.append)  # queued behind img1
+    assert wait_until(qapp, lambda: hits["/img1.jpg"] == 1)
+    service.cancel_pending()
+    gate.set()
+    wait_until(qapp, lambda: False, timeout=0.5)
+    assert got == []
+    assert hits["/img2.jpg"] == 0  # withdrawn before it ran
@@ -30,6 +30,10 @@ class Stepper(QWidget):
     def set_current(self, idx: int):
         self._current = max(0, min(idx, len(self._labels) - 1)) if self._labels else 0
         for i, lab in enumerate(self._labels):
-            lab.setProperty("current", i == self._current)
+            current = i == self._current
+            # Re-polishing runs the app style sheet; skip unchanged labels
+            if lab.property("current") == current:
+                continue
+            lab.setProperty("current", current)
             lab.style().unpolish(lab)
             lab.style().polish(lab)